@@ -10,7 +10,9 @@ LifeStyles Localization Analyzer V5 - Enterprise Edition
 - 🌍 LANGUAGE MANAGEMENT: Add new languages easily
 - 🔍 KEY PATTERN ANALYSIS: Detect custom patterns
 - 📊 FREQUENCY-BASED AUTO-FIX: Prioritize common duplicates
-- 🚄 PERFORMANCE: Multi-threading and caching
+- 🧬 NEAR-DUPLICATES: MinHash/LSH clustering of similar strings
+- 🧩 DYNAMIC KEYS: Keys built by "tab.\\(name)" templates are never reported dead
+- 🚄 PERFORMANCE: Multi-process analysis and incremental on-disk cache
 - 💾 AUTO-BACKUP: Safe modifications with automatic backups
 - 🎯 DRY-RUN: Preview changes before applying
 
@@ -33,6 +35,26 @@ Usage:
     # Dry run (preview changes)
     python analyze_localization_v5.py --auto-fix --dry-run
 
+    # Compare Swift lexer and plain regex front ends
+    python analyze_localization_v5.py --benchmark
+
+    # Analyze and remove dead keys in one pass
+    python analyze_localization_v5.py --remove-dead-keys
+
+    # Where is a key used / which keys does a file use (no rescan)
+    python analyze_localization_v5.py --where button.save
+    python analyze_localization_v5.py --keys-in SettingsView.swift
+
+    # App and widget targets, each against its own catalog
+    python analyze_localization_v5.py --targets
+
+    # Stream findings as JSON lines while the analysis runs
+    python analyze_localization_v5.py --ndjson findings.ndjson
+
+    # Only files changed since a git ref / staged for commit
+    python analyze_localization_v5.py --since origin/main
+    python analyze_localization_v5.py --staged
+
     # Language management
     python analyze_localization_v5.py --list-languages
     python analyze_localization_v5.py --add-language es
@@ -44,18 +66,35 @@ import os
 import sys
 import json
 import shutil
+import subprocess
 import hashlib
 import argparse
 import time
+import struct
+import bisect
+import fnmatch
+import queue
+import select
+import threading
+import ctypes
+import ctypes.util
+import random
+import zlib
 from pathlib import Path
-from collections import defaultdict, Counter
-from typing import Dict, List, Set, Tuple, Optional
+from collections import defaultdict, deque, Counter
+from typing import Dict, List, Set, Tuple, Optional, Iterator, NamedTuple
 from datetime import datetime
 from difflib import SequenceMatcher
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from functools import lru_cache
+from contextlib import contextmanager
 import html
 
+from backup_store import BackupRun, BackupStore, print_runs, restore_run
+from remove_dead_keys import DeadKeyRemover
+from strings_parser import StringsSyntaxError, escape, parse_strings, read_strings, read_strings_bytes, unescape
+from translation_memory import TranslationMemory
+
 # Optional dependencies
 try:
     from watchdog.observers import Observer
@@ -63,13 +102,6 @@ try:
     WATCHDOG_AVAILABLE = True
 except ImportError:
     WATCHDOG_AVAILABLE = False
-    print("⚠️  watchdog not installed. Watch mode disabled. Install: pip install watchdog")
-
-try:
-    from tqdm import tqdm
-    TQDM_AVAILABLE = True
-except ImportError:
-    TQDM_AVAILABLE = False
 
 
 class Colors:
@@ -85,33 +117,493 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+class SourceFile:
+    """Source file with a precomputed line-offset index"""
+
+    def __init__(self, path: Path, content: str):
+        self.path = path
+        self.content = content
+        # Offsets of the first character of every line (line 1 starts at 0)
+        self.line_offsets = [0]
+        find = content.find
+        pos = find('\n')
+        while pos != -1:
+            self.line_offsets.append(pos + 1)
+            pos = find('\n', pos + 1)
+
+    @classmethod
+    def read(cls, path: Path) -> Optional['SourceFile']:
+        """Read a file from disk, returning None if it can't be decoded"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls(path, f.read())
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    @property
+    def digest(self) -> str:
+        """SHA-1 of the UTF-8 content, as used by the analysis cache"""
+        return hashlib.sha1(self.content.encode('utf-8')).hexdigest()
+
+    @property
+    def line_count(self) -> int:
+        return len(self.line_offsets)
+
+    def line_of(self, offset: int) -> int:
+        """Resolve a character offset to a 1-based line number"""
+        return bisect.bisect_right(self.line_offsets, offset)
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        """Resolve a character offset to a 1-based (line, column) pair"""
+        line = self.line_of(offset)
+        return line, offset - self.line_offsets[line - 1] + 1
+
+    def offset_of(self, line: int, column: int = 1) -> int:
+        """Inverse of position(): character offset of a 1-based line/column"""
+        return self.line_offsets[line - 1] + column - 1
+
+    def line_span(self, line: int) -> Tuple[int, int]:
+        """Character span of a 1-based line, excluding its newline"""
+        start = self.line_offsets[line - 1]
+        if line < len(self.line_offsets):
+            return start, self.line_offsets[line] - 1
+        return start, len(self.content)
+
+    def line_text(self, line: int) -> str:
+        """Text of a 1-based line, without its trailing newline"""
+        start, end = self.line_span(line)
+        return self.content[start:end]
+
+
+class SwiftToken(NamedTuple):
+    """A lexed span of Swift source that is not plain code"""
+    kind: str   # 'comment', 'string' or 'preview'
+    start: int
+    end: int
+
+
+class SwiftLexer:
+    """
+    Streaming Swift tokenizer for the spans the analyzer must not match in
+
+    Yields comments (nested block comments included) and string literal
+    segments (escapes, multi-line and raw `#"..."#` strings). Interpolations
+    are lexed as code, so `"\\(String(localized: "key"))"` still counts as a
+    usage. `#Preview { ... }` blocks are lexed normally and reported as an
+    extra 'preview' token once the block closes.
+    """
+
+    # Each pattern starts with a character class so the re module can skip
+    # ahead to candidate characters; lookbehinds then pick the lexeme.
+    NEXT_RE = re.compile(
+        r'[/#"](?:(?<=/)[/*]|(?<=#)Preview\b|(?<=#)#*"(?:"")?|(?<=")(?:"")?)'
+    )
+    NESTED_RE = re.compile(
+        r'[(){}/#"](?:(?<=/)[/*]|(?<=#)#*"(?:"")?|(?<=")(?:"")?|(?<=[(){}]))'
+    )
+    BLOCK_COMMENT_RE = re.compile(r'/\*|\*/')
+
+    def __init__(self, content: str):
+        self.content = content
+        self._string_res = {}
+
+    def tokens(self) -> Iterator[SwiftToken]:
+        """Yield comment, string and preview tokens"""
+        content = self.content
+        # Frames: ['interp', depth] | ['preview', start, depth, opened]
+        #         | ['string', regex, close, segment_start]
+        stack = []
+        pos = 0
+        while True:
+            frame = stack[-1] if stack else None
+
+            if frame is not None and frame[0] == 'string':
+                _, string_re, close, segment_start = frame
+                match = string_re.search(content, pos)
+                if not match:
+                    yield SwiftToken('string', segment_start, len(content))
+                    return
+                lexeme = match.group(0)
+                if lexeme == close:
+                    stack.pop()
+                    pos = match.end()
+                    yield SwiftToken('string', segment_start, pos)
+                elif lexeme == '\n':
+                    stack.pop()  # Unterminated single-line literal
+                    pos = match.start()
+                    yield SwiftToken('string', segment_start, pos)
+                elif content.startswith('(', match.end()):
+                    pos = match.end() + 1
+                    yield SwiftToken('string', segment_start, pos)
+                    stack.append(['interp', 1])
+                else:
+                    pos = match.end() + 1  # Escaped character
+                continue
+
+            match = (self.NEXT_RE if frame is None else self.NESTED_RE).search(content, pos)
+            if not match:
+                break
+            start = match.start()
+            lexeme = match.group(0)
+            pos = match.end()
+
+            if lexeme == '//':
+                end = content.find('\n', pos)
+                pos = len(content) if end == -1 else end
+                yield SwiftToken('comment', start, pos)
+            elif lexeme == '/*':
+                pos = self._block_comment_end(pos)
+                yield SwiftToken('comment', start, pos)
+            elif lexeme == '#Preview':
+                stack.append(['preview', start, 0, False])
+            elif lexeme in '(){}':
+                if frame[0] == 'interp':
+                    if lexeme == '(':
+                        frame[1] += 1
+                    elif lexeme == ')':
+                        frame[1] -= 1
+                        if frame[1] == 0:
+                            stack.pop()
+                            stack[-1][3] = pos  # The string resumes after ')'
+                elif lexeme in '({':
+                    frame[3] = frame[3] or (lexeme == '{' and frame[2] == 0)
+                    frame[2] += 1
+                elif frame[2] == 0:
+                    stack.pop()  # Malformed: closer before the trailing closure
+                    yield SwiftToken('preview', frame[1], start)
+                else:
+                    frame[2] -= 1
+                    if frame[2] == 0 and frame[3]:
+                        stack.pop()
+                        yield SwiftToken('preview', frame[1], pos)
+            else:
+                string_re, close = self._string_re(lexeme.count('#'), lexeme.endswith('"""'))
+                stack.append(['string', string_re, close, start])
+
+        for frame in reversed(stack):
+            if frame[0] == 'preview':
+                yield SwiftToken('preview', frame[1], len(content))
+
+    def regions(self) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """Return (code regions, #Preview spans), both sorted by offset"""
+        code = []
+        previews = []
+        pos = 0
+        for token in self.tokens():
+            if token.kind == 'preview':
+                previews.append((token.start, token.end))
+                continue
+            if token.start > pos:
+                code.append((pos, token.start))
+            pos = token.end
+        if pos < len(self.content):
+            code.append((pos, len(self.content)))
+        return code, previews
+
+    def _block_comment_end(self, pos: int) -> int:
+        depth = 1
+        for match in self.BLOCK_COMMENT_RE.finditer(self.content, pos):
+            depth += 1 if match.group(0) == '/*' else -1
+            if depth == 0:
+                return match.end()
+        return len(self.content)
+
+    def _string_re(self, hashes: int, multiline: bool):
+        """Regex finding the closing delimiter, an escape or a line break"""
+        key = (hashes, multiline)
+        if key not in self._string_res:
+            close = ('"""' if multiline else '"') + '#' * hashes
+            escape = '\\' + '#' * hashes
+            alternatives = [re.escape(close), re.escape(escape)]
+            if not multiline:
+                alternatives.append('\n')
+            self._string_res[key] = (re.compile('|'.join(alternatives)), close)
+        return self._string_res[key]
+
+
+def _in_spans(spans: List[Tuple[int, int]], offset: int) -> bool:
+    """Check whether offset falls inside one of the sorted, disjoint spans"""
+    index = bisect.bisect_right(spans, (offset, float('inf'))) - 1
+    return index >= 0 and offset < spans[index][1]
+
+
+class CallSiteMatcher:
+    """
+    Single-pass matcher for all hardcoded and localized call-site patterns
+
+    Every pattern starts with a literal call head such as `Text(` or
+    `.navigationTitle(`. The heads are fused into one alternation that
+    scans the file once; each hit is dispatched to the full patterns that
+    share that head, anchored at the hit position. Heads that are a suffix
+    of a longer head (`Label(` inside `.accessibilityLabel(`) are also
+    tried, so the result is the same as running every pattern separately.
+    """
+
+    HEAD_RE = re.compile(r'^((?:\\\.)?\w+)\\\(')
+
+    def __init__(self, hardcoded_patterns: Tuple, localized_patterns: Tuple):
+        # rule: (compiled pattern, kind, component, category)
+        self.rules = []
+        for pattern, component_type, category in hardcoded_patterns:
+            self.rules.append((re.compile(pattern), 'hardcoded', component_type, category))
+        for pattern, component_type in localized_patterns:
+            self.rules.append((re.compile(pattern), 'localized', component_type, None))
+
+        by_head = defaultdict(list)
+        self.unanchored = []  # Patterns without a literal head, scanned on their own
+        for rule in self.rules:
+            match = self.HEAD_RE.match(rule[0].pattern)
+            if match:
+                by_head[match.group(1).replace('\\.', '.')].append(rule)
+            else:
+                self.unanchored.append(rule)
+
+        # head -> [(offset into the head, rules)], including suffix heads
+        self.dispatch = {}
+        for head in by_head:
+            self.dispatch[head] = [
+                (len(head) - len(other), by_head[other])
+                for other in by_head
+                if head.endswith(other)
+            ]
+
+        alternation = '|'.join(
+            re.escape(head) for head in sorted(by_head, key=len, reverse=True)
+        )
+        self.scanner = re.compile(f'({alternation})\\(') if by_head else None
+
+    def scan(self, content: str, regions: Optional[List[Tuple[int, int]]] = None):
+        """
+        Yield (match, kind, component, category) for every pattern hit
+
+        When code regions from SwiftLexer are given, only call heads inside
+        them are considered; arguments may still extend into string tokens.
+        """
+        if regions is None:
+            regions = [(0, len(content))]
+
+        if self.scanner is not None and regions:
+            index = 0
+            region_start, region_end = regions[0]
+            for hit in self.scanner.finditer(content, region_start):
+                start = hit.start()
+                # Both hits and regions are sorted: walk them in step
+                while start >= region_end and index + 1 < len(regions):
+                    index += 1
+                    region_start, region_end = regions[index]
+                if not region_start <= start < region_end:
+                    continue
+                for offset, rules in self.dispatch[hit.group(1)]:
+                    for pattern, kind, component_type, category in rules:
+                        match = pattern.match(content, start + offset)
+                        if match:
+                            yield match, kind, component_type, category
+
+        for pattern, kind, component_type, category in self.unanchored:
+            for match in pattern.finditer(content):
+                if _in_spans(regions, match.start()):
+                    yield match, kind, component_type, category
+
+
+@lru_cache(maxsize=8)
+def get_call_site_matcher(hardcoded_patterns: Tuple, localized_patterns: Tuple) -> CallSiteMatcher:
+    """Compiled matcher shared by every analyzer using the same pattern set"""
+    return CallSiteMatcher(hardcoded_patterns, localized_patterns)
+
+
+class LocalizationCatalog:
+    """
+    Parsed Localizable.strings files shared by the whole process
+
+    Each file is parsed lazily, once per (mtime_ns, size); derived views
+    (key sets, value→keys, key patterns) are memoized on the same stamps,
+    so an edited file invalidates only what depends on it. A compact
+    snapshot in .locanalyzer_cache/ lets later runs skip parsing unchanged
+    files.
+    """
+
+    SNAPSHOT_VERSION = 1
+
+    def __init__(self, snapshot_dir: Optional[Path] = None):
+        self.snapshot_file = snapshot_dir / 'catalog.json' if snapshot_dir else None
+        self.files = {}  # path -> (stamp, {key: value})
+        self.views = {}  # (view name, paths) -> (stamps, value); only the current stamps are kept
+        self.snapshot = {}
+        self.dirty = False
+        self._load_snapshot()
+
+    def _load_snapshot(self):
+        if not self.snapshot_file:
+            return
+        try:
+            with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == self.SNAPSHOT_VERSION:
+            self.snapshot = data.get('files', {})
+
+    @staticmethod
+    def _stamp(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def strings(self, path: Path) -> Dict[str, str]:
+        """{key: value} for one .strings file (empty if missing)"""
+        stamp = self._stamp(path)
+        cached = self.files.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        if stamp is None:
+            values = {}
+        else:
+            entry = self.snapshot.get(str(path))
+            if entry is not None and tuple(entry['stamp']) == stamp:
+                values = dict(entry['entries'])
+            else:
+                values = {e.key: e.value for e in read_strings(path)}
+                self.snapshot[str(path)] = {'stamp': list(stamp), 'entries': list(values.items())}
+                self.dirty = True
+
+        self.files[path] = (stamp, values)
+        return values
+
+    def _view(self, name: str, paths: Tuple[Path, ...], build):
+        for path in paths:
+            self.strings(path)
+        stamps = tuple(self.files[path][0] for path in paths)
+        cached = self.views.get((name, paths))
+        if cached is None or cached[0] != stamps:
+            # Replacing the entry drops the view built from the old content
+            cached = self.views[(name, paths)] = (stamps, build())
+        return cached[1]
+
+    def keys(self, *paths: Path) -> frozenset:
+        """Keys defined in any of the given files"""
+        return self._view('keys', paths, lambda: frozenset(
+            key for path in paths for key in self.files[path][1]
+        ))
+
+    def value_index(self, path: Path) -> Dict[str, List[str]]:
+        """value -> keys using it, for one file"""
+        def build():
+            index = defaultdict(list)
+            for key, value in self.files[path][1].items():
+                index[value].append(key)
+            return dict(index)
+        return self._view('value_index', (path,), build)
+
+    def key_patterns(self, *paths: Path) -> Dict:
+        """KeyPatternAnalyzer output over the keys of the given files"""
+        return self._view('key_patterns', paths, lambda: KeyPatternAnalyzer().analyze(self.keys(*paths)))
+
+    def save(self):
+        """Write the snapshot if anything was parsed since it was loaded"""
+        if not (self.snapshot_file and self.dirty):
+            return
+        self.snapshot_file.parent.mkdir(exist_ok=True)
+        tmp_file = self.snapshot_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.SNAPSHOT_VERSION, 'files': self.snapshot}, f, ensure_ascii=False)
+        os.replace(tmp_file, self.snapshot_file)
+        self.dirty = False
+
+
+@lru_cache(maxsize=4)
+def get_catalog(snapshot_dir: Optional[Path] = None) -> LocalizationCatalog:
+    """Process-wide catalog (one per snapshot location)"""
+    return LocalizationCatalog(snapshot_dir)
+
+
 class StringsFileManager:
-    """Manages reading and writing to .strings files"""
+    """
+    Manages reading and writing to .strings files
 
-    def __init__(self, tr_file: Path, en_file: Path):
-        self.tr_file = tr_file
-        self.en_file = en_file
-        self.keys = {}  # key -> {tr, en}
+    New keys are staged in a transaction and written once per language:
+    every file is rendered to a temp file first, then swapped in with
+    os.replace, so either all languages get the batch or none do.
+    """
 
-    def load(self):
-        """Load existing keys from .strings files"""
-        for file_path, lang in [(self.tr_file, 'tr'), (self.en_file, 'en')]:
-            if not file_path.exists():
+    def __init__(
+        self,
+        localization_files: List[Path],
+        catalog: Optional[LocalizationCatalog] = None,
+        memory: Optional[TranslationMemory] = None
+    ):
+        # Language code (from the .lproj folder) -> Localizable.strings
+        self.files = {
+            path.parent.name.replace('.lproj', ''): path for path in localization_files
+        }
+        self.catalog = catalog or get_catalog()
+        self.memory = memory  # Prior translations used to prefill new keys
+        self.memory_fills = 0
+        self.keys = {}  # key -> {lang: value}
+        self.pending = None  # key -> {lang: value} while a transaction is open
+
+    def load(self) -> bool:
+        """Load existing keys from .strings files; False if any file can't be parsed"""
+        ok = True
+        for lang, file_path in self.files.items():
+            try:
+                values = self.catalog.strings(file_path)
+            except StringsSyntaxError as e:
+                print(f"{Colors.FAIL}❌ {file_path}: {e}{Colors.ENDC}")
+                ok = False
                 continue
+            for key, value in values.items():
+                if key not in self.keys:
+                    self.keys[key] = {code: None for code in self.files}
+                self.keys[key][lang] = value
+        return ok
+
+    @contextmanager
+    def transaction(self):
+        """
+        Batch add_key calls into one write per language
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                pattern = r'^"([^"]+)"\s*=\s*"([^"]+)";'
-                matches = re.finditer(pattern, content, re.MULTILINE)
+        An interrupted (Ctrl+C) run still commits what it staged (an unused
+        key is harmless, a source pointing at a missing one is not); any
+        other error discards the batch. flush() writes early when the
+        caller must know the keys are on disk before going on.
+        """
+        if self.pending is not None:
+            yield self
+            return
 
-                for match in matches:
-                    key, value = match.groups()
-                    if key not in self.keys:
-                        self.keys[key] = {'tr': None, 'en': None}
-                    self.keys[key][lang] = value
+        self.pending = {}
+        try:
+            yield self
+        except KeyboardInterrupt:
+            self._commit()
+            raise
+        except BaseException:
+            for key in self.pending:
+                del self.keys[key]
+            self.pending = None
+            raise
+        self._commit()
+
+    def flush(self):
+        """Write the keys staged so far now, keeping the transaction open"""
+        if self.pending is None:
+            return
+        try:
+            self._commit()
+        finally:
+            self.pending = {}
 
     def add_key(self, key: str, tr_value: str, en_value: str, dry_run: bool = False):
-        """Add a new key to .strings files"""
+        """
+        Add a new key to every language
+
+        Turkish gets tr_value; English and any other language get en_value
+        as a placeholder to translate, unless the translation memory has a
+        prior translation of tr_value (an explicit en_value is kept).
+        """
         if key in self.keys:
             print(f"  ⚠️  Key already exists: {key}")
             return False
@@ -120,17 +612,83 @@ class StringsFileManager:
             print(f"  [DRY RUN] Would add: \"{key}\" = \"{tr_value}\";")
             return True
 
-        # Add to TR file
-        with open(self.tr_file, 'a', encoding='utf-8') as f:
-            f.write(f'\n"{key}" = "{tr_value}";\n')
+        values = {lang: tr_value if lang == 'tr' else en_value for lang in self.files}
+        if self.memory is not None:
+            self._prefill(key, tr_value, en_value, values)
+        self.keys[key] = values
 
-        # Add to EN file
-        with open(self.en_file, 'a', encoding='utf-8') as f:
-            f.write(f'\n"{key}" = "{en_value}";\n')
+        if self.pending is not None:
+            self.pending[key] = values
+            return True
 
-        self.keys[key] = {'tr': tr_value, 'en': en_value}
+        self.pending = {key: values}
+        try:
+            self._commit()
+        except OSError as e:
+            del self.keys[key]
+            print(f"  ❌ Failed to write .strings files: {e}")
+            return False
         return True
 
+    def _prefill(self, key: str, tr_value: str, en_value: str, values: Dict[str, str]):
+        """Replace placeholder values with translation memory matches"""
+        source = unescape(tr_value)
+        filled = []
+        for lang in values:
+            if lang == 'tr' or (lang == 'en' and en_value != tr_value):
+                continue
+            match = self.memory.lookup(source, 'tr', lang)
+            if match is not None:
+                values[lang] = escape(match.text)
+                filled.append(f'{lang}="{match.text}" ({match.score:.2f})')
+        if filled:
+            self.memory_fills += len(filled)
+            print(f"  🧠 {key}: {', '.join(filled)}")
+
+    def _commit(self):
+        """Write staged keys to all languages at once"""
+        pending, self.pending = self.pending, None
+        if not pending:
+            return
+
+        # Render every language before touching any of them
+        staged = []
+        try:
+            for lang, file_path in self.files.items():
+                with open(file_path, 'rb') as f:
+                    original = f.read()
+                additions = ''.join(
+                    f'\n"{key}" = "{values[lang]}";\n' for key, values in pending.items()
+                )
+                tmp_file = file_path.with_name(file_path.name + '.tmp')
+                with open(tmp_file, 'wb') as f:
+                    f.write(original + additions.encode('utf-8'))
+                staged.append((file_path, tmp_file, original))
+        except OSError:
+            for _, tmp_file, _ in staged:
+                tmp_file.unlink(missing_ok=True)
+            for key in pending:
+                self.keys.pop(key, None)
+            raise
+
+        # Swap in; on failure put back the files that were already replaced
+        replaced = []
+        try:
+            for file_path, tmp_file, original in staged:
+                os.replace(tmp_file, file_path)
+                replaced.append((file_path, original))
+        except OSError:
+            for file_path, original in replaced:
+                with open(file_path, 'wb') as f:
+                    f.write(original)
+            for _, tmp_file, _ in staged:
+                tmp_file.unlink(missing_ok=True)
+            for key in pending:
+                self.keys.pop(key, None)
+            raise
+
+        print(f"  💾 {len(pending)} key {len(self.files)} dile yazıldı")
+
     def key_exists(self, key: str) -> bool:
         """Check if a key exists"""
         return key in self.keys
@@ -175,10 +733,8 @@ class LanguageManager:
 
             if strings_file.exists():
                 try:
-                    with open(strings_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        key_count = len(re.findall(r'^"([^"]+)"\s*=', content, re.MULTILINE))
-                except:
+                    key_count = sum(1 for _ in read_strings(strings_file))
+                except (OSError, StringsSyntaxError):
                     pass
 
             lang_name = self.LANGUAGE_NAMES.get(lang_code, 'Unknown')
@@ -197,7 +753,8 @@ class LanguageManager:
         lang_code: str,
         source_lang: str = 'tr',
         empty: bool = False,
-        dry_run: bool = False
+        dry_run: bool = False,
+        use_memory: bool = True
     ) -> bool:
         """
         Add a new language to the project
@@ -207,6 +764,7 @@ class LanguageManager:
             source_lang: Source language to copy keys from (default: 'tr')
             empty: Create empty strings file (default: False)
             dry_run: Preview without creating files (default: False)
+            use_memory: Prefill values from existing translations (default: True)
 
         Returns:
             bool: Success status
@@ -262,9 +820,15 @@ class LanguageManager:
                 print(f"{Colors.FAIL}❌ Source strings file not found: {source_file}{Colors.ENDC}")
                 return False
 
+            memory = TranslationMemory.from_resources(self.resources_dir) if use_memory else None
+
             print(f"📋 Key'ler kopyalanıyor (kaynak: {source_lang})")
-            content, key_count = self._copy_keys_from_source(source_file, lang_code, lang_name)
+            content, key_count, filled = self._copy_keys_from_source(
+                source_file, lang_code, lang_name, source_lang, memory
+            )
             print(f"   {Colors.OKGREEN}✓ {key_count} key kopyalandı{Colors.ENDC}")
+            if memory is not None:
+                print(f"   🧠 {filled} değer çeviri belleğinden dolduruldu ({len(memory)} birim)")
 
         # Write file
         if not dry_run:
@@ -316,20 +880,23 @@ class LanguageManager:
         self,
         source_file: Path,
         target_lang: str,
-        target_lang_name: str
-    ) -> Tuple[str, int]:
+        target_lang_name: str,
+        source_lang: str = 'tr',
+        memory: Optional[TranslationMemory] = None
+    ) -> Tuple[str, int, int]:
         """
         Copy keys from source language file
 
+        Values the translation memory already has in the target language
+        are filled in; the rest keep the source text.
+
         Returns:
-            Tuple[str, int]: (file content, key count)
+            Tuple[str, int, int]: (file content, key count, prefilled count)
         """
-        with open(source_file, 'r', encoding='utf-8') as f:
-            source_content = f.read()
+        source_content = read_strings_bytes(source_file)
 
         # Parse keys
-        pattern = r'^("([^"]+)"\s*=\s*"([^"]+)";)'
-        matches = list(re.finditer(pattern, source_content, re.MULTILINE))
+        entries = list(parse_strings(source_content))
 
         # Build new content
         lines = [
@@ -342,51 +909,112 @@ class LanguageManager:
             f'  Copied from: {source_file.parent.name}',
             f'',
             f'  NOTE: Please translate all values to {target_lang_name}',
-            f'  Total keys: {len(matches)}',
+            f'  Total keys: {len(entries)}',
             f'*/',
             f''
         ]
 
-        # Add all keys
-        for match in matches:
-            full_line = match.group(1)
-            lines.append(full_line)
+        # Add all keys, copied verbatim (escapes included)
+        filled = 0
+        for entry in entries:
+            start, end = entry.span
+            match = memory.lookup(entry.value, source_lang, target_lang) if memory else None
+            if match is None:
+                lines.append(source_content[start:end].decode('utf-8'))
+                continue
+            value_start, value_end = entry.value_span
+            lines.append(
+                source_content[start:value_start].decode('utf-8')
+                + escape(match.text)
+                + source_content[value_end:end].decode('utf-8')
+            )
+            filled += 1
 
         lines.append('')  # Trailing newline
 
-        return '\n'.join(lines), len(matches)
+        return '\n'.join(lines), len(entries), filled
 
     def _validate_strings_file(self, file_path: Path) -> bool:
         """Validate .strings file format"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Check for basic format errors
-            # Each key should match: "key" = "value";
-            lines = [line.strip() for line in content.split('\n')
-                     if line.strip() and not line.strip().startswith('/*') and not line.strip().startswith('*')]
-
-            for line in lines:
-                if not line.startswith('//') and '=' in line:
-                    if not re.match(r'^"[^"]+"\s*=\s*"[^"]*";', line):
-                        print(f"      Invalid line format: {line[:50]}...")
-                        return False
-
+            for _ in read_strings(file_path):
+                pass
             return True
+        except StringsSyntaxError as e:
+            print(f"      Invalid format: {e}")
+            return False
         except Exception as e:
             print(f"      Validation error: {e}")
             return False
 
 
+class PlannedFix(NamedTuple):
+    """One approved replacement of a hardcoded literal"""
+    line: int
+    column: Optional[int]
+    text: str
+    component: str
+    key: str
+    tr_translation: str
+    en_translation: str
+
+
+class FileFixResult(NamedTuple):
+    """Outcome of preparing the rewrite of one Swift file"""
+    file_path: Path
+    applied: Tuple[PlannedFix, ...]
+    failed: int
+    conflicts: Tuple[Dict, ...]
+    messages: Tuple[str, ...]
+    worker: str
+    seconds: float
+    content: Optional[str] = None  # New source, written once the keys are committed
+
+
 class AutoFixer:
-    """Automatically fixes hardcoded strings in Swift files"""
+    """
+    Automatically fixes hardcoded strings in Swift files
 
-    def __init__(self, strings_manager: StringsFileManager, dry_run: bool = False):
+    Fixes are planned first and applied per file: each Swift file is read
+    once, all of its edits are resolved to offsets, overlapping edits are
+    reported as conflicts and the rest are written back in one pass
+    (atomically, files in parallel).
+    """
+
+    def __init__(
+        self,
+        strings_manager: StringsFileManager,
+        dry_run: bool = False,
+        workers: Optional[int] = None,
+        backup: Optional[BackupRun] = None
+    ):
         self.strings_manager = strings_manager
         self.dry_run = dry_run
+        self.backup = backup  # Swift files are captured here before they are rewritten
+        self.workers = workers or min(8, os.cpu_count() or 1)
         self.fixes_applied = 0
         self.fixes_failed = 0
+        self.plan = defaultdict(list)  # file path -> [PlannedFix]
+        self.conflicts = []
+        self.worker_stats = defaultdict(Counter)
+
+    def plan_fix(
+        self,
+        file_path: Path,
+        line_num: int,
+        original_text: str,
+        component_type: str,
+        suggested_key: str,
+        tr_translation: Optional[str] = None,
+        en_translation: Optional[str] = None,
+        column: Optional[int] = None
+    ):
+        """Queue a fix; nothing is read or written until apply_plan()"""
+        self.plan[file_path].append(PlannedFix(
+            line_num, column, original_text, component_type, suggested_key,
+            original_text if tr_translation is None else tr_translation,
+            original_text if en_translation is None else en_translation,
+        ))
 
     def fix_hardcoded_string(
         self,
@@ -396,77 +1024,211 @@ class AutoFixer:
         component_type: str,
         suggested_key: str,
         tr_translation: Optional[str] = None,
-        en_translation: Optional[str] = None
+        en_translation: Optional[str] = None,
+        column: Optional[int] = None
     ) -> bool:
-        """Fix a single hardcoded string"""
-
-        # Default translations
-        if tr_translation is None:
-            tr_translation = original_text
-        if en_translation is None:
-            en_translation = original_text
+        """Fix a single hardcoded string right away (also applies anything already planned)"""
+        applied = self.fixes_applied
+        self.plan_fix(
+            file_path, line_num, original_text, component_type, suggested_key,
+            tr_translation, en_translation, column
+        )
+        self.apply_plan()
+        return self.fixes_applied > applied
 
-        # Read file
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-        except Exception as e:
-            print(f"  ❌ Failed to read {file_path}: {e}")
-            self.fixes_failed += 1
-            return False
+    def apply_plan(self):
+        """
+        Apply all planned fixes, one read/modify/write per file
 
-        if line_num < 1 or line_num > len(lines):
-            print(f"  ❌ Invalid line number: {line_num}")
-            self.fixes_failed += 1
-            return False
+        Every file is resolved and rendered first (concurrently, nothing is
+        written); the new keys are then committed to the .strings files, and
+        only after that succeeds are the Swift files replaced. A failed key
+        commit leaves the sources untouched, so no source ever points at a
+        key that exists in no Localizable.strings.
+        """
+        plan, self.plan = self.plan, defaultdict(list)
+        files = sorted(plan)
+        if not files:
+            return
 
-        # Get the line to modify
-        line = lines[line_num - 1]
+        parallel = self.workers > 1 and len(files) > 1
+        start = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='fix') if parallel else None
+        try:
+            run = executor.map if executor else map
+            prepared = []
+            for result in run(lambda path: self._prepare_file(path, plan[path]), files):
+                for message in result.messages:
+                    print(message)
+                self.fixes_failed += result.failed
+                self.conflicts.extend(result.conflicts)
+                prepared.append(result)
+
+                stats = self.worker_stats[result.worker]
+                stats['files'] += 1
+                stats['failed'] += result.failed + len(result.conflicts)
+                stats['seconds'] += result.seconds
+
+            to_write = [result for result in prepared if result.content is not None]
+            if self.dry_run:
+                written = [(result, (result.applied, ())) for result in prepared]
+            elif to_write:
+                # Keys first: if they can't be written, no source is touched
+                try:
+                    with self.strings_manager.transaction():
+                        for result in to_write:
+                            for fix in result.applied:
+                                if not self.strings_manager.key_exists(fix.key):
+                                    self.strings_manager.add_key(fix.key, fix.tr_translation, fix.en_translation)
+                        self.strings_manager.flush()
+                except OSError as e:
+                    failed = sum(len(result.applied) for result in to_write)
+                    self.fixes_failed += failed
+                    print(f"  ❌ Failed to write .strings files, {failed} fix not applied "
+                          f"(Swift files untouched): {e}")
+                    return
 
-        # Check if line contains the original text
-        if f'"{original_text}"' not in line:
-            print(f"  ⚠️  Line doesn't contain expected text: {original_text}")
-            self.fixes_failed += 1
-            return False
+                written = list(zip(to_write, run(self._write_file, to_write)))
+            else:
+                written = []
+        finally:
+            if executor:
+                executor.shutdown()
+            if self.backup:
+                self.backup.save()
+        elapsed = time.perf_counter() - start
+
+        applied = []
+        for result, (fixes, messages) in written:
+            for message in messages:
+                print(message)
+            self.fixes_failed += len(result.applied) - len(fixes)
+            self.worker_stats[result.worker]['applied'] += len(fixes)
+            applied.extend(fixes)
+        self.fixes_applied += len(applied)
+
+        if parallel:
+            print(f"\n  🧵 {len(files)} dosya, {len(applied)} fix, {elapsed:.2f}s "
+                  f"({len(applied) / elapsed if elapsed else 0:.0f} fix/s)")
+            for worker in sorted(self.worker_stats):
+                stats = self.worker_stats[worker]
+                print(f"     {worker}: {stats['files']} dosya, {stats['applied']} fix, "
+                      f"{stats['failed']} hata, {stats['seconds']:.3f}s")
+
+    def _resolve(self, source: SourceFile, fix: PlannedFix) -> Tuple[Optional[Tuple[int, int, str]], str]:
+        """Locate a fix in the file: ((start, end, replacement), error message)"""
+        if fix.line < 1 or fix.line > source.line_count:
+            return None, f"  ❌ Invalid line number: {source.path.name}:{fix.line}"
+
+        line = source.line_text(fix.line)
+        line_start, _ = source.line_span(fix.line)
+
+        # Locate the literal; prefer the exact column reported by the analyzer
+        literal = f'"{fix.text}"'
+        literal_col = -1
+        if fix.column is not None:
+            literal_col = line.find(literal, fix.column - 1)
+        if literal_col == -1:
+            literal_col = line.find(literal)
+        if literal_col == -1:
+            return None, f"  ⚠️  Line doesn't contain expected text: {fix.text}"
 
         # Generate replacement based on component type
-        replacement = self._generate_replacement(component_type, original_text, suggested_key)
-
+        replacement = self._generate_replacement(fix.component, fix.text, fix.key)
         if replacement is None:
-            print(f"  ⚠️  Cannot generate replacement for {component_type}")
-            self.fixes_failed += 1
-            return False
+            return None, f"  ⚠️  Cannot generate replacement for {fix.component}"
 
-        # Replace in line
-        new_line = line.replace(f'"{original_text}"', replacement)
+        start = line_start + literal_col
+        return (start, start + len(literal), replacement), ''
 
-        if self.dry_run:
-            print(f"\n  [DRY RUN] {file_path}:{line_num}")
-            print(f"    - {line.strip()}")
-            print(f"    + {new_line.strip()}")
-            self.fixes_applied += 1
-            return True
+    def _prepare_file(self, file_path: Path, fixes: List[PlannedFix]) -> 'FileFixResult':
+        """
+        Resolve, conflict-check and render every fix for one file
 
-        # Add key to .strings files
-        if not self.strings_manager.key_exists(suggested_key):
-            if not self.strings_manager.add_key(suggested_key, tr_translation, en_translation, self.dry_run):
-                self.fixes_failed += 1
-                return False
+        Runs on pool threads: touches nothing shared, output is returned
+        as messages for the caller to print in order.
+        """
+        start_time = time.perf_counter()
+        worker = threading.current_thread().name
+        messages = []
+        conflicts = []
+
+        def result(applied=(), failed=0, content=None):
+            return FileFixResult(
+                file_path, tuple(applied), failed, tuple(conflicts), tuple(messages),
+                worker, time.perf_counter() - start_time, content
+            )
 
-        # Apply fix
-        lines[line_num - 1] = new_line
+        source = SourceFile.read(file_path)
+        if source is None:
+            messages.append(f"  ❌ Failed to read {file_path}")
+            return result(failed=len(fixes))
+
+        edits = []
+        failed = 0
+        for fix in fixes:
+            resolved, error = self._resolve(source, fix)
+            if resolved is None:
+                messages.append(error)
+                failed += 1
+            else:
+                edits.append((*resolved, fix))
+
+        # Two fixes touching the same span can't both apply: keep the first
+        edits.sort(key=lambda edit: (edit[0], edit[1]))
+        accepted = []
+        for edit in edits:
+            if accepted and edit[0] < accepted[-1][1]:
+                kept = accepted[-1][3]
+                fix = edit[3]
+                messages.append(f"  ⚠️  Conflict: {file_path.name}:{fix.line} \"{fix.text}\" ({fix.key}) "
+                                f"overlaps {kept.key}")
+                conflicts.append({
+                    'file': str(file_path), 'line': fix.line, 'text': fix.text,
+                    'key': fix.key, 'conflicts_with': kept.key,
+                })
+                continue
+            accepted.append(edit)
 
-        # Write file
+        if self.dry_run:
+            for start, end, replacement, fix in accepted:
+                line = source.line_text(fix.line)
+                line_start, _ = source.line_span(fix.line)
+                col = start - line_start
+                new_line = line[:col] + replacement + line[col + end - start:]
+                messages.append(f"\n  [DRY RUN] {file_path}:{fix.line}")
+                messages.append(f"    - {line.strip()}")
+                messages.append(f"    + {new_line.strip()}")
+            return result([edit[3] for edit in accepted], failed)
+        if not accepted:
+            return result(failed=failed)
+
+        # Splice all edits in one pass; offsets refer to the original content
+        pieces = []
+        pos = len(source.content)
+        for start, end, replacement, _ in reversed(accepted):
+            pieces.append(source.content[end:pos])
+            pieces.append(replacement)
+            pos = start
+        pieces.append(source.content[:pos])
+        return result([edit[3] for edit in accepted], failed, ''.join(reversed(pieces)))
+
+    def _write_file(self, prepared: 'FileFixResult') -> Tuple[Tuple[PlannedFix, ...], List[str]]:
+        """Replace one Swift file with its prepared content: (applied fixes, messages)"""
+        file_path = prepared.file_path
+        # Write through a temp file so a crash never leaves a half-written source
+        tmp_file = file_path.with_name(f'.{file_path.name}.fix.tmp')
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.writelines(lines)
-            print(f"  ✅ Fixed: {file_path.name}:{line_num}")
-            self.fixes_applied += 1
-            return True
-        except Exception as e:
-            print(f"  ❌ Failed to write {file_path}: {e}")
-            self.fixes_failed += 1
-            return False
+            if self.backup:
+                self.backup.add(file_path)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(prepared.content)
+            shutil.copymode(file_path, tmp_file)
+            os.replace(tmp_file, file_path)
+        except OSError as e:
+            tmp_file.unlink(missing_ok=True)
+            return (), [f"  ❌ Failed to write {file_path}: {e}"]
+        return prepared.applied, [f"  ✅ Fixed: {file_path.name}:{fix.line}" for fix in prepared.applied]
 
     def _generate_replacement(self, component_type: str, original_text: str, key: str) -> Optional[str]:
         """Generate the replacement code based on component type"""
@@ -491,7 +1253,9 @@ class AutoFixer:
         return {
             'applied': self.fixes_applied,
             'failed': self.fixes_failed,
-            'total': self.fixes_applied + self.fixes_failed
+            'conflicts': len(self.conflicts),
+            'total': self.fixes_applied + self.fixes_failed + len(self.conflicts),
+            'workers': {worker: dict(stats) for worker, stats in self.worker_stats.items()},
         }
 
 
@@ -520,7 +1284,7 @@ class InteractiveCLI:
 
         # Sort by priority
         sorted_strings = sorted(
-            self.analyzer.hardcoded_strings,
+            self.analyzer.scoped_hardcoded(),
             key=lambda x: x['priority'],
             reverse=True
         )
@@ -531,21 +1295,25 @@ class InteractiveCLI:
             print(f"Text: {Colors.BOLD}\"{item['text']}\"{Colors.ENDC}")
             print(f"Component: {item['component']}")
             print(f"Suggested Key: {Colors.OKGREEN}{item['suggested_key']}{Colors.ENDC}")
+            memory = self.auto_fixer.strings_manager.memory
+            match = memory.lookup(unescape(item['text']), 'tr', 'en') if memory else None
+            if match:
+                print(f"Translation Memory: \"{match.text}\" ({match.score:.2f}, {match.key})")
 
             while True:
                 choice = input(f"\n{Colors.WARNING}Action [y/n/e/q]?{Colors.ENDC} ").strip().lower()
 
                 if choice == 'y':
-                    # Apply fix
-                    success = self.auto_fixer.fix_hardcoded_string(
+                    # Queue fix; applied per file when the session ends
+                    self.auto_fixer.plan_fix(
                         Path(self.analyzer.project_dir) / item['file'],
                         item['line'],
                         item['text'],
                         item['component'],
-                        item['suggested_key']
+                        item['suggested_key'],
+                        column=item.get('column')
                     )
-                    if success:
-                        self.approved += 1
+                    self.approved += 1
                     break
 
                 elif choice == 'n':
@@ -558,25 +1326,27 @@ class InteractiveCLI:
                     if not custom_key:
                         custom_key = item['suggested_key']
 
-                    success = self.auto_fixer.fix_hardcoded_string(
+                    self.auto_fixer.plan_fix(
                         Path(self.analyzer.project_dir) / item['file'],
                         item['line'],
                         item['text'],
                         item['component'],
-                        custom_key
+                        custom_key,
+                        column=item.get('column')
                     )
-                    if success:
-                        self.edited += 1
+                    self.edited += 1
                     break
 
                 elif choice == 'q':
                     print(f"\n{Colors.WARNING}Exiting interactive mode...{Colors.ENDC}")
+                    self.auto_fixer.apply_plan()
                     self._print_summary()
                     return
 
                 else:
                     print(f"{Colors.FAIL}Invalid choice. Please enter y/n/e/q{Colors.ENDC}")
 
+        self.auto_fixer.apply_plan()
         self._print_summary()
 
     def _print_summary(self):
@@ -588,82 +1358,412 @@ class InteractiveCLI:
         print(f"✏️  Edited: {self.edited}")
         print(f"⏭️  Skipped: {self.skipped}")
         print(f"📝 Total Reviewed: {self.approved + self.edited + self.skipped}")
+        stats = self.auto_fixer.get_stats()
+        print(f"💾 Applied: {stats['applied']}  Failed: {stats['failed']}  Conflicts: {stats['conflicts']}")
         print("=" * 70)
 
 
+class PollingWatcher:
+    """Portable watch backend: diffs os.scandir stat snapshots"""
+
+    name = 'poll'
+
+    def __init__(self, root: Path, exclude_dirs: Set[str], interval: float = 1.0):
+        self.root = root
+        self.exclude_dirs = exclude_dirs
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def available(cls) -> bool:
+        return True
+
+    def _snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """Map of watched file path -> (mtime_ns, size), pruning excluded dirs"""
+        snapshot = {}
+        stack = [str(self.root)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.exclude_dirs:
+                                stack.append(entry.path)
+                        elif entry.name.endswith(('.swift', '.strings')):
+                            stat = entry.stat(follow_symlinks=False)
+                            snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+                    except OSError:
+                        continue
+        return snapshot
+
+    def start(self, callback):
+        previous = self._snapshot()
+
+        def loop():
+            nonlocal previous
+            while not self._stop.wait(self.interval):
+                current = self._snapshot()
+                for path, signature in current.items():
+                    if previous.get(path) != signature:
+                        callback(path)
+                for path in previous.keys() - current.keys():
+                    callback(path)
+                previous = current
+
+        self._thread = threading.Thread(target=loop, name='poll-watcher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def join(self):
+        if self._thread:
+            self._thread.join()
+
+
+class InotifyWatcher:
+    """Linux watch backend using inotify through ctypes, no dependencies"""
+
+    name = 'inotify'
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+                  | IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+    EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+    _libc = None
+
+    def __init__(self, root: Path, exclude_dirs: Set[str]):
+        self.root = root
+        self.exclude_dirs = exclude_dirs
+        self.watches = {}  # wd -> directory path
+        self.files = set()  # Watched .swift/.strings paths, to report when their folder goes away
+        self.fd = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def _load_libc(cls):
+        if cls._libc is None:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+            cls._libc = libc
+        return cls._libc
+
+    @classmethod
+    def available(cls) -> bool:
+        if not sys.platform.startswith('linux'):
+            return False
+        try:
+            return hasattr(cls._load_libc(), 'inotify_init1')
+        except OSError:
+            return False
+
+    def _add_tree(self, directory: str, callback=None):
+        """Watch a directory tree; report existing files when it appeared late"""
+        stack = [directory]
+        while stack:
+            path = stack.pop()
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), self.WATCH_MASK)
+            if wd < 0:
+                continue
+            self.watches[wd] = path
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.exclude_dirs:
+                                stack.append(entry.path)
+                            continue
+                        if entry.name.endswith(('.swift', '.strings')):
+                            self.files.add(entry.path)
+                        if callback:
+                            callback(entry.path)
+            except OSError:
+                continue
+
+    def _remove_tree(self, directory: str, callback):
+        """Report every file under a deleted or moved-away directory and drop its watches"""
+        prefix = directory + os.sep
+        for path in sorted(path for path in self.files if path.startswith(prefix)):
+            self.files.discard(path)
+            callback(path)
+        for wd, path in list(self.watches.items()):
+            if path == directory or path.startswith(prefix):
+                del self.watches[wd]
+                self._libc.inotify_rm_watch(self.fd, wd)
+
+    def start(self, callback):
+        self._load_libc()
+        self.fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._add_tree(str(self.root))
+
+        def loop():
+            while not self._stop.is_set():
+                # Block in select() so an idle watcher costs no CPU
+                ready, _, _ = select.select([self.fd], [], [], 1.0)
+                if not ready:
+                    continue
+                try:
+                    data = os.read(self.fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                self._dispatch(data, callback)
+            os.close(self.fd)
+
+        self._thread = threading.Thread(target=loop, name='inotify-watcher', daemon=True)
+        self._thread.start()
+
+    def _dispatch(self, data: bytes, callback):
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(data):
+            wd, mask, _, name_len = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = data[offset:offset + name_len].rstrip(b'\0')
+            offset += name_len
+
+            if mask & self.IN_Q_OVERFLOW:
+                # Events were lost: report every watched file
+                for path in PollingWatcher(self.root, self.exclude_dirs)._snapshot():
+                    callback(path)
+                continue
+            if mask & self.IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+
+            directory = self.watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, os.fsdecode(name))
+
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_MOVED_FROM | self.IN_DELETE):
+                    self._remove_tree(path, callback)
+                elif mask & (self.IN_CREATE | self.IN_MOVED_TO) and os.path.basename(path) not in self.exclude_dirs:
+                    self._add_tree(path, callback)
+                continue
+            if path.endswith(('.swift', '.strings')):
+                if mask & (self.IN_MOVED_FROM | self.IN_DELETE):
+                    self.files.discard(path)
+                else:
+                    self.files.add(path)
+            callback(path)
+
+    def stop(self):
+        self._stop.set()
+
+    def join(self):
+        if self._thread:
+            self._thread.join()
+
+
+class WatchdogWatcher:
+    """Watch backend using the optional watchdog package"""
+
+    name = 'watchdog'
+
+    def __init__(self, root: Path, exclude_dirs: Set[str]):
+        self.root = root
+        self.observer = None
+
+    @classmethod
+    def available(cls) -> bool:
+        return WATCHDOG_AVAILABLE
+
+    def start(self, callback):
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                callback(event.src_path)
+                dest_path = getattr(event, 'dest_path', None)
+                if dest_path:
+                    callback(dest_path)
+
+        self.observer = Observer()
+        self.observer.schedule(Handler(), str(self.root), recursive=True)
+        self.observer.start()
+
+    def stop(self):
+        self.observer.stop()
+
+    def join(self):
+        self.observer.join()
+
+
+# Fastest first; polling always works
+WATCH_BACKENDS = {
+    'inotify': InotifyWatcher,
+    'watchdog': WatchdogWatcher,
+    'poll': PollingWatcher,
+}
+
+
+def create_watch_backend(name: str, root: Path, exclude_dirs: Set[str]):
+    """Instantiate the requested watch backend, or the fastest available for 'auto'"""
+    if name != 'auto':
+        backend_cls = WATCH_BACKENDS[name]
+        if not backend_cls.available():
+            raise RuntimeError(f"Watch backend '{name}' is not available on this system")
+        return backend_cls(root, exclude_dirs)
+
+    for backend_cls in WATCH_BACKENDS.values():
+        if backend_cls.available():
+            return backend_cls(root, exclude_dirs)
+
+
 class WatchMode:
-    """Watch files for changes and trigger analysis"""
+    """
+    Watch files for changes and keep the analysis up to date incrementally
 
-    def __init__(self, project_dir: Path, analyzer_factory):
+    File system events are queued and coalesced: a batch is processed once
+    no new event has arrived for `debounce_seconds`, so no save is lost.
+    Only the changed Swift files are rescanned (their old results are
+    subtracted from the aggregates first) and only the changed language
+    file is reloaded.
+    """
+
+    def __init__(
+        self,
+        project_dir: Path,
+        analyzer_factory,
+        debounce_seconds: float = 0.3,
+        backend: str = 'auto'
+    ):
         self.project_dir = project_dir
         self.analyzer_factory = analyzer_factory
-        self.last_run = 0
-        self.debounce_seconds = 2
+        self.debounce_seconds = debounce_seconds
+        self.backend_name = backend
+        self.events = queue.Queue()
+        self.analyzer = None
 
     def start(self):
         """Start watching files"""
-        if not WATCHDOG_AVAILABLE:
-            print(f"{Colors.FAIL}❌ Watch mode requires 'watchdog' package{Colors.ENDC}")
-            print(f"Install with: pip install watchdog")
+        self._initial_analysis()
+
+        try:
+            watcher = create_watch_backend(self.backend_name, self.project_dir, self.analyzer.exclude_dirs)
+        except RuntimeError as e:
+            print(f"{Colors.FAIL}❌ {e}{Colors.ENDC}")
             return
 
         print(f"\n{Colors.BOLD}👁️  WATCH MODE ACTIVE{Colors.ENDC}")
-        print(f"Monitoring: {self.project_dir}")
+        print(f"Monitoring: {self.project_dir} (backend: {watcher.name})")
         print("Press Ctrl+C to stop\n")
 
-        event_handler = self._create_handler()
-        observer = Observer()
-        observer.schedule(event_handler, str(self.project_dir), recursive=True)
-        observer.start()
+        watcher.start(self.enqueue)
 
         try:
             while True:
-                time.sleep(1)
+                batch = self._next_batch()
+                if batch:
+                    self._apply_changes(batch)
         except KeyboardInterrupt:
-            observer.stop()
+            watcher.stop()
             print(f"\n{Colors.WARNING}Watch mode stopped{Colors.ENDC}")
 
-        observer.join()
-
-    def _create_handler(self):
-        """Create file system event handler"""
-        parent = self
-
-        class SwiftFileHandler(FileSystemEventHandler):
-            def on_modified(self, event):
-                if event.is_directory:
-                    return
-
-                if not event.src_path.endswith('.swift'):
-                    return
+        watcher.join()
 
-                # Debounce
-                now = time.time()
-                if now - parent.last_run < parent.debounce_seconds:
-                    return
+    def enqueue(self, path: str):
+        """Queue a changed path (called from the watcher thread)"""
+        if path.endswith('.swift') or path.endswith('Localizable.strings'):
+            self.events.put(path)
 
-                parent.last_run = now
-                print(f"\n{Colors.OKCYAN}🔄 File changed: {event.src_path}{Colors.ENDC}")
-                parent._run_analysis()
-
-        return SwiftFileHandler()
+    def _next_batch(self) -> Set[Path]:
+        """Block for the first event, then collect until the queue is quiet"""
+        try:
+            first = self.events.get(timeout=1)
+        except queue.Empty:
+            return set()
+
+        paths = {first}
+        while True:
+            try:
+                paths.add(self.events.get(timeout=self.debounce_seconds))
+            except queue.Empty:
+                break
+
+        return {self.project_dir / os.path.relpath(path, self.project_dir) for path in paths}
+
+    def _initial_analysis(self):
+        """Run the one full analysis the watcher patches afterwards"""
+        self.analyzer = self.analyzer_factory()
+        self.analyzer.load_existing_keys()
+        self.analyzer.find_swift_files()
+        self.analyzer.analyze_all_files()
+        self.analyzer.classify_keys()
+        self._print_summary()
 
-    def _run_analysis(self):
-        """Run quick analysis"""
-        print(f"{Colors.OKBLUE}Running quick analysis...{Colors.ENDC}")
-        analyzer = self.analyzer_factory()
-        analyzer.load_existing_keys()
-        analyzer.find_swift_files()
-        analyzer.analyze_all_files()
+    def _apply_changes(self, paths: Set[Path]):
+        """Patch the analysis for a batch of changed files"""
+        analyzer = self.analyzer
+        start = time.perf_counter()
+
+        for path in sorted(paths):
+            if path.name == 'Localizable.strings' and analyzer.owns_localization_file(path):
+                print(f"{Colors.OKCYAN}🔄 Language changed: {path.parent.name}{Colors.ENDC}")
+                analyzer.reload_localization_file(path)
+
+        swift_changes = sorted(p for p in paths if p.suffix == '.swift' and analyzer.should_analyze(p))
+        for path in swift_changes:
+            print(f"{Colors.OKCYAN}🔄 File changed: {path}{Colors.ENDC}")
+            analyzer.unmerge_file_result(str(path.relative_to(analyzer.project_dir)))
+
+            result = analyzer.scan_file(path) if path.exists() else None
+            if result is None:
+                if path in analyzer.swift_files:
+                    analyzer.swift_files.remove(path)
+                continue
 
-        # Quick summary
-        total = len(analyzer.hardcoded_strings) + len(analyzer.localized_usages)
+            if path not in analyzer.swift_files:
+                analyzer.swift_files.append(path)
+                analyzer.swift_files.sort()
+            analyzer.merge_file_result(result)
+            if analyzer.cache:
+                analyzer.cache.store(path, result)
+
+        analyzer.classify_keys()
+        if analyzer.cache and swift_changes:
+            analyzer.cache.save(analyzer.swift_files)
+            analyzer.update_usage_index()
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._print_summary(elapsed_ms)
+
+    def _print_summary(self, elapsed_ms: Optional[float] = None):
+        """Print the quick summary after each update"""
+        analyzer = self.analyzer
+        localized = len(analyzer.localized_usages)
         hardcoded = len(analyzer.hardcoded_strings)
-        rate = (len(analyzer.localized_usages) / total * 100) if total > 0 else 100
+        total = localized + hardcoded
+        rate = (localized / total * 100) if total > 0 else 100
 
-        print(f"{Colors.OKGREEN}✓ Analysis complete{Colors.ENDC}")
-        print(f"  Localization: {rate:.1f}% ({len(analyzer.localized_usages)}/{total})")
+        timing = f" in {elapsed_ms:.1f} ms" if elapsed_ms is not None else ""
+        print(f"{Colors.OKGREEN}✓ Analysis updated{timing}{Colors.ENDC}")
+        print(f"  Localization: {rate:.1f}% ({localized}/{total})")
         print(f"  Hardcoded: {hardcoded}")
+        print(f"  Missing keys: {len(analyzer.missing_keys)}  Dead keys: {len(analyzer.dead_keys)}  "
+              f"Possibly used: {len(analyzer.possibly_used_keys)}")
         print(f"  {Colors.OKCYAN}Watching for changes...{Colors.ENDC}\n")
 
 
@@ -678,7 +1778,8 @@ class KeyPatternAnalyzer:
         """Analyze key patterns"""
         patterns = defaultdict(list)
 
-        for key in keys:
+        # Sorted so reports are identical whatever the set's iteration order
+        for key in sorted(keys):
             # Extract pattern (prefix before first dot or underscore)
             match = re.match(r'^([a-z]+)[._]', key)
             if match:
@@ -694,17 +1795,721 @@ class KeyPatternAnalyzer:
         }
 
 
+class KeyTemplateTrie:
+    """
+    Interpolated keys ("tab.\\(name)") as prefix/suffix patterns
+
+    The literal prefix of each template is a path in a character trie; the
+    node where it ends keeps the suffix and any literal middle pieces. A
+    key walks the trie once along its own characters and is checked only
+    against templates whose prefix it passes.
+    """
+
+    END = None  # Child slot holding the templates that end at a node
+
+    def __init__(self):
+        self.root = {}
+        self.templates = 0
+        self.unbounded = []  # Bare interpolations: no literal to match on, so ignored
+
+    @staticmethod
+    def split(key: str) -> Optional[List[str]]:
+        """Literal pieces around each \\( ... ) interpolation; None for a plain key"""
+        start = key.find('\\(')
+        if start == -1:
+            return None
+        pieces = []
+        pos = 0
+        while start != -1:
+            pieces.append(key[pos:start])
+            depth = 0
+            end = start + 1
+            while end < len(key):
+                if key[end] == '(':
+                    depth += 1
+                elif key[end] == ')':
+                    depth -= 1
+                    if depth == 0:
+                        break
+                end += 1
+            pos = end + 1
+            start = key.find('\\(', pos)
+        pieces.append(key[pos:])
+        return pieces
+
+    def add(self, template: str) -> bool:
+        pieces = self.split(template)
+        if pieces is None:
+            return False
+        prefix, *middle, suffix = pieces
+        if not (prefix or suffix or any(middle)):
+            self.unbounded.append(template)
+            return False
+        node = self.root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        # Every interpolation stands for at least one character
+        min_length = sum(map(len, pieces)) + len(pieces) - 1
+        node.setdefault(self.END, []).append((suffix, tuple(middle), min_length, template))
+        self.templates += 1
+        return True
+
+    @staticmethod
+    def _fits(key: str, depth: int, suffix: str, middle: Tuple[str, ...]) -> bool:
+        end = len(key) - len(suffix)
+        if not key.endswith(suffix):
+            return False
+        pos = depth
+        for piece in middle:
+            pos = key.find(piece, pos, end)
+            if pos == -1:
+                return False
+            pos += len(piece)
+        return True
+
+    def match(self, key: str) -> Optional[str]:
+        """First template that could produce key, if any"""
+        node = self.root
+        depth = 0
+        while node is not None:
+            for suffix, middle, min_length, template in node.get(self.END, ()):
+                if len(key) >= min_length and self._fits(key, depth, suffix, middle):
+                    return template
+            if depth == len(key):
+                break
+            node = node.get(key[depth])
+            depth += 1
+        return None
+
+
+class NearDuplicateFinder:
+    """
+    Clusters near-identical strings ("AI Öneri" / "AI Önerisi")
+
+    Character 3-gram shingles are summarized by MinHash signatures and
+    split into LSH bands; only strings sharing a band bucket become
+    candidate pairs, which are then verified with SequenceMatcher. This
+    keeps the stage close to linear instead of comparing all pairs.
+    """
+
+    SHINGLE = 3
+    BANDS = 16
+    ROWS = 3                # 48 hash functions; pairs with 3-gram Jaccard ~0.4+ share a bucket
+    MAX_BUCKET = 200        # Buckets this large are boilerplate, not near-duplicates
+
+    def __init__(self, threshold: float = 0.85, min_length: int = 4):
+        self.threshold = threshold
+        self.min_length = min_length
+        # XOR with a random mask permutes 32-bit CRCs; map() keeps the min-hash loop in C
+        rng = random.Random(5)
+        self._masks = [rng.getrandbits(32).__xor__ for _ in range(self.BANDS * self.ROWS)]
+        # Shingles repeat across strings, so their permuted hashes are computed once
+        self._shingle_hashes = {}
+        self.candidates = 0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return ' '.join(text.casefold().split())
+
+    def _signature(self, text: str) -> Tuple[int, ...]:
+        padded = f' {text} '
+        hashed = self._shingle_hashes
+        columns = []
+        for i in range(len(padded) - self.SHINGLE + 1):
+            shingle = padded[i:i + self.SHINGLE]
+            values = hashed.get(shingle)
+            if values is None:
+                crc = zlib.crc32(shingle.encode('utf-8'))
+                values = hashed[shingle] = tuple(mask(crc) for mask in self._masks)
+            columns.append(values)
+        # Element-wise minimum over the shingles' precomputed hash rows
+        return tuple(map(min, *columns)) if len(columns) > 1 else columns[0]
+
+    def _verified(self, first: str, second: str) -> float:
+        # Length alone bounds the ratio; skip building a matcher when it can't pass
+        if 2 * min(len(first), len(second)) < self.threshold * (len(first) + len(second)):
+            return 0.0
+        matcher = SequenceMatcher(None, first, second, autojunk=False)
+        if matcher.real_quick_ratio() < self.threshold or matcher.quick_ratio() < self.threshold:
+            return 0.0
+        return matcher.ratio()
+
+    def find(self, texts: Dict[str, Dict]) -> List[Dict]:
+        """
+        Cluster texts that are near-duplicates of each other
+
+        Args:
+            texts: original text -> {'hardcoded': occurrences, 'keys': [...]}
+
+        Returns:
+            Clusters (largest first) with their members and the weakest
+            verified similarity that holds each cluster together
+        """
+        # Case/whitespace variants collapse into one item up front
+        items = defaultdict(list)
+        for text in texts:
+            normalized = self.normalize(text)
+            if len(normalized) >= self.min_length:
+                items[normalized].append(text)
+        normalized_texts = sorted(items)
+
+        buckets = defaultdict(list)
+        rows = self.ROWS
+        for index, text in enumerate(normalized_texts):
+            signature = self._signature(text)
+            for band in range(self.BANDS):
+                buckets[(band, signature[band * rows:(band + 1) * rows])].append(index)
+
+        parent = list(range(len(normalized_texts)))
+
+        def root(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        checked = set()
+        links = {}
+        for members in buckets.values():
+            if len(members) < 2 or len(members) > self.MAX_BUCKET:
+                continue
+            for position, i in enumerate(members):
+                for j in members[position + 1:]:
+                    if (i, j) in checked:
+                        continue
+                    checked.add((i, j))
+                    ratio = self._verified(normalized_texts[i], normalized_texts[j])
+                    if ratio >= self.threshold:
+                        links[(i, j)] = ratio
+                        parent[root(i)] = root(j)
+        self.candidates = len(checked)
+
+        groups = defaultdict(list)
+        for index, text in enumerate(normalized_texts):
+            groups[root(index)].append(index)
+        weakest = {}
+        for (i, _), ratio in links.items():
+            group = root(i)
+            weakest[group] = min(weakest.get(group, 1.0), ratio)
+
+        clusters = []
+        for group, indexes in groups.items():
+            originals = sorted(text for index in indexes for text in items[normalized_texts[index]])
+            if len(originals) < 2:
+                continue
+            clusters.append({
+                'texts': originals,
+                'similarity': round(weakest.get(group, 1.0), 3),
+                'members': [{'text': text, **texts[text]} for text in originals],
+            })
+        clusters.sort(key=lambda cluster: (-len(cluster['texts']), cluster['texts']))
+        return clusters
+
+
+class GitIgnoreRules:
+    """Minimal .gitignore matcher: globs, `**`, negation, anchoring, dir-only"""
+
+    def __init__(self):
+        self.rules = []  # (base dir, regex, negated, dir_only)
+
+    def add_file(self, gitignore_path: Path, base: str = ''):
+        """Add rules from a .gitignore located in `base` (relative, posix)"""
+        try:
+            with open(gitignore_path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except (OSError, UnicodeDecodeError):
+            return
+
+        for line in lines:
+            line = line.rstrip()
+            if not line or line.startswith('#'):
+                continue
+            negated = line.startswith('!')
+            if negated:
+                line = line[1:]
+            dir_only = line.endswith('/')
+            line = line.rstrip('/')
+            if not line:
+                continue
+            self.rules.append((base, self._compile(line), negated, dir_only))
+
+    @staticmethod
+    def _compile(pattern: str):
+        # A slash at the start or in the middle anchors to the .gitignore directory
+        anchored = '/' in pattern
+        pattern = pattern.lstrip('/')
+
+        parts = []
+        i = 0
+        while i < len(pattern):
+            if pattern.startswith('**/', i):
+                parts.append('(?:.*/)?')
+                i += 3
+            elif pattern.startswith('**', i):
+                parts.append('.*')
+                i += 2
+            elif pattern[i] == '*':
+                parts.append('[^/]*')
+                i += 1
+            elif pattern[i] == '?':
+                parts.append('[^/]')
+                i += 1
+            elif pattern[i] == '[' and ']' in pattern[i + 1:]:
+                end = pattern.index(']', i + 1)
+                parts.append('[' + pattern[i + 1:end].replace('!', '^', 1) + ']')
+                i = end + 1
+            else:
+                parts.append(re.escape(pattern[i]))
+                i += 1
+
+        body = ''.join(parts)
+        return re.compile(body if anchored else f'(?:.*/)?{body}')
+
+    def is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """Last matching rule wins, as in git"""
+        ignored = False
+        for base, regex, negated, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if base:
+                if not rel_path.startswith(base + '/'):
+                    continue
+                candidate = rel_path[len(base) + 1:]
+            else:
+                candidate = rel_path
+            if regex.fullmatch(candidate):
+                ignored = not negated
+        return ignored
+
+
+class SwiftFileWalker:
+    """
+    os.scandir based discovery of Swift files
+
+    Excluded and git-ignored directories are pruned before descending, so
+    a populated DerivedData or build folder is never walked. Paths are
+    yielded as they are found, in sorted depth-first order.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        exclude_dirs: Set[str],
+        include_globs: Optional[List[str]] = None,
+        exclude_globs: Optional[List[str]] = None,
+        respect_gitignore: bool = True
+    ):
+        self.root = root
+        self.exclude_dirs = exclude_dirs
+        self.include_globs = include_globs or []
+        self.exclude_globs = exclude_globs or []
+        self.respect_gitignore = respect_gitignore
+        self.gitignore = GitIgnoreRules()
+        self._gitignore_loaded = set()
+        self._load_gitignore('')
+
+    def _load_gitignore(self, rel_dir: str):
+        if not self.respect_gitignore or rel_dir in self._gitignore_loaded:
+            return
+        self._gitignore_loaded.add(rel_dir)
+        gitignore_path = self.root / rel_dir / '.gitignore'
+        if gitignore_path.is_file():
+            self.gitignore.add_file(gitignore_path, rel_dir)
+
+    def _accept_file(self, rel_path: str) -> bool:
+        name = rel_path.rsplit('/', 1)[-1]
+        if 'Generated' in rel_path or 'generated' in name:
+            return False
+        if self.respect_gitignore and self.gitignore.is_ignored(rel_path, False):
+            return False
+        if any(fnmatch.fnmatch(rel_path, pattern) for pattern in self.exclude_globs):
+            return False
+        if self.include_globs:
+            return any(fnmatch.fnmatch(rel_path, pattern) for pattern in self.include_globs)
+        return True
+
+    def walk(self) -> Iterator[Path]:
+        """Yield Swift files under the root"""
+        stack = ['']
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                with os.scandir(self.root / rel_dir) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            if rel_dir and any(entry.name == '.gitignore' for entry in entries):
+                self._load_gitignore(rel_dir)
+
+            subdirs = []
+            for entry in entries:
+                rel_path = f'{rel_dir}/{entry.name}' if rel_dir else entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if entry.name in self.exclude_dirs:
+                        continue
+                    if self.respect_gitignore and self.gitignore.is_ignored(rel_path, True):
+                        continue
+                    subdirs.append(rel_path)
+                elif entry.name.endswith('.swift') and self._accept_file(rel_path):
+                    yield self.root / rel_path
+
+            stack.extend(reversed(subdirs))
+
+    def accepts(self, file_path: Path) -> bool:
+        """Check a single path against the same rules (used by watch mode)"""
+        rel_path = Path(os.path.relpath(file_path, self.root)).as_posix()
+        parts = rel_path.split('/')
+        for depth in range(1, len(parts)):
+            if parts[depth - 1] in self.exclude_dirs:
+                return False
+            if self.respect_gitignore and self.gitignore.is_ignored('/'.join(parts[:depth]), True):
+                return False
+        return rel_path.endswith('.swift') and self._accept_file(rel_path)
+
+
+class FileAnalysis(NamedTuple):
+    """Immutable per-file findings, safe to send between processes"""
+    file: str
+    localized: Tuple[Dict, ...]
+    hardcoded: Tuple[Dict, ...]
+    digest: str = ''  # SHA-1 of the file content
+
+
+class AnalysisCache:
+    """
+    On-disk cache of per-file findings under .locanalyzer_cache/
+
+    Entries are keyed by relative path and validated by mtime and size;
+    if only the mtime changed, the content hash decides. The whole cache
+    is dropped when the pattern signature (patterns, exclusions, weights,
+    front end, discovery globs and CACHE_VERSION) changes.
+    """
+
+    CACHE_VERSION = 1
+    DIR_NAME = '.locanalyzer_cache'
+
+    def __init__(self, project_dir: Path, signature: str):
+        self.project_dir = project_dir
+        self.cache_dir = project_dir / self.DIR_NAME
+        self.cache_file = self.cache_dir / 'findings.json'
+        self.signature = signature
+        self.entries = {}
+        self.dirty = False
+        self._load()
+
+    @classmethod
+    def signature_for(cls, *parts) -> str:
+        """Hash everything that influences per-file findings"""
+        payload = json.dumps([cls.CACHE_VERSION, *parts], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _load(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('signature') == self.signature:
+            self.entries = data.get('files', {})
+
+    def _key(self, file_path: Path) -> str:
+        return str(file_path.relative_to(self.project_dir))
+
+    def lookup(self, file_path: Path) -> Optional[FileAnalysis]:
+        """Return cached findings if the file is unchanged"""
+        entry = self.entries.get(self._key(file_path))
+        if entry is None:
+            return None
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        if stat.st_size != entry['size']:
+            return None
+        if stat.st_mtime_ns != entry['mtime_ns']:
+            # Touched but possibly identical: compare content hashes
+            try:
+                digest = hashlib.sha1(file_path.read_bytes()).hexdigest()
+            except OSError:
+                return None
+            if digest != entry['sha1']:
+                return None
+            entry['mtime_ns'] = stat.st_mtime_ns
+            self.dirty = True
+        return FileAnalysis(
+            self._key(file_path),
+            tuple(entry['localized']),
+            tuple(entry['hardcoded']),
+            entry['sha1'],
+        )
+
+    def store(self, file_path: Path, result: FileAnalysis):
+        """Record freshly scanned findings"""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return
+        self.entries[result.file] = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha1': result.digest,
+            'localized': list(result.localized),
+            'hardcoded': list(result.hardcoded),
+        }
+        self.dirty = True
+
+    def save(self, current_files: List[Path]):
+        """Drop entries for deleted files and write the cache atomically"""
+        live = {self._key(f) for f in current_files}
+        stale = [key for key in self.entries if key not in live]
+        for key in stale:
+            del self.entries[key]
+        if not (self.dirty or stale):
+            return
+
+        self.cache_dir.mkdir(exist_ok=True)
+        tmp_file = self.cache_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'signature': self.signature, 'files': self.entries}, f, ensure_ascii=False)
+        os.replace(tmp_file, self.cache_file)
+        self.dirty = False
+
+    def clear(self):
+        """Remove the cache directory"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        self.entries = {}
+
+
+class UsageIndex:
+    """
+    Persisted reverse index of localized key usages
+
+    Kept next to the analysis cache and synced from it: only files whose
+    content hash changed are re-indexed. Both directions are stored, so
+    --where / --keys-in are a JSON load plus a dict lookup.
+    """
+
+    INDEX_VERSION = 1
+    FILE_NAME = 'usage_index.json'
+
+    def __init__(self, project_dir: Path):
+        self.project_dir = project_dir
+        self.index_file = project_dir / AnalysisCache.DIR_NAME / self.FILE_NAME
+        self.files = {}  # relative path -> {'sha1', 'mtime_ns', 'size', 'usages': [[key, line, component]]}
+        self.keys = {}   # key -> [[relative path, line, component]]
+        self.updated_at = None
+
+    @classmethod
+    def load(cls, project_dir: Path) -> Optional['UsageIndex']:
+        index = cls(project_dir)
+        try:
+            with open(index.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != cls.INDEX_VERSION:
+            return None
+        index.files = data.get('files', {})
+        index.keys = data.get('keys', {})
+        index.updated_at = data.get('updated_at')
+        return index
+
+    def _drop(self, relative_path: str):
+        entry = self.files.pop(relative_path, None)
+        if entry is None:
+            return
+        for key in {usage[0] for usage in entry['usages']}:
+            remaining = [usage for usage in self.keys.get(key, []) if usage[0] != relative_path]
+            if remaining:
+                self.keys[key] = remaining
+            else:
+                self.keys.pop(key, None)
+
+    def sync(self, cache_entries: Dict[str, Dict]) -> int:
+        """Bring the index in line with the analysis cache; returns files re-indexed"""
+        changed = 0
+        for relative_path in [path for path in self.files if path not in cache_entries]:
+            self._drop(relative_path)
+            changed += 1
+
+        for relative_path, entry in cache_entries.items():
+            indexed = self.files.get(relative_path)
+            if indexed is not None and indexed['sha1'] == entry['sha1']:
+                if indexed['mtime_ns'] != entry['mtime_ns']:
+                    indexed['mtime_ns'] = entry['mtime_ns']
+                    changed += 1
+                continue
+            self._drop(relative_path)
+            usages = [[usage['key'], usage['line'], usage['component']] for usage in entry['localized']]
+            self.files[relative_path] = {
+                'sha1': entry['sha1'],
+                'mtime_ns': entry['mtime_ns'],
+                'size': entry['size'],
+                'usages': usages,
+            }
+            for key, line, component in usages:
+                self.keys.setdefault(key, []).append([relative_path, line, component])
+            changed += 1
+        return changed
+
+    def save(self):
+        """Write the index atomically"""
+        self.updated_at = datetime.now().isoformat(timespec='seconds')
+        self.index_file.parent.mkdir(exist_ok=True)
+        tmp_file = self.index_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': self.INDEX_VERSION,
+                'updated_at': self.updated_at,
+                'files': self.files,
+                'keys': {key: sorted(usages) for key, usages in sorted(self.keys.items())},
+            }, f, ensure_ascii=False)
+        os.replace(tmp_file, self.index_file)
+
+    def where(self, pattern: str) -> Dict[str, List]:
+        """Usages of a key, or of every key matching a glob (button.*)"""
+        if any(char in pattern for char in '*?['):
+            return {key: usages for key, usages in sorted(self.keys.items()) if fnmatch.fnmatchcase(key, pattern)}
+        return {pattern: self.keys[pattern]} if pattern in self.keys else {}
+
+    def resolve_file(self, path: str) -> List[str]:
+        """Indexed files matching a relative path or a unique path suffix"""
+        normalized = os.path.normpath(path)
+        if normalized in self.files:
+            return [normalized]
+        return sorted(rel for rel in self.files if rel.endswith(os.sep + normalized))
+
+    def stale_files(self, relative_paths) -> List[str]:
+        """Files changed on disk since they were indexed (stat only, no reads)"""
+        stale = []
+        for relative_path in relative_paths:
+            entry = self.files[relative_path]
+            try:
+                stat = (self.project_dir / relative_path).stat()
+            except OSError:
+                stale.append(relative_path)
+                continue
+            if stat.st_size != entry['size'] or stat.st_mtime_ns != entry['mtime_ns']:
+                stale.append(relative_path)
+        return stale
+
+
+class FindingsStream:
+    """
+    NDJSON findings writer
+
+    One JSON object per line: a "meta" record, one "hardcoded"/"localized"
+    record per finding written (and flushed) as each file completes, then
+    a final "summary" record. Nothing is buffered beyond the current file,
+    so consumers can tail the file while the analysis is still running.
+    A stream closed without a summary (interrupted run) is incomplete.
+    """
+
+    def __init__(self, path: Path, project: str):
+        self.path = path
+        self.file = open(path, 'w', encoding='utf-8')
+        self.count = 0
+        self._write({
+            'type': 'meta',
+            'generated_at': datetime.now().isoformat(),
+            'version': '5.0',
+            'project': project,
+        })
+
+    def _write(self, record: Dict):
+        self.file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+        self.file.write('\n')
+
+    def write_file(self, result: FileAnalysis):
+        """Emit every finding of one analyzed file"""
+        for item in result.hardcoded:
+            self._write({'type': 'hardcoded', **item})
+        for item in result.localized:
+            self._write({'type': 'localized', **item})
+        self.count += len(result.hardcoded) + len(result.localized)
+        self.file.flush()
+
+    def close(self, summary: Optional[Dict] = None):
+        """Write the summary record (if given) and close the stream"""
+        if self.file.closed:
+            return
+        if summary is not None:
+            self._write({'type': 'summary', 'findings': self.count, **summary})
+        self.file.close()
+
+
+# Per-process analyzer used by the ProcessPoolExecutor workers
+_worker_analyzer = None
+
+# Placeholder for a file whose scan hasn't finished yet
+_PENDING = object()
+
+
+def _init_analysis_worker(project_dir: str, use_lexer: bool, localization_files: List[Path]):
+    global _worker_analyzer
+    _worker_analyzer = LocalizationAnalyzerV5(
+        project_dir, use_lexer=use_lexer, localization_files=localization_files
+    )
+
+
+def _scan_chunk_in_worker(file_paths: List[Path]) -> List[Optional[FileAnalysis]]:
+    return [_worker_analyzer.scan_file(file_path) for file_path in file_paths]
+
+
+class Target(NamedTuple):
+    """One Xcode target: the Swift sources compiled into it and its own catalog"""
+    name: str
+    sources: Tuple[str, ...]  # Folders or single files (membership exceptions)
+    resources: str            # Folder holding the target's *.lproj/Localizable.strings
+
+    def owns(self, relative_path: str) -> bool:
+        return any(
+            relative_path == source or relative_path.startswith(source + '/')
+            for source in self.sources
+        )
+
+    def localization_files(self, project_dir: Path) -> List[Path]:
+        return sorted((project_dir / self.resources).glob('*.lproj/Localizable.strings'))
+
+
+# Mirrors the file system synchronized groups in LifeStyles.xcodeproj
+TARGETS = (
+    Target('LifeStyles', ('LifeStyles',), 'LifeStyles/Resources'),
+    Target('CallReminderWidget', ('CallReminderWidget',), 'CallReminderWidget'),
+    Target('FriendsWidget', ('FriendsWidget', 'LifeStyles/Shared/FriendWidgetData.swift'), 'FriendsWidget'),
+)
+
+REPORT_NAME = 'localization_report_v5.json'
+
+
 class LocalizationAnalyzerV5:
     """Enhanced V5 analyzer with auto-fix and advanced features"""
 
-    def __init__(self, project_dir: str):
+    def __init__(
+        self,
+        project_dir: str,
+        use_lexer: bool = True,
+        localization_files: Optional[List[Path]] = None,
+        use_cache: bool = False,
+        include_globs: Optional[List[str]] = None,
+        exclude_globs: Optional[List[str]] = None,
+        respect_gitignore: bool = True
+    ):
         self.project_dir = Path(project_dir)
+        self.use_lexer = use_lexer
         self.swift_files = []
         self.hardcoded_strings = []
         self.localized_usages = []
         self.existing_keys = {}
         self.used_keys = set()
         self.dead_keys = set()
+        self.template_counts = Counter()  # Interpolated keys ("tab.\(name)") -> usages
+        self.possibly_used_keys = {}      # Unused key -> template that may build it at runtime
         self.missing_keys = defaultdict(list)
         self.component_stats = defaultdict(lambda: {'total': 0, 'localized': 0, 'hardcoded': 0})
         self.file_stats = defaultdict(lambda: {'total': 0, 'localized': 0, 'hardcoded': 0})
@@ -716,8 +2521,16 @@ class LocalizationAnalyzerV5:
         self.translation_issues = []
         self.context_groups = defaultdict(list)
 
-        # V5: Key pattern analyzer
-        self.key_pattern_analyzer = KeyPatternAnalyzer()
+        # Content to analyze instead of the file on disk (e.g. staged blobs)
+        self.source_overrides = {}
+        # Relative paths a scoped (--since/--staged) run reports on; None = all
+        self.scope = None
+        self.scope_deleted = set()
+
+        # Per-file results currently merged into the aggregates, so a
+        # single file can be subtracted and re-added (watch mode)
+        self.file_results = {}
+        self.key_usage_counts = Counter()
 
         # Priority weights
         self.priority_weights = {
@@ -766,8 +2579,49 @@ class LocalizationAnalyzerV5:
             r'^\s*$',
         ]
 
+        # Compiled once and shared: one scan per file for all call-site patterns
+        self.matcher = get_call_site_matcher(
+            tuple(self.hardcoded_patterns), tuple(self.localized_patterns)
+        )
+        self.exclude_re = re.compile('|'.join(f'(?:{p})' for p in self.exclude_patterns))
+
+        self.exclude_dirs = {
+            'build', 'Build', 'DerivedData', '.build',
+            'Pods', 'Carthage', 'vendor', '.git',
+            AnalysisCache.DIR_NAME, BackupStore.DIR_NAME,
+        }
+        self.walker = SwiftFileWalker(
+            self.project_dir, self.exclude_dirs,
+            include_globs=include_globs,
+            exclude_globs=exclude_globs,
+            respect_gitignore=respect_gitignore,
+        )
+
+        # Options needed to rebuild this analyzer when validating its report
+        self.discovery = {
+            'include_globs': include_globs or [],
+            'exclude_globs': exclude_globs or [],
+            'respect_gitignore': respect_gitignore,
+        }
+        self.signature = AnalysisCache.signature_for(
+            self.hardcoded_patterns, self.localized_patterns,
+            self.exclude_patterns, self.priority_weights, self.use_lexer, self.discovery,
+        )
+
+        # Incremental analysis: reuse findings of unchanged files
+        self.cache = None
+        if use_cache:
+            self.cache = AnalysisCache(self.project_dir, self.signature)
+        self.usage_index = None  # Loaded on first sync (--where / --keys-in read it)
+        self.target_summary = None  # Per-target results (--targets)
+
+        # Parsed .strings files, shared with StringsFileManager
+        self.catalog = get_catalog(self.project_dir / AnalysisCache.DIR_NAME if use_cache else None)
+
         # Dinamik olarak tüm dilleri tara
-        self.localization_files = self._discover_localization_files()
+        if localization_files is None:
+            localization_files = self._discover_localization_files()
+        self.localization_files = localization_files
 
     def _discover_localization_files(self) -> List[Path]:
         """
@@ -806,9 +2660,8 @@ class LocalizationAnalyzerV5:
         if not text or len(text.strip()) == 0:
             return True
 
-        for pattern in self.exclude_patterns:
-            if re.match(pattern, text.strip()):
-                return True
+        if self.exclude_re.match(text.strip()):
+            return True
 
         if len(text.strip()) <= 1:
             return True
@@ -834,11 +2687,6 @@ class LocalizationAnalyzerV5:
 
         return min(10, base_score)
 
-    @lru_cache(maxsize=1024)
-    def _similarity(self, str1: str, str2: str) -> float:
-        """Calculate similarity (cached)"""
-        return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
-
     def _suggest_key_name(self, text: str, component_type: str) -> str:
         """Generate suggested key name"""
         clean_text = re.sub(r'[^\w\s]', '', text.lower())
@@ -874,149 +2722,481 @@ class LocalizationAnalyzerV5:
         print(f"   Desteklenen diller: {', '.join(sorted(all_languages))}")
 
         for loc_file in self.localization_files:
-            if not loc_file.exists():
-                continue
-
-            # Dil kodunu dinamik olarak çıkar
-            lang = loc_file.parent.name.replace('.lproj', '')
-
-            with open(loc_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                pattern = r'^"([^"]+)"\s*=\s*"([^"]+)";'
-                matches = re.finditer(pattern, content, re.MULTILINE)
-
-                for match in matches:
-                    key, value = match.groups()
-                    if key not in self.existing_keys:
-                        # Tüm diller için None ile başlat
-                        self.existing_keys[key] = {lang_code: None for lang_code in all_languages}
-                    self.existing_keys[key][lang] = value
+            self._load_language(loc_file, all_languages)
 
         print(f"   ✓ {len(self.existing_keys)} key yüklendi ({len(all_languages)} dilde)")
+        self.catalog.save()
 
         # V5: Analyze key patterns
-        pattern_analysis = self.key_pattern_analyzer.analyze(set(self.existing_keys.keys()))
+        pattern_analysis = self.key_patterns()
         print(f"   ✓ {pattern_analysis['total_patterns']} farklı key pattern bulundu")
 
+    def key_patterns(self) -> Dict:
+        """Key pattern analysis, memoized by the catalog"""
+        if any(loc_file in self.source_overrides for loc_file in self.localization_files):
+            return KeyPatternAnalyzer().analyze(set(self.existing_keys))
+        try:
+            return self.catalog.key_patterns(*self.localization_files)
+        except StringsSyntaxError:
+            # Already reported while loading; use the keys that did parse
+            return KeyPatternAnalyzer().analyze(set(self.existing_keys))
+
+    def _load_language(self, loc_file: Path, all_languages: Set[str]):
+        """Merge one language's Localizable.strings into existing_keys"""
+        try:
+            if loc_file in self.source_overrides:
+                values = {e.key: e.value for e in parse_strings(self.source_overrides[loc_file])}
+            else:
+                values = self.catalog.strings(loc_file)
+        except StringsSyntaxError as e:
+            print(f"   {Colors.WARNING}⚠️  {loc_file}: {e}{Colors.ENDC}")
+            return
+
+        # Dil kodunu dinamik olarak çıkar
+        lang = loc_file.parent.name.replace('.lproj', '')
+
+        for key, value in values.items():
+            if key not in self.existing_keys:
+                # Tüm diller için None ile başlat
+                self.existing_keys[key] = {lang_code: None for lang_code in all_languages}
+            self.existing_keys[key][lang] = value
+
+    def owns_localization_file(self, loc_file: Path) -> bool:
+        """
+        Whether a Localizable.strings is part of this analyzer's catalog
+
+        Other targets' catalogs (widgets) are not; a new language folder
+        next to the loaded ones is.
+        """
+        if loc_file in self.localization_files:
+            return True
+        return (
+            loc_file.parent.suffix == '.lproj'
+            and loc_file.parent.parent in {f.parent.parent for f in self.localization_files}
+        )
+
+    def reload_localization_file(self, loc_file: Path) -> bool:
+        """Re-read a single language file and patch keys that depend on it"""
+        if not self.owns_localization_file(loc_file):
+            return False
+        lang = loc_file.parent.name.replace('.lproj', '')
+        if loc_file.exists() and loc_file not in self.localization_files:
+            self.localization_files.append(loc_file)
+        all_languages = {f.parent.name.replace('.lproj', '') for f in self.localization_files}
+
+        for key in list(self.existing_keys):
+            values = self.existing_keys[key]
+            values[lang] = None
+            if all(value is None for value in values.values()):
+                del self.existing_keys[key]
+
+        self._load_language(loc_file, all_languages)
+
+        # Missing keys depend on the catalog: rebuild them from the usages
+        self.missing_keys = defaultdict(list)
+        for usage in self.localized_usages:
+            if usage['key'] not in self.existing_keys and '\\(' not in usage['key']:
+                self.missing_keys[usage['key']].append(usage['file'])
+        return True
+
+    def should_analyze(self, swift_file: Path) -> bool:
+        """Check whether a Swift file belongs in the analysis"""
+        return self.walker.accepts(swift_file)
+
     def find_swift_files(self):
         """Find all Swift files"""
         print("🔍 Swift dosyaları taranıyor...")
 
-        exclude_dirs = {
-            'build', 'Build', 'DerivedData', '.build',
-            'Pods', 'Carthage', 'vendor', '.git',
-        }
+        self.swift_files = sorted(self.walker.walk())
 
-        for swift_file in self.project_dir.rglob('*.swift'):
-            if any(excluded in swift_file.parts for excluded in exclude_dirs):
+        print(f"   ✓ {len(self.swift_files)} Swift dosyası bulundu")
+
+    def scan_file(self, file_path: Path) -> Optional['FileAnalysis']:
+        """Scan a single file without touching analyzer state"""
+        if file_path in self.source_overrides:
+            source = SourceFile(file_path, self.source_overrides[file_path])
+        else:
+            source = SourceFile.read(file_path)
+        if source is None:
+            return None
+        content = source.content
+
+        relative_path = str(file_path.relative_to(self.project_dir))
+        localized = []
+        hardcoded = []
+
+        # Skip comments and string literals; #Preview blocks only hide hardcoded strings
+        regions, previews = SwiftLexer(content).regions() if self.use_lexer else (None, [])
+
+        for match, kind, component_type, category in self.matcher.scan(content, regions):
+            if kind == 'localized':
+                line_num, column = source.position(match.start(1) - 1)
+                localized.append({
+                    'file': relative_path,
+                    'line': line_num,
+                    'column': column,
+                    'key': match.group(1),
+                    'component': component_type,
+                })
                 continue
-            if 'Generated' in str(swift_file) or 'generated' in swift_file.name:
+
+            text = match.group(1)
+
+            if self._should_exclude(text) or (previews and _in_spans(previews, match.start())):
                 continue
-            self.swift_files.append(swift_file)
 
-        print(f"   ✓ {len(self.swift_files)} Swift dosyası bulundu")
+            # Position of the opening quote of the string literal
+            line_num, column = source.position(match.start(1) - 1)
 
-    def analyze_file(self, file_path: Path):
-        """Analyze a single file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except:
+            # Skip if wrapped in localization
+            context_start = max(0, match.start() - 50)
+            context = content[context_start:match.end()]
+            if 'String(localized:' in context or 'NSLocalizedString' in context:
+                continue
+
+            hardcoded.append({
+                'file': relative_path,
+                'line': line_num,
+                'column': column,
+                'text': text,
+                'component': component_type,
+                'category': category,
+                'priority': self._calculate_priority(component_type, category, text),
+                'suggested_key': self._suggest_key_name(text, component_type),
+            })
+
+        return FileAnalysis(relative_path, tuple(localized), tuple(hardcoded), source.digest)
+
+    def merge_file_result(self, result: Optional['FileAnalysis']):
+        """Fold one file's findings into the aggregate statistics"""
+        if result is None:
             return
+        self.file_results[result.file] = result
+        folder = str(Path(result.file).parent)
 
-        relative_path = file_path.relative_to(self.project_dir)
-        folder = str(relative_path.parent)
+        for usage in result.localized:
+            key = usage['key']
+            component_type = usage['component']
 
-        # Find localized usages
-        for pattern, component_type in self.localized_patterns:
-            for match in re.finditer(pattern, content):
-                key = match.group(1)
-                line_num = content[:match.start()].count('\n') + 1
+            self.localized_usages.append(usage)
+            self.component_stats[component_type]['localized'] += 1
+            self.file_stats[result.file]['localized'] += 1
+            self.folder_stats[folder]['localized'] += 1
 
-                self.used_keys.add(key)
-                self.localized_usages.append({
-                    'file': str(relative_path),
-                    'line': line_num,
-                    'key': key,
-                    'component': component_type,
-                })
+            if '\\(' in key:
+                # Built at runtime: matched against keys in classify_keys
+                self.template_counts[key] += 1
+                continue
 
-                self.component_stats[component_type]['localized'] += 1
-                self.file_stats[str(relative_path)]['localized'] += 1
-                self.folder_stats[folder]['localized'] += 1
+            self.used_keys.add(key)
+            self.key_usage_counts[key] += 1
+            if key not in self.existing_keys:
+                self.missing_keys[key].append(result.file)
 
-                if key not in self.existing_keys:
-                    self.missing_keys[key].append(str(relative_path))
+        for item in result.hardcoded:
+            component_type = item['component']
 
-        # Find hardcoded strings
-        for pattern, component_type, category in self.hardcoded_patterns:
-            for match in re.finditer(pattern, content):
-                text = match.group(1)
+            self.hardcoded_strings.append(item)
+            self.duplicate_strings.setdefault(item['text'], []).append(item)
 
-                if self._should_exclude(text):
-                    continue
+            self.component_stats[component_type]['hardcoded'] += 1
+            self.file_stats[result.file]['hardcoded'] += 1
+            self.folder_stats[folder]['hardcoded'] += 1
 
-                line_num = content[:match.start()].count('\n') + 1
+    def unmerge_file_result(self, relative_path: str):
+        """Subtract a previously merged file's findings from the aggregates"""
+        result = self.file_results.pop(relative_path, None)
+        if result is None:
+            return
+        folder = str(Path(result.file).parent)
+        dropped = {id(item) for item in result.localized + result.hardcoded}
+
+        self.localized_usages = [u for u in self.localized_usages if id(u) not in dropped]
+        self.hardcoded_strings = [h for h in self.hardcoded_strings if id(h) not in dropped]
+
+        for usage in result.localized:
+            key = usage['key']
+            self.component_stats[usage['component']]['localized'] -= 1
+            self.file_stats[result.file]['localized'] -= 1
+            self.folder_stats[folder]['localized'] -= 1
+
+            if '\\(' in key:
+                self.template_counts[key] -= 1
+                if self.template_counts[key] == 0:
+                    del self.template_counts[key]
+                continue
 
-                # Skip if wrapped in localization
-                context_start = max(0, match.start() - 50)
-                context = content[context_start:match.end()]
-                if 'String(localized:' in context or 'NSLocalizedString' in context:
-                    continue
+            self.key_usage_counts[key] -= 1
+            if self.key_usage_counts[key] == 0:
+                del self.key_usage_counts[key]
+                self.used_keys.discard(key)
 
-                priority = self._calculate_priority(component_type, category, text)
-                suggested_key = self._suggest_key_name(text, component_type)
+            if result.file in self.missing_keys.get(key, ()):
+                self.missing_keys[key].remove(result.file)
+                if not self.missing_keys[key]:
+                    del self.missing_keys[key]
 
-                item = {
-                    'file': str(relative_path),
-                    'line': line_num,
-                    'text': text,
-                    'component': component_type,
-                    'category': category,
-                    'priority': priority,
-                    'suggested_key': suggested_key,
-                }
-
-                self.hardcoded_strings.append(item)
-                self.duplicate_strings[text].append(item)
-
-                self.component_stats[component_type]['hardcoded'] += 1
-                self.file_stats[str(relative_path)]['hardcoded'] += 1
-                self.folder_stats[folder]['hardcoded'] += 1
-
-    def analyze_all_files(self, use_threads: bool = True):
-        """Analyze all files (with optional multi-threading)"""
-        print(f"\n📊 {len(self.swift_files)} dosya analiz ediliyor...")
-
-        if use_threads and len(self.swift_files) > 20:
-            # Multi-threaded analysis
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                if TQDM_AVAILABLE:
-                    list(tqdm(
-                        executor.map(self.analyze_file, self.swift_files),
-                        total=len(self.swift_files),
-                        desc="Analyzing"
-                    ))
-                else:
-                    futures = [executor.submit(self.analyze_file, f) for f in self.swift_files]
-                    for i, future in enumerate(as_completed(futures), 1):
-                        if i % 50 == 0:
-                            print(f"   {i}/{len(self.swift_files)} dosya işlendi...")
+        for item in result.hardcoded:
+            locations = [loc for loc in self.duplicate_strings.get(item['text'], []) if loc is not item]
+            if locations:
+                self.duplicate_strings[item['text']] = locations
+            else:
+                self.duplicate_strings.pop(item['text'], None)
+
+            self.component_stats[item['component']]['hardcoded'] -= 1
+            self.file_stats[result.file]['hardcoded'] -= 1
+            self.folder_stats[folder]['hardcoded'] -= 1
+
+        self.file_stats.pop(result.file, None)
+
+    def analyze_file(self, file_path: Path):
+        """Analyze a single file"""
+        self.merge_file_result(self.scan_file(file_path))
+
+    # Files per work unit sent to a pool worker
+    STREAM_CHUNK_SIZE = 16
+
+    def analyze_all_files(
+        self,
+        parallel: bool = True,
+        workers: Optional[int] = None,
+        files: Optional[Iterator[Path]] = None,
+        on_result=None
+    ):
+        """
+        Analyze all files, optionally across a process pool
+
+        `files` may be a lazy iterator (SwiftFileWalker.walk()): chunks are
+        submitted to the pool while discovery is still running. Unchanged
+        files are served from the analysis cache. Results are merged in
+        discovery (sorted path) order as soon as they are ready, so output
+        is identical to a serial run and `on_result` sees each file as it
+        completes.
+        """
+        streaming = files is not None
+        if not streaming:
+            files = self.swift_files
+            print(f"\n📊 {len(self.swift_files)} dosya analiz ediliyor...")
         else:
-            # Single-threaded
-            for i, file_path in enumerate(self.swift_files, 1):
-                if i % 50 == 0:
-                    print(f"   {i}/{len(self.swift_files)} dosya işlendi...")
-                self.analyze_file(file_path)
+            print(f"\n📊 Swift dosyaları taranıp analiz ediliyor...")
+
+        workers = workers or os.cpu_count() or 1
+        use_pool = parallel and workers > 1
+
+        # [file_path, result, future, index] in discovery order
+        pending = deque()
+        discovered = []
+        chunk = []
+        executor = None
+        from_cache = 0
+        merged = 0
+
+        def flush():
+            nonlocal executor
+            if executor is None:
+                executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_analysis_worker,
+                    initargs=(str(self.project_dir), self.use_lexer, self.localization_files),
+                )
+            future = executor.submit(_scan_chunk_in_worker, [entry[0] for entry in chunk])
+            for index, entry in enumerate(chunk):
+                entry[2], entry[3] = future, index
+            chunk.clear()
+
+        def drain(block: bool = False):
+            nonlocal merged
+            while pending:
+                file_path, result, future, index = pending[0]
+                if result is _PENDING:
+                    if future is None or not (block or future.done()):
+                        return
+                    result = self._store_scan(file_path, future.result()[index])
+                pending.popleft()
+                self.merge_file_result(result)
+                if on_result is not None and result is not None:
+                    on_result(result)
+                merged += 1
+                if merged % 200 == 0:
+                    print(f"   {merged} dosya işlendi...")
+
+        try:
+            for file_path in files:
+                discovered.append(file_path)
+                if file_path in self.source_overrides:
+                    # Content isn't on disk: scan here, never cache
+                    pending.append([file_path, self.scan_file(file_path), None, None])
+                    drain()
+                    continue
+
+                cached = self.cache.lookup(file_path) if self.cache else None
+                if cached is not None:
+                    pending.append([file_path, cached, None, None])
+                    from_cache += 1
+                    drain()
+                    continue
+
+                if not use_pool:
+                    # Serial: scan inline so the result streams and is released right away
+                    pending.append([file_path, self._store_scan(file_path, self.scan_file(file_path)), None, None])
+                    drain()
+                    continue
+
+                entry = [file_path, _PENDING, None, None]
+                pending.append(entry)
+                chunk.append(entry)
+                if len(chunk) >= self.STREAM_CHUNK_SIZE:
+                    flush()
+                    drain()
+
+            # A small remainder is cheaper to scan here than to ship to the pool
+            if chunk and executor is not None:
+                flush()
+            for entry in chunk:
+                entry[1] = self._store_scan(entry[0], self.scan_file(entry[0]))
+            drain(block=True)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if streaming:
+            self.swift_files = sorted(discovered)
+            print(f"   ✓ {len(self.swift_files)} Swift dosyası bulundu")
+        if self.cache:
+            print(f"   💾 Önbellekten: {from_cache}, yeniden analiz: {len(self.swift_files) - from_cache}")
+            self.cache.save(self.swift_files)
+            self.update_usage_index()
 
         print(f"   ✓ Analiz tamamlandı!")
 
+    def update_usage_index(self):
+        """Sync the persisted key usage index with the analysis cache"""
+        if not self.cache:
+            return
+        if self.usage_index is None:
+            self.usage_index = UsageIndex.load(self.project_dir) or UsageIndex(self.project_dir)
+        if self.usage_index.sync(self.cache.entries):
+            self.usage_index.save()
+
+    def _store_scan(self, file_path: Path, result: Optional['FileAnalysis']) -> Optional['FileAnalysis']:
+        """Record a fresh scan in the analysis cache"""
+        if self.cache and result is not None:
+            self.cache.store(file_path, result)
+        return result
+
+    def set_scope(self, changed: List[Path], deleted: List[Path], overrides: Optional[Dict[Path, str]] = None):
+        """Restrict reported findings to a git change set (--since/--staged)"""
+        self.source_overrides = dict(overrides or {})
+        self.scope = {
+            str(path.relative_to(self.project_dir))
+            for path in changed if path.suffix == '.swift' and self.walker.accepts(path)
+        }
+        self.scope_deleted = set(deleted)
+        # Staged Localizable.strings content replaces the working tree copy
+        for path in changed:
+            if (path.name == 'Localizable.strings' and path not in self.localization_files
+                    and self.owns_localization_file(path)):
+                self.localization_files.append(path)
+
+    def scoped_files(self) -> Iterator[Path]:
+        """
+        Files to merge for a scoped run
+
+        The rest of the tree comes from the analysis cache, so the health
+        score still covers the whole project without walking it. Without a
+        warm cache this falls back to a normal walk.
+        """
+        if not (self.cache and self.cache.entries):
+            print(f"   {Colors.WARNING}⚠️  Önbellek boş, tüm proje taranıyor{Colors.ENDC}")
+            return (path for path in self.walker.walk() if path not in self.scope_deleted)
+
+        paths = {self.project_dir / rel for rel in self.cache.entries}
+        paths.update(self.project_dir / rel for rel in self.scope)
+        return iter(sorted(
+            path for path in paths
+            if path not in self.scope_deleted
+            and (path in self.source_overrides or path.exists())
+        ))
+
+    def scoped_hardcoded(self) -> List[Dict]:
+        """Hardcoded findings inside the current scope (all when unscoped)"""
+        if self.scope is None:
+            return self.hardcoded_strings
+        return [item for item in self.hardcoded_strings if item['file'] in self.scope]
+
+    def scoped_duplicates(self) -> Dict[str, List[Dict]]:
+        """Duplicate strings (found tree-wide) limited to locations inside the scope"""
+        duplicates = {}
+        for text, locations in self.duplicate_strings.items():
+            if len(locations) < 2:
+                continue
+            if self.scope is not None:
+                locations = [item for item in locations if item['file'] in self.scope]
+            if locations:
+                duplicates[text] = locations
+        return duplicates
+
     def find_dead_keys(self):
         """Find dead keys"""
         print("\n🔎 Dead key'ler tespit ediliyor...")
-        all_keys = set(self.existing_keys.keys())
-        self.dead_keys = all_keys - self.used_keys
+        self.classify_keys()
         print(f"   ✓ {len(self.dead_keys)} dead key bulundu")
+        if self.template_counts:
+            print(f"   🧩 {len(self.possibly_used_keys)} key, {len(self.template_counts)} dinamik key "
+                  f"şablonuyla kullanılıyor olabilir (silinmeyecek)")
+
+    def classify_keys(self):
+        """Split keys into used, possibly used via an interpolated template, and dead"""
+        trie = KeyTemplateTrie()
+        for template in self.template_counts:
+            trie.add(template)
+
+        self.dead_keys = set()
+        self.possibly_used_keys = {}
+        for key in self.existing_keys:
+            if key in self.used_keys:
+                continue
+            template = trie.match(key) if trie.templates else None
+            if template is None:
+                self.dead_keys.add(key)
+            else:
+                self.possibly_used_keys[key] = template
+
+    def _hash_sources(self, swift_digests: Dict[str, str]) -> str:
+        """SHA-256 over the analysis signature, Swift digests and .strings content"""
+        h = hashlib.sha256(self.signature.encode('utf-8'))
+        for rel in sorted(swift_digests):
+            h.update(f'S {rel}\0{swift_digests[rel]}\n'.encode('utf-8'))
+        for loc_file in sorted(self.localization_files):
+            if loc_file in self.source_overrides:
+                data = self.source_overrides[loc_file].encode('utf-8')
+            else:
+                try:
+                    data = loc_file.read_bytes()
+                except OSError:
+                    continue
+            h.update(f'L {loc_file}\0{hashlib.sha1(data).hexdigest()}\n'.encode('utf-8'))
+        return h.hexdigest()
+
+    def source_hash(self) -> str:
+        """Hash of the inputs the current findings were computed from"""
+        return self._hash_sources({rel: result.digest for rel, result in self.file_results.items()})
+
+    def current_source_hash(self) -> str:
+        """Hash of the inputs as they are on disk now (reads files, no analysis)"""
+        digests = {}
+        for file_path in self.walker.walk():
+            source = SourceFile.read(file_path)
+            if source is not None:
+                digests[str(file_path.relative_to(self.project_dir))] = source.digest
+        return self._hash_sources(digests)
+
+    def forget_dead_keys(self):
+        """Drop removed dead keys from the in-memory catalog and rewrite the report"""
+        for key in self.dead_keys:
+            self.existing_keys.pop(key, None)
+        self.dead_keys = set()
+        self.generate_json_report()
 
     def analyze_duplicates(self):
         """Analyze duplicates"""
@@ -1028,6 +3208,149 @@ class LocalizationAnalyzerV5:
         }
         print(f"   ✓ {len(self.duplicate_strings)} duplicate string bulundu")
 
+    def find_similar_strings(self):
+        """Cluster near-duplicate hardcoded strings and Turkish .strings values"""
+        print("\n🧬 Benzer string'ler kümeleniyor...")
+        start = time.perf_counter()
+
+        texts = defaultdict(lambda: {'hardcoded': 0, 'keys': []})
+        for item in self.hardcoded_strings:
+            texts[item['text']]['hardcoded'] += 1
+        for key, values in self.existing_keys.items():
+            # Hardcoded strings are Turkish, so compare against the tr values;
+            # untranslated placeholders (value == key) aren't text
+            value = values.get('tr')
+            if value and value != key:
+                texts[value]['keys'].append(key)
+
+        finder = NearDuplicateFinder()
+        self.similar_strings = finder.find(dict(texts))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"   ✓ {len(self.similar_strings)} benzer string kümesi "
+              f"({len(texts)} string, {finder.candidates} aday çift, {elapsed_ms:.0f} ms)")
+
+    def target_analyzer(self, target: Target) -> 'LocalizationAnalyzerV5':
+        """One target's findings checked against its own catalog, reusing merged results"""
+        analyzer = LocalizationAnalyzerV5(
+            self.project_dir, use_lexer=self.use_lexer,
+            localization_files=target.localization_files(self.project_dir),
+        )
+        analyzer.catalog = self.catalog
+        analyzer.source_overrides = self.source_overrides
+        all_languages = {f.parent.name.replace('.lproj', '') for f in analyzer.localization_files}
+        for loc_file in analyzer.localization_files:
+            analyzer._load_language(loc_file, all_languages)
+
+        for relative_path, result in sorted(self.file_results.items()):
+            if target.owns(relative_path):
+                analyzer.swift_files.append(self.project_dir / relative_path)
+                analyzer.merge_file_result(result)
+        analyzer.classify_keys()
+        analyzer.duplicate_strings = {
+            text: locations for text, locations in analyzer.duplicate_strings.items() if len(locations) >= 2
+        }
+        return analyzer
+
+    def target_keys(self, target: Target) -> Set[str]:
+        """Keys used by a target's files, read from the usage index when there is one"""
+        if self.usage_index is not None:
+            return {
+                usage[0]
+                for relative_path, entry in self.usage_index.files.items() if target.owns(relative_path)
+                for usage in entry['usages']
+            }
+        return {
+            usage['key']
+            for relative_path, result in self.file_results.items() if target.owns(relative_path)
+            for usage in result.localized
+        }
+
+    def analyze_targets(self, targets: Tuple[Target, ...] = TARGETS) -> Dict:
+        """Per-target health, a combined score and the keys targets share"""
+        print("\n🎯 Hedefler kendi kataloglarıyla değerlendiriliyor...")
+        results = {}
+        catalogs = {}
+        used = {}
+        weighted = 0.0
+        total_strings = 0
+        for target in targets:
+            analyzer = self.target_analyzer(target)
+            health = analyzer.calculate_health_score()
+            catalogs[target.name] = set(analyzer.existing_keys)
+            used[target.name] = self.target_keys(target)
+            results[target.name] = {
+                'sources': list(target.sources),
+                'catalog': [str(f) for f in analyzer.localization_files],
+                'files': len(analyzer.swift_files),
+                'health_score': health,
+                'used_keys': len(analyzer.used_keys),
+                'missing_keys': sorted(analyzer.missing_keys),
+                'dead_keys': sorted(analyzer.dead_keys),
+            }
+            weighted += health['score'] * health.get('total_strings', 0)
+            total_strings += health.get('total_strings', 0)
+
+        # Missing here but present in another target's catalog: the string exists,
+        # it just isn't bundled with this target
+        for name, result in results.items():
+            elsewhere = set().union(*(keys for other, keys in catalogs.items() if other != name))
+            result['missing_in_other_catalogs'] = sorted(elsewhere.intersection(result['missing_keys']))
+
+        names = list(results)
+        shared = {}
+        for i, first in enumerate(names):
+            for second in names[i + 1:]:
+                keys = used[first] & used[second]
+                if keys:
+                    shared[f'{first} & {second}'] = sorted(keys)
+
+        combined = weighted / total_strings if total_strings else 100
+        unowned = sorted(path for path in self.file_results if not any(t.owns(path) for t in targets))
+        print(f"   ✓ {len(targets)} hedef, {len(shared)} ortak key kümesi")
+        return {
+            'combined_health': {'score': round(combined, 1), 'grade': self.health_grade(combined)},
+            'targets': results,
+            'shared_keys': shared,
+            'used_by_all': sorted(set.intersection(*used.values())) if used else [],
+            'unowned_files': unowned,
+        }
+
+    def print_target_summary(self):
+        """Per-target lines under the analysis summary"""
+        summary = self.target_summary
+        print(f"\n{Colors.BOLD}🎯 HEDEFLER{Colors.ENDC}")
+        for name, result in summary['targets'].items():
+            health = result['health_score']
+            if result['catalog']:
+                catalog = f"katalog: {len(result['catalog'])} dil"
+            else:
+                catalog = f"{Colors.WARNING}katalog yok{Colors.ENDC}"
+            print(f"   {name:<20} {result['files']:>4} dosya  {health['score']:>5}/100 ({health['grade']:<2})  "
+                  f"{catalog}  missing: {len(result['missing_keys'])}  dead: {len(result['dead_keys'])}")
+            if result['missing_in_other_catalogs']:
+                print(f"   {'':<20} ⚠️  {len(result['missing_in_other_catalogs'])} eksik key başka bir hedefin "
+                      f"kataloğunda var (bu hedefe dahil değil)")
+        combined = summary['combined_health']
+        print(f"🏥 Birleşik Health Score: {combined['score']}/100 ({combined['grade']})")
+        for pair, keys in summary['shared_keys'].items():
+            print(f"🔗 Ortak key'ler ({pair}): {len(keys)}")
+        if summary['unowned_files']:
+            print(f"📂 Hiçbir hedefe ait olmayan: {', '.join(summary['unowned_files'])}")
+
+    @staticmethod
+    def health_grade(score: float) -> str:
+        if score >= 95:
+            return 'A+'
+        if score >= 90:
+            return 'A'
+        if score >= 80:
+            return 'B'
+        if score >= 70:
+            return 'C'
+        if score >= 60:
+            return 'D'
+        return 'F'
+
     def calculate_health_score(self) -> Dict:
         """Calculate health score"""
         total_strings = len(self.hardcoded_strings) + len(self.localized_usages)
@@ -1047,22 +3370,9 @@ class LocalizationAnalyzerV5:
 
         score = max(0, min(100, score))
 
-        if score >= 95:
-            grade = 'A+'
-        elif score >= 90:
-            grade = 'A'
-        elif score >= 80:
-            grade = 'B'
-        elif score >= 70:
-            grade = 'C'
-        elif score >= 60:
-            grade = 'D'
-        else:
-            grade = 'F'
-
         return {
             'score': round(score, 1),
-            'grade': grade,
+            'grade': self.health_grade(score),
             'localized_count': len(self.localized_usages),
             'hardcoded_count': len(self.hardcoded_strings),
             'total_strings': total_strings,
@@ -1079,38 +3389,82 @@ class LocalizationAnalyzerV5:
         health = self.calculate_health_score()
 
         # Get key pattern analysis
-        pattern_analysis = self.key_pattern_analyzer.analyze(set(self.existing_keys.keys()))
+        pattern_analysis = self.key_patterns()
 
         json_report = {
             'metadata': {
                 'generated_at': datetime.now().isoformat(),
                 'version': '5.0',
                 'project': str(self.project_dir.name),
+                'source_hash': self.source_hash(),
+                'analysis': {'use_lexer': self.use_lexer, **self.discovery},
             },
             'health_score': health,
             'key_patterns': pattern_analysis,
             'component_stats': dict(self.component_stats),
-            'hardcoded_strings': self.hardcoded_strings,
+            'hardcoded_strings': self.scoped_hardcoded(),
             'duplicate_strings': {k: len(v) for k, v in self.duplicate_strings.items()},
+            'dead_keys': sorted(self.dead_keys),
+            'possibly_used_keys': dict(sorted(self.possibly_used_keys.items())),
+            'key_templates': dict(sorted(self.template_counts.items())),
+            'similar_strings': self.similar_strings,
         }
+        if self.scope is not None:
+            json_report['metadata']['scope'] = sorted(self.scope)
+        if self.target_summary is not None:
+            json_report['targets'] = self.target_summary
 
-        with open(self.project_dir / 'localization_report_v5.json', 'w', encoding='utf-8') as f:
+        with open(self.project_dir / REPORT_NAME, 'w', encoding='utf-8') as f:
             json.dump(json_report, f, indent=2, ensure_ascii=False)
 
-        print("   ✓ localization_report_v5.json oluşturuldu")
+        print(f"   ✓ {REPORT_NAME} oluşturuldu")
+
+    def _stream_result(self, stream: FindingsStream, result: FileAnalysis):
+        if self.scope is None or result.file in self.scope:
+            stream.write_file(result)
 
-    def run(self, use_threads: bool = True):
+    def run(
+        self,
+        parallel: bool = True,
+        workers: Optional[int] = None,
+        ndjson_path: Optional[Path] = None,
+        targets: Optional[Tuple[Target, ...]] = None
+    ):
         """Run complete analysis"""
         print("=" * 70)
         print(f"{Colors.BOLD}🚀 LifeStyles Localization Analyzer V5{Colors.ENDC}")
         print("=" * 70)
 
-        self.load_existing_keys()
-        self.find_swift_files()
-        self.analyze_all_files(use_threads=use_threads)
-        self.find_dead_keys()
-        self.analyze_duplicates()
-        self.generate_json_report()
+        stream = FindingsStream(ndjson_path, str(self.project_dir.name)) if ndjson_path else None
+
+        try:
+            self.load_existing_keys()
+            files = self.walker.walk() if self.scope is None else self.scoped_files()
+            self.analyze_all_files(
+                parallel=parallel, workers=workers, files=files,
+                on_result=(lambda result: self._stream_result(stream, result)) if stream else None
+            )
+            self.find_dead_keys()
+            self.analyze_duplicates()
+            self.find_similar_strings()
+            if targets:
+                self.target_summary = self.analyze_targets(targets)
+            self.generate_json_report()
+
+            if stream:
+                stream.close({
+                    'health_score': self.calculate_health_score(),
+                    'missing_keys': dict(self.missing_keys),
+                    'dead_keys': sorted(self.dead_keys),
+                    'possibly_used_keys': dict(sorted(self.possibly_used_keys.items())),
+                    'duplicate_strings': {k: len(v) for k, v in self.duplicate_strings.items()},
+                    'similar_strings': self.similar_strings,
+                })
+                print(f"   ✓ {ndjson_path} oluşturuldu ({stream.count} bulgu)")
+        finally:
+            # Interrupted runs leave the findings so far, without a summary
+            if stream:
+                stream.close()
 
         health = self.calculate_health_score()
 
@@ -1123,26 +3477,203 @@ class LocalizationAnalyzerV5:
         print(f"⚠️  Hardcoded: {health['hardcoded_count']} strings")
         print(f"🔴 Missing Keys: {health['missing_keys_count']}")
         print(f"🟡 Dead Keys: {health['dead_keys_count']}")
+        if self.possibly_used_keys:
+            print(f"🧩 Possibly Used (dynamic keys): {len(self.possibly_used_keys)}")
         print(f"📦 Duplicates: {health['duplicate_count']}")
+        print(f"🧬 Similar: {len(self.similar_strings)} clusters")
+        if self.scope is not None:
+            print(f"🎯 Kapsam: {len(self.scope)} değişen dosya, "
+                  f"{len(self.scoped_hardcoded())} hardcoded string")
+        if self.target_summary is not None:
+            self.print_target_summary()
         print("=" * 70)
 
 
-def create_backup(project_dir: Path) -> Path:
-    """Create backup of localization files and Swift files"""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    backup_dir = project_dir / f'localization_backup_{timestamp}'
-    backup_dir.mkdir(exist_ok=True)
+def _git(cwd: Path, *args: str) -> bytes:
+    """Run a git plumbing command and return its stdout"""
+    return subprocess.run(
+        ['git', *args], cwd=cwd, capture_output=True, check=True
+    ).stdout
+
+
+def _is_localization_input(path: str) -> bool:
+    return path.endswith('.swift') or path.endswith('Localizable.strings')
+
+
+def git_changed_files(
+    project_dir: Path,
+    since: Optional[str] = None,
+    staged: bool = False
+) -> Tuple[List[Path], List[Path], Dict[Path, str]]:
+    """
+    List .swift and Localizable.strings files touched by a change
+
+    --staged compares the index with HEAD; --since REF compares REF with
+    the working tree and includes untracked files.
+
+    Returns:
+        Tuple of (changed paths, deleted paths, staged blob content by
+        path), with paths relative to project_dir. The content map is
+        only filled for --staged.
+    """
+    top = Path(_git(project_dir, 'rev-parse', '--show-toplevel').decode().strip())
+
+    if staged:
+        diff = _git(project_dir, 'diff', '--cached', '--name-status', '-z', '--no-renames')
+    else:
+        diff = _git(project_dir, 'diff', since, '--name-status', '-z', '--no-renames', '--')
+
+    fields = diff.decode('utf-8').split('\0')
+    changed = []
+    deleted = []
+    for status, path in zip(fields[0::2], fields[1::2]):
+        if _is_localization_input(path):
+            (deleted if status == 'D' else changed).append(path)
+
+    if not staged:
+        untracked = _git(project_dir, 'ls-files', '--others', '--exclude-standard', '-z', '--full-name')
+        changed.extend(p for p in untracked.decode('utf-8').split('\0') if _is_localization_input(p))
+
+    def to_project(path: str) -> Path:
+        return project_dir / os.path.relpath(top / path, project_dir.resolve())
+
+    staged_content = {}
+    if staged:
+        for path in changed:
+            blob = _git(top, 'show', f':{path}')
+            staged_content[to_project(path)] = blob.decode('utf-8', errors='replace')
+
+    return [to_project(p) for p in changed], [to_project(p) for p in deleted], staged_content
+
+
+def load_current_report(project_dir: Path) -> Tuple[Optional[Dict], str]:
+    """
+    Read the saved JSON report if it still describes the project
+
+    The report's source_hash is recomputed from the files on disk with the
+    options the report was generated with; any edit to a Swift or
+    Localizable.strings file since then makes the report stale.
+
+    Returns:
+        Tuple of (report or None, reason it can't be used)
+    """
+    try:
+        with open(project_dir / REPORT_NAME, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    except FileNotFoundError:
+        return None, f"{REPORT_NAME} bulunamadı"
+    except (OSError, ValueError) as e:
+        return None, f"{REPORT_NAME} okunamadı: {e}"
+
+    metadata = report.get('metadata', {})
+    if 'source_hash' not in metadata or 'dead_keys' not in report:
+        return None, f"{REPORT_NAME} eski formatta (source hash yok)"
+
+    analyzer = LocalizationAnalyzerV5(project_dir, **metadata.get('analysis', {}))
+    if analyzer.current_source_hash() != metadata['source_hash']:
+        return None, f"{REPORT_NAME} güncel değil (kaynak dosyalar değişmiş)"
+    return report, ''
+
+
+def benchmark_front_ends(project_dir: Path):
+    """Compare the lexer-guarded and plain regex analysis paths on the tree"""
+    print(f"\n{Colors.BOLD}⏱️  FRONT-END BENCHMARK{Colors.ENDC}")
+    print("=" * 70)
+
+    results = {}
+    for label, use_lexer in [('regex', False), ('lexer', True)]:
+        analyzer = LocalizationAnalyzerV5(project_dir, use_lexer=use_lexer)
+        analyzer.find_swift_files()
+        start = time.perf_counter()
+        for file_path in analyzer.swift_files:
+            analyzer.analyze_file(file_path)
+        elapsed = time.perf_counter() - start
+        findings = {
+            (item['file'], item['line'], item.get('text', item.get('key')))
+            for item in analyzer.hardcoded_strings + analyzer.localized_usages
+        }
+        results[label] = findings
+        print(f"{label:>6}: {elapsed * 1000:8.1f} ms  "
+              f"({len(analyzer.swift_files)} files, "
+              f"{len(analyzer.hardcoded_strings)} hardcoded, "
+              f"{len(analyzer.localized_usages)} localized)")
+
+    dropped = results['regex'] - results['lexer']
+    print(f"\nFindings only on the regex path (comments/strings/previews): {len(dropped)}")
+    for file_name, line_num, text in sorted(dropped)[:20]:
+        print(f"   {file_name}:{line_num}  \"{text}\"")
+    if len(dropped) > 20:
+        print(f"   ... and {len(dropped) - 20} more")
+    print("=" * 70)
+
 
-    print(f"\n💾 Creating backup: {backup_dir.name}")
+def create_backup(project_dir: Path) -> BackupRun:
+    """Start a backup run holding the localization files; Swift files join it as they are fixed"""
+    store = BackupStore(project_dir)
+    run = store.begin('analyzer')
+
+    print(f"\n💾 Creating backup: {run.run_id}")
 
     # Backup .strings files
     strings_dir = project_dir / 'LifeStyles/Resources'
     if strings_dir.exists():
-        shutil.copytree(strings_dir, backup_dir / 'Resources', dirs_exist_ok=True)
-        print(f"   ✓ Backed up Resources/")
+        count = run.add_tree(strings_dir)
+        print(f"   ✓ Backed up Resources/ ({count} dosya, {run.new_objects} yeni)")
 
+    run.save()
     print(f"   ✓ Backup created successfully")
-    return backup_dir
+    return run
+
+
+def print_backup_info(run: BackupRun):
+    """Tell the user how to undo this run"""
+    print(f"\n💾 Backup saved: {run.run_id} ({len(run.files)} dosya)")
+    print(f"   To restore: python analyze_localization_v5.py --restore {run.run_id}")
+
+
+def query_usage_index(project_dir: Path, where: Optional[str] = None, keys_in: Optional[str] = None) -> bool:
+    """Answer --where / --keys-in from the persisted index; returns success"""
+    start = time.perf_counter()
+    index = UsageIndex.load(project_dir)
+    if index is None:
+        print(f"{Colors.FAIL}❌ Kullanım indeksi yok: {UsageIndex(project_dir).index_file}{Colors.ENDC}")
+        print("   Önce analizi çalıştırın: python analyze_localization_v5.py")
+        return False
+
+    files = set()
+    found = True
+    if where is not None:
+        matches = index.where(where)
+        if not matches:
+            print(f"{Colors.WARNING}🔎 {where}: kodda kullanılmıyor{Colors.ENDC}")
+            found = False
+        for key, usages in matches.items():
+            print(f"\n{Colors.BOLD}🔎 {key}{Colors.ENDC} ({len(usages)} kullanım)")
+            for relative_path, line, component in usages:
+                print(f"   {relative_path}:{line}  {Colors.OKCYAN}{component}{Colors.ENDC}")
+                files.add(relative_path)
+
+    if keys_in is not None:
+        paths = index.resolve_file(keys_in)
+        if not paths:
+            print(f"{Colors.WARNING}📄 {keys_in}: indekste yok{Colors.ENDC}")
+            found = False
+        for relative_path in paths:
+            usages = sorted(index.files[relative_path]['usages'], key=lambda usage: usage[1])
+            print(f"\n{Colors.BOLD}📄 {relative_path}{Colors.ENDC} "
+                  f"({len({usage[0] for usage in usages})} key, {len(usages)} kullanım)")
+            for key, line, component in usages:
+                print(f"   {line:>5}  {key}  {Colors.OKCYAN}{component}{Colors.ENDC}")
+            files.add(relative_path)
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    stale = index.stale_files(sorted(files))
+    if stale:
+        print(f"\n{Colors.WARNING}⚠️  İndeksten sonra değişen dosyalar (yeniden analiz edin):{Colors.ENDC}")
+        for relative_path in stale:
+            print(f"   {relative_path}")
+    print(f"\n⏱️  {elapsed_ms:.1f} ms (indeks: {index.updated_at})")
+    return found
 
 
 def main():
@@ -1158,6 +3689,16 @@ Examples:
   %(prog)s --fix-duplicates         # Fix duplicates only
   %(prog)s --watch                  # Watch mode
   %(prog)s --auto-fix --dry-run     # Preview changes
+  %(prog)s --benchmark              # Lexer vs regex timing
+  %(prog)s --list-backups           # List backup runs
+  %(prog)s --restore latest         # Restore the files of a backup run
+  %(prog)s --since origin/main      # Only files changed since a ref
+  %(prog)s --staged                 # Only files staged for commit
+  %(prog)s --ndjson findings.ndjson # Stream findings as they are found
+  %(prog)s --remove-dead-keys       # Analyze and remove dead keys in one pass
+  %(prog)s --targets                # Per-target (app, widgets) health and shared keys
+  %(prog)s --where button.save      # Where a key is used (from the usage index)
+  %(prog)s --keys-in SettingsView.swift  # Keys used by a file
 
   # Language management
   %(prog)s --list-languages         # List all languages
@@ -1173,16 +3714,53 @@ Examples:
                         help='Interactive mode - review each fix')
     parser.add_argument('--fix-duplicates', action='store_true',
                         help='Automatically fix duplicate strings')
+    parser.add_argument('--remove-dead-keys', action='store_true',
+                        help='Remove dead keys from every language right after the analysis')
     parser.add_argument('--watch', action='store_true',
                         help='Watch mode - monitor files for changes')
+    parser.add_argument('--watch-backend', choices=['auto', *WATCH_BACKENDS], default='auto',
+                        help='File watching backend for --watch (default: fastest available)')
     parser.add_argument('--dry-run', action='store_true',
                         help='Preview changes without applying')
     parser.add_argument('--no-backup', action='store_true',
                         help='Skip backup creation')
+    parser.add_argument('--list-backups', action='store_true',
+                        help=f'List backup runs in {BackupStore.DIR_NAME}/')
+    parser.add_argument('--restore', metavar='RUN',
+                        help="Restore files from a backup run (id, unique prefix or 'latest')")
     parser.add_argument('--no-threads', action='store_true',
-                        help='Disable multi-threading')
+                        help='Disable parallel analysis and auto-fix')
+    parser.add_argument('--workers', type=int, default=None, metavar='N',
+                        help='Workers for analysis and auto-fix (default: CPU count)')
     parser.add_argument('--min-priority', type=int, default=8,
                         help='Minimum priority for auto-fix (default: 8)')
+    parser.add_argument('--no-lexer', action='store_true',
+                        help='Match patterns on raw source (also inside comments and strings)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Reanalyze every file, ignoring .locanalyzer_cache/')
+    parser.add_argument('--clear-cache', action='store_true',
+                        help='Delete .locanalyzer_cache/ before analysis')
+    parser.add_argument('--include', action='append', metavar='GLOB',
+                        help='Only analyze Swift files matching GLOB (repeatable)')
+    parser.add_argument('--exclude', action='append', metavar='GLOB',
+                        help='Skip Swift files matching GLOB (repeatable)')
+    parser.add_argument('--no-gitignore', action='store_true',
+                        help='Also analyze files ignored by .gitignore')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Compare lexer and plain regex analysis on the project')
+    parser.add_argument('--where', metavar='KEY',
+                        help='List usages of KEY (or a glob like button.*) from the usage index, without rescanning')
+    parser.add_argument('--keys-in', metavar='FILE',
+                        help='List keys used by FILE (path or unique suffix) from the usage index')
+    parser.add_argument('--targets', action='store_true',
+                        help='Also report the app and widget targets separately, each against its own catalog')
+    parser.add_argument('--ndjson', type=Path, metavar='PATH',
+                        help='Also stream findings as JSON lines to PATH while analyzing')
+    scope_group = parser.add_mutually_exclusive_group()
+    scope_group.add_argument('--since', metavar='REF',
+                             help='Only report files changed since git REF (rest of tree from cache)')
+    scope_group.add_argument('--staged', action='store_true',
+                             help='Only report files staged in git, analyzing the staged content')
 
     # Language management arguments
     parser.add_argument('--add-language', type=str, metavar='CODE',
@@ -1193,12 +3771,29 @@ Examples:
                         help='List all available languages')
     parser.add_argument('--empty-strings', action='store_true',
                         help='Create empty strings file (use with --add-language)')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Do not prefill new values from existing translations')
 
     args = parser.parse_args()
 
     project_dir = Path('.')
     resources_dir = project_dir / 'LifeStyles/Resources'
 
+    # Usage index queries
+    if args.where or args.keys_in:
+        if not query_usage_index(project_dir, where=args.where, keys_in=args.keys_in):
+            sys.exit(1)
+        return
+
+    # Backup store
+    if args.list_backups:
+        print_runs(BackupStore(project_dir))
+        return
+    if args.restore:
+        if not restore_run(BackupStore(project_dir), args.restore, dry_run=args.dry_run):
+            sys.exit(1)
+        return
+
     # Language management mode
     if args.list_languages or args.add_language:
         lang_manager = LanguageManager(resources_dir)
@@ -1230,7 +3825,8 @@ Examples:
                 lang_code=args.add_language,
                 source_lang=args.source_lang,
                 empty=args.empty_strings,
-                dry_run=args.dry_run
+                dry_run=args.dry_run,
+                use_memory=not args.no_memory
             )
 
             if not success:
@@ -1238,34 +3834,92 @@ Examples:
 
             return
 
+    if args.benchmark:
+        benchmark_front_ends(project_dir)
+        return
+
+    use_lexer = not args.no_lexer
+    discovery = {
+        'include_globs': args.include,
+        'exclude_globs': args.exclude,
+        'respect_gitignore': not args.no_gitignore,
+    }
+
     # Watch mode
     if args.watch:
-        watch = WatchMode(project_dir, lambda: LocalizationAnalyzerV5(project_dir))
+        watch = WatchMode(project_dir, lambda: LocalizationAnalyzerV5(
+            project_dir, use_lexer=use_lexer, use_cache=not args.no_cache, **discovery
+        ), backend=args.watch_backend)
         watch.start()
         return
 
+    if args.clear_cache:
+        shutil.rmtree(project_dir / AnalysisCache.DIR_NAME, ignore_errors=True)
+        print(f"🧹 {AnalysisCache.DIR_NAME}/ temizlendi")
+
     # Run analysis
-    analyzer = LocalizationAnalyzerV5(project_dir)
-    analyzer.run(use_threads=not args.no_threads)
+    analyzer = LocalizationAnalyzerV5(
+        project_dir, use_lexer=use_lexer, use_cache=not args.no_cache, **discovery
+    )
+    if args.since or args.staged:
+        if args.staged and (args.auto_fix or args.fix_duplicates or args.interactive or args.remove_dead_keys):
+            print(f"{Colors.FAIL}❌ --staged analyzes index content; fixes would target the working tree{Colors.ENDC}")
+            sys.exit(1)
+        try:
+            changed, deleted, staged_content = git_changed_files(
+                project_dir, since=args.since, staged=args.staged
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            stderr = getattr(e, 'stderr', b'') or b''
+            print(f"{Colors.FAIL}❌ git hatası: {stderr.decode(errors='replace').strip() or e}{Colors.ENDC}")
+            sys.exit(1)
+        analyzer.set_scope(changed, deleted, staged_content)
+    analyzer.run(
+        parallel=not args.no_threads, workers=args.workers, ndjson_path=args.ndjson,
+        targets=TARGETS if args.targets else None
+    )
 
-    # Create backup if needed
-    backup_dir = None
-    if (args.auto_fix or args.fix_duplicates or args.interactive) and not args.no_backup and not args.dry_run:
-        backup_dir = create_backup(project_dir)
+    # Dead keys straight from this analysis, no report round trip
+    if args.remove_dead_keys:
+        print()
+        DeadKeyRemover(dry_run=args.dry_run, backup=not args.no_backup, analyzer=analyzer).run()
+        return
+
+    fixing = args.auto_fix or args.fix_duplicates or args.interactive
+
+    # Translation memory from every loaded language plus the string catalogs
+    memory = None
+    if fixing and not args.no_memory:
+        start = time.perf_counter()
+        memory = TranslationMemory.from_resources(resources_dir, keys=analyzer.existing_keys)
+        print(f"\n🧠 Çeviri belleği: {len(memory)} birim ({(time.perf_counter() - start) * 1000:.0f} ms)")
 
     # Initialize managers
     strings_manager = StringsFileManager(
-        analyzer.localization_files[0],
-        analyzer.localization_files[1]
+        analyzer.localization_files, catalog=analyzer.catalog, memory=memory
     )
-    strings_manager.load()
+    if not strings_manager.load() and fixing:
+        # New keys would be appended to a file that no longer parses
+        print(f"{Colors.FAIL}❌ .strings dosyası bozuk, düzeltme yapılmadı{Colors.ENDC}")
+        sys.exit(1)
 
-    auto_fixer = AutoFixer(strings_manager, dry_run=args.dry_run)
+    # Create backup if needed
+    backup = None
+    if fixing and not args.no_backup and not args.dry_run:
+        backup = create_backup(project_dir)
+
+    auto_fixer = AutoFixer(
+        strings_manager, dry_run=args.dry_run, workers=1 if args.no_threads else args.workers,
+        backup=backup
+    )
 
     # Interactive mode
     if args.interactive:
         cli = InteractiveCLI(analyzer, auto_fixer)
-        cli.run()
+        with strings_manager.transaction():
+            cli.run()
+        if backup:
+            print_backup_info(backup)
         return
 
     # Auto-fix mode
@@ -1277,25 +3931,31 @@ Examples:
             print(f"{Colors.WARNING}[DRY RUN - No changes will be made]{Colors.ENDC}\n")
 
         high_priority = [
-            item for item in analyzer.hardcoded_strings
+            item for item in analyzer.scoped_hardcoded()
             if item['priority'] >= args.min_priority
         ]
 
         print(f"Found {len(high_priority)} high-priority strings to fix\n")
 
-        for item in high_priority:
-            auto_fixer.fix_hardcoded_string(
-                project_dir / item['file'],
-                item['line'],
-                item['text'],
-                item['component'],
-                item['suggested_key']
-            )
+        with strings_manager.transaction():
+            for item in high_priority:
+                auto_fixer.plan_fix(
+                    project_dir / item['file'],
+                    item['line'],
+                    item['text'],
+                    item['component'],
+                    item['suggested_key'],
+                    column=item.get('column')
+                )
+            auto_fixer.apply_plan()
 
         stats = auto_fixer.get_stats()
         print(f"\n{Colors.OKGREEN}✅ Auto-fix complete{Colors.ENDC}")
         print(f"   Applied: {stats['applied']}")
         print(f"   Failed: {stats['failed']}")
+        print(f"   Conflicts: {stats['conflicts']}")
+        if memory is not None:
+            print(f"   Prefilled from memory: {strings_manager.memory_fills}")
 
     # Fix duplicates
     if args.fix_duplicates:
@@ -1306,40 +3966,42 @@ Examples:
 
         # Sort by frequency
         sorted_dups = sorted(
-            analyzer.duplicate_strings.items(),
+            analyzer.scoped_duplicates().items(),
             key=lambda x: len(x[1]),
             reverse=True
         )
 
         print(f"Found {len(sorted_dups)} duplicate strings\n")
 
-        for text, locations in sorted_dups:
-            if len(locations) < 2:
-                continue
+        with strings_manager.transaction():
+            for text, locations in sorted_dups:
+                # Use the first location's suggested key
+                key = locations[0]['suggested_key']
+                print(f"\nFixing duplicate: \"{text}\" ({len(locations)} occurrences)")
+                print(f"Using key: {key}")
 
-            # Use the first location's suggested key
-            key = locations[0]['suggested_key']
-            print(f"\nFixing duplicate: \"{text}\" ({len(locations)} occurrences)")
-            print(f"Using key: {key}")
-
-            for item in locations:
-                auto_fixer.fix_hardcoded_string(
-                    project_dir / item['file'],
-                    item['line'],
-                    item['text'],
-                    item['component'],
-                    key
-                )
+                for item in locations:
+                    auto_fixer.plan_fix(
+                        project_dir / item['file'],
+                        item['line'],
+                        item['text'],
+                        item['component'],
+                        key,
+                        column=item.get('column')
+                    )
+            auto_fixer.apply_plan()
 
         stats = auto_fixer.get_stats()
         print(f"\n{Colors.OKGREEN}✅ Duplicate fix complete{Colors.ENDC}")
         print(f"   Applied: {stats['applied']}")
         print(f"   Failed: {stats['failed']}")
+        print(f"   Conflicts: {stats['conflicts']}")
+        if memory is not None:
+            print(f"   Prefilled from memory: {strings_manager.memory_fills}")
 
     # Show backup info
-    if backup_dir:
-        print(f"\n💾 Backup saved to: {backup_dir}")
-        print(f"   To restore: cp -r {backup_dir}/Resources/* LifeStyles/Resources/")
+    if backup:
+        print_backup_info(backup)
 
 
 if __name__ == '__main__':
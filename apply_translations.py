@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Bulk Translation Applier
+========================
+
+Writes a translation table into one language's Localizable.strings. The
+target file is tokenized once and every value is looked up in the table
+while the file is rewritten in a single pass, so applying 1500 keys costs
+the same as applying one. Files are replaced atomically.
+
+Tables are JSON objects ({"key": "value"}) or TSV files with one
+`key<TAB>value` per line; in TSV, empty lines and lines starting with #
+are skipped and .strings escapes (\\n, \\t, \\", \\\\) are decoded.
+
+Usage:
+    python apply_translations.py es translations_es.tsv
+    python apply_translations.py de translations_de.json --dry-run
+
+    from apply_translations import apply_translations
+    result = apply_translations(Path('LifeStyles/Resources/es.lproj/Localizable.strings'), table)
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from backup_store import BackupRun, BackupStore
+from strings_parser import StringsSyntaxError, escape, parse_strings, read_strings_bytes, unescape
+
+
+class ApplyResult(NamedTuple):
+    """Outcome of applying a table to one file"""
+    updated: List[str]    # Keys whose value changed, in file order
+    unchanged: int        # Keys already carrying the table's value
+    not_found: List[str]  # Table keys missing from the file, sorted
+
+
+def load_translation_table(path: Path) -> Dict[str, str]:
+    """Read a JSON or TSV translation table"""
+    if path.suffix.lower() == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            table = json.load(f)
+        if not isinstance(table, dict) or not all(isinstance(v, str) for v in table.values()):
+            raise ValueError(f"{path}: expected a JSON object of key -> string")
+        return table
+
+    table = {}
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.rstrip('\r\n')
+            if not line.strip() or line.startswith('#'):
+                continue
+            key, sep, value = line.partition('\t')
+            if not sep:
+                raise ValueError(f"{path}:{line_number}: expected key<TAB>value")
+            table[key] = unescape(value)
+    return table
+
+
+def apply_translations(
+    file_path: Path,
+    translations: Dict[str, str],
+    dry_run: bool = False,
+    backup: Optional[BackupRun] = None
+) -> ApplyResult:
+    """
+    Replace the values of every translated key in one pass
+
+    Comments, ordering and untranslated entries are left byte-for-byte
+    intact. Raises StringsSyntaxError if the file can't be tokenized.
+    """
+    content = read_strings_bytes(file_path)
+
+    pieces = []
+    pos = 0
+    updated = {}
+    unchanged = 0
+    seen = set()
+    for entry in parse_strings(content):
+        translation = translations.get(entry.key)
+        if translation is None:
+            continue
+        seen.add(entry.key)
+
+        start, end = entry.value_span
+        new_value = escape(translation).encode('utf-8')
+        if content[start:end] == new_value:
+            unchanged += 1
+            continue
+        pieces.append(content[pos:start])
+        pieces.append(new_value)
+        pos = end
+        updated[entry.key] = None
+    pieces.append(content[pos:])
+
+    if updated and not dry_run:
+        if backup is not None:
+            backup.add(file_path)
+        tmp_path = file_path.with_name(f'.{file_path.name}.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(b''.join(pieces))
+        shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+
+    return ApplyResult(list(updated), unchanged, sorted(set(translations) - seen))
+
+
+def print_result(result: ApplyResult, total: int, dry_run: bool = False):
+    """Summary in the style of the translate_* scripts"""
+    for key in result.updated:
+        print(f"✅ {key}")
+
+    print(f"\n{'='*60}")
+    verb = 'Güncellenecek' if dry_run else 'Güncellenen'
+    print(f"✅ {verb}: {len(result.updated)}/{total}")
+    if result.unchanged:
+        print(f"➖ Zaten güncel: {result.unchanged}")
+
+    if result.not_found:
+        print(f"\n⚠️  Bulunamayan key'ler ({len(result.not_found)}):")
+        for key in result.not_found[:15]:
+            print(f"   - {key}")
+        if len(result.not_found) > 15:
+            print(f"   ... ve {len(result.not_found) - 15} key daha")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Apply a translation table to a Localizable.strings file')
+    parser.add_argument('lang', help='Language code (e.g. es, de)')
+    parser.add_argument('table', type=Path, help='Translation table (.json or .tsv)')
+    parser.add_argument('--resources', type=Path, default=Path('LifeStyles/Resources'),
+                        help='Directory containing the *.lproj folders')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would change')
+    parser.add_argument('--no-backup', action='store_true', help='Skip backup creation')
+    args = parser.parse_args()
+
+    file_path = args.resources / f'{args.lang}.lproj' / 'Localizable.strings'
+    if not file_path.exists():
+        print(f"❌ File not found: {file_path}")
+        sys.exit(1)
+
+    try:
+        translations = load_translation_table(args.table)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"📁 Dosya: {file_path}")
+    print(f"📝 Çeviri sayısı: {len(translations)}\n")
+
+    backup = None
+    if not (args.dry_run or args.no_backup):
+        backup = BackupStore(Path('.')).begin('apply_translations', note=str(args.table))
+    try:
+        result = apply_translations(file_path, translations, dry_run=args.dry_run, backup=backup)
+    except StringsSyntaxError as e:
+        print(f"❌ {file_path}: {e}")
+        sys.exit(1)
+    finally:
+        if backup is not None:
+            backup.save()
+
+    print_result(result, len(translations), dry_run=args.dry_run)
+    if backup is not None and backup.files:
+        print(f"\n💾 Backup: {backup.run_id} ({BackupStore.DIR_NAME}/)")
+
+
+if __name__ == '__main__':
+    main()
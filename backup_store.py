@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Localization Backup Store
+=========================
+
+Content-addressed backups shared by the localization scripts. Every file
+version is stored once under its SHA-256 in .localization_backups/objects/;
+each run (auto-fix, dead key removal, ...) only adds a small manifest that
+maps project-relative paths to hashes. Backing up the same 5k-line
+Localizable.strings twenty times costs one copy.
+
+Usage:
+    store = BackupStore(Path('.'))
+    run = store.begin('auto-fix')
+    run.add(Path('LifeStyles/Resources/tr.lproj/Localizable.strings'))
+    run.save()
+
+    python backup_store.py --list
+    python backup_store.py --restore 20251106_140211
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+class BackupRun:
+    """Files captured by one run; each path keeps its first (pre-change) version"""
+
+    def __init__(self, store: 'BackupStore', run_id: str, tool: str, note: str = ''):
+        self.store = store
+        self.run_id = run_id
+        self.tool = tool
+        self.note = note
+        self.created = datetime.now().isoformat(timespec='seconds')
+        self.files = {}  # relative path -> {sha256, size, mode}
+        self.new_objects = 0
+        self._lock = threading.Lock()
+
+    def add(self, path: Path) -> bool:
+        """Capture a file before it is modified (thread-safe, once per path)"""
+        rel = self.store.relative(path)
+        with self._lock:
+            if rel in self.files:
+                return False
+        try:
+            data = path.read_bytes()
+            mode = path.stat().st_mode & 0o777
+        except OSError:
+            return False
+
+        digest, created = self.store.put(data)
+        with self._lock:
+            if rel in self.files:
+                return False
+            self.files[rel] = {'sha256': digest, 'size': len(data), 'mode': mode}
+            self.new_objects += created
+        return True
+
+    def add_tree(self, directory: Path) -> int:
+        """Capture every file below a directory"""
+        count = 0
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for name in sorted(files):
+                count += self.add(Path(root) / name)
+        return count
+
+    def save(self):
+        """Write (or rewrite) this run's manifest"""
+        if not self.files:
+            self.store.discard(self.run_id)
+            return
+        with self._lock:
+            manifest = {
+                'run': self.run_id,
+                'created': self.created,
+                'tool': self.tool,
+                'note': self.note,
+                'files': dict(sorted(self.files.items())),
+            }
+        self.store.write_manifest(self.run_id, manifest)
+
+
+class BackupStore:
+    """Deduplicated object store plus one manifest per run"""
+
+    DIR_NAME = '.localization_backups'
+
+    def __init__(self, project_dir: Path):
+        self.project_dir = project_dir
+        self.root = project_dir / self.DIR_NAME
+        self.objects_dir = self.root / 'objects'
+        self.manifests_dir = self.root / 'manifests'
+
+    def relative(self, path: Path) -> str:
+        return os.path.relpath(path, self.project_dir)
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def put(self, data: bytes):
+        """Store content once; returns (sha256, whether it was new)"""
+        digest = hashlib.sha256(data).hexdigest()
+        object_path = self._object_path(digest)
+        if object_path.exists():
+            return digest, False
+        self._write_atomic(object_path, data)
+        return digest, True
+
+    def begin(self, tool: str, note: str = '') -> BackupRun:
+        """Start a new run with a unique, sortable id"""
+        base = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+        run_id = base
+        suffix = 1
+        while True:
+            # O_EXCL reserves the id so a concurrent run can't take it
+            try:
+                fd = os.open(self.manifests_dir / f'{run_id}.json', os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                suffix += 1
+                run_id = f'{base}_{suffix}'
+                continue
+            os.write(fd, b'{}')
+            os.close(fd)
+            return BackupRun(self, run_id, tool, note)
+
+    def discard(self, run_id: str):
+        """Drop the reservation of a run that captured nothing"""
+        (self.manifests_dir / f'{run_id}.json').unlink(missing_ok=True)
+
+    def write_manifest(self, run_id: str, manifest: Dict):
+        data = json.dumps(manifest, indent=1, ensure_ascii=False).encode('utf-8')
+        self._write_atomic(self.manifests_dir / f'{run_id}.json', data)
+
+    def run_ids(self) -> List[str]:
+        """All run ids, oldest first (directory listing only)"""
+        if not self.manifests_dir.exists():
+            return []
+        return sorted(
+            entry.name[:-5] for entry in os.scandir(self.manifests_dir)
+            if entry.name.endswith('.json') and not entry.name.startswith('.')
+        )
+
+    def load_manifest(self, run_id: str) -> Optional[Dict]:
+        try:
+            with open(self.manifests_dir / f'{run_id}.json', 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return manifest if manifest.get('files') else None
+
+    def resolve(self, run: str) -> Optional[str]:
+        """Run id from an exact id, a unique prefix or 'latest'"""
+        run_ids = [run_id for run_id in self.run_ids() if self.load_manifest(run_id)]
+        if run == 'latest':
+            return run_ids[-1] if run_ids else None
+        if run in run_ids:
+            return run
+        matches = [run_id for run_id in run_ids if run_id.startswith(run)]
+        return matches[0] if len(matches) == 1 else None
+
+    def list_runs(self) -> List[Dict]:
+        """Summaries of every complete run, oldest first"""
+        runs = []
+        for run_id in self.run_ids():
+            manifest = self.load_manifest(run_id)
+            if manifest is None:
+                continue
+            runs.append({
+                'run': run_id,
+                'created': manifest.get('created', ''),
+                'tool': manifest.get('tool', ''),
+                'note': manifest.get('note', ''),
+                'files': len(manifest['files']),
+                'bytes': sum(entry['size'] for entry in manifest['files'].values()),
+            })
+        return runs
+
+    def store_size(self) -> int:
+        """Bytes actually used by stored objects"""
+        total = 0
+        for root, _, files in os.walk(self.objects_dir):
+            for name in files:
+                total += os.path.getsize(os.path.join(root, name))
+        return total
+
+    def restore(self, run_id: str, dry_run: bool = False) -> List[str]:
+        """
+        Put every file of a run back in place
+
+        The current versions are backed up as a new 'restore' run first,
+        so a restore can itself be undone.
+        """
+        manifest = self.load_manifest(run_id)
+        if manifest is None:
+            raise KeyError(run_id)
+
+        changed = []
+        for rel, entry in manifest['files'].items():
+            target = self.project_dir / rel
+            try:
+                current = hashlib.sha256(target.read_bytes()).hexdigest()
+            except OSError:
+                current = None
+            if current != entry['sha256']:
+                changed.append(rel)
+        if dry_run or not changed:
+            return changed
+
+        undo = self.begin('restore', note=f'before restoring {run_id}')
+        for rel in changed:
+            undo.add(self.project_dir / rel)
+        undo.save()
+
+        for rel in changed:
+            entry = manifest['files'][rel]
+            data = self._object_path(entry['sha256']).read_bytes()
+            if hashlib.sha256(data).hexdigest() != entry['sha256']:
+                raise ValueError(f"corrupt backup object for {rel}")
+            target = self.project_dir / rel
+            self._write_atomic(target, data)
+            os.chmod(target, entry.get('mode', 0o644))
+        return changed
+
+
+def print_runs(store: BackupStore):
+    """Print the backup run table"""
+    runs = store.list_runs()
+    if not runs:
+        print("📭 Henüz yedek yok")
+        return
+
+    print(f"\n💾 YEDEKLER ({store.root})")
+    print("=" * 70)
+    for run in runs:
+        note = f"  {run['note']}" if run['note'] else ''
+        print(f"   {run['run']:<18} {run['tool']:<16} {run['files']:>4} dosya "
+              f"{run['bytes'] / 1024:>8.0f} KB{note}")
+    logical = sum(run['bytes'] for run in runs)
+    print("=" * 70)
+    print(f"   {len(runs)} yedek, {logical / 1024:.0f} KB içerik, "
+          f"diskte {store.store_size() / 1024:.0f} KB")
+
+
+def restore_run(store: BackupStore, run: str, dry_run: bool = False) -> bool:
+    """CLI restore with messages; returns success"""
+    run_id = store.resolve(run)
+    if run_id is None:
+        print(f"❌ Yedek bulunamadı veya birden fazla eşleşme var: {run}")
+        print("   python analyze_localization_v5.py --list-backups")
+        return False
+
+    changed = store.restore(run_id, dry_run=dry_run)
+    if not changed:
+        print(f"✅ {run_id}: dosyalar zaten bu yedekle aynı")
+        return True
+
+    verb = 'Geri yüklenecek' if dry_run else 'Geri yüklendi'
+    print(f"\n♻️  {run_id} - {verb}: {len(changed)} dosya")
+    for rel in changed:
+        print(f"   {rel}")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Localization backup store')
+    parser.add_argument('--list', action='store_true', help='List backup runs')
+    parser.add_argument('--restore', metavar='RUN', help="Restore a run (id, unique prefix or 'latest')")
+    parser.add_argument('--dry-run', action='store_true', help='Show what --restore would change')
+    args = parser.parse_args()
+
+    store = BackupStore(Path('.'))
+    if args.restore:
+        sys.exit(0 if restore_run(store, args.restore, dry_run=args.dry_run) else 1)
+    print_runs(store)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,59 +2,54 @@
 """
 Dead Key Remover - Kullanılmayan localization key'lerini temizler
 V2.0 - Enhanced with backup, dry-run, and multi-language support
+
+Dead keys come from localization_report_v5.json only while its source hash
+matches the project; otherwise the analyzer runs in this process first.
 """
 
-import json
-import re
+import os
 import sys
-import shutil
+import time
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Set
+from typing import List, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import argparse
 
+from backup_store import BackupStore
+from strings_parser import StringsEntry, StringsSyntaxError, parse_strings, read_strings_bytes
+
 class DeadKeyRemover:
     """Dead key removal with safety features"""
 
-    def __init__(self, dry_run: bool = False, backup: bool = True):
+    def __init__(self, dry_run: bool = False, backup: bool = True, analyzer=None):
         self.dry_run = dry_run
         self.backup = backup
+        self.backup_run = None
         self.resources_path = Path('LifeStyles/Resources')
-        self.report_files = [
-            'localization_report_v5.json',
-            'localization_report_v4.json',
-            'localization_report.json'
-        ]
-
-    def find_report(self) -> Path:
-        """Find most recent report file"""
-        for report in self.report_files:
-            if Path(report).exists():
-                return Path(report)
-        return None
-
-    def load_dead_keys(self) -> List[str]:
-        """Load dead keys from report"""
-        report_path = self.find_report()
-
-        if not report_path:
-            print("❌ No localization report found!")
-            print("💡 Run analyzer first:")
-            print("   python3 analyze_localization_v5.py")
-            sys.exit(1)
+        # LocalizationAnalyzerV5 that already ran in this process, if any
+        self.analyzer = analyzer
 
-        print(f"📄 Using report: {report_path.name}\n")
+    def load_dead_keys(self) -> Optional[List[str]]:
+        """Dead keys from the saved report, or None if it is missing or stale"""
+        from analyze_localization_v5 import REPORT_NAME, load_current_report
 
-        with open(report_path, 'r') as f:
-            data = json.load(f)
+        report, reason = load_current_report(Path('.'))
+        if report is None:
+            print(f"⚠️  {reason}")
+            return None
 
-        dead_keys = data.get('dead_keys', [])
+        print(f"📄 Using report: {REPORT_NAME} (source hash OK)\n")
+        return report['dead_keys']
 
-        if not dead_keys:
-            print("✅ No dead keys found!")
-            sys.exit(0)
+    def analyze_in_process(self):
+        """Run the analyzer here so its dead keys and catalog can be used directly"""
+        from analyze_localization_v5 import LocalizationAnalyzerV5
 
-        return dead_keys
+        print("🔄 Analiz bu süreçte çalıştırılıyor...\n")
+        analyzer = LocalizationAnalyzerV5(Path('.'), use_cache=True)
+        analyzer.run()
+        print()
+        return analyzer
 
     def find_strings_files(self) -> List[Path]:
         """Find all .strings files"""
@@ -62,7 +57,7 @@ class DeadKeyRemover:
             print(f"❌ Resources path not found: {self.resources_path}")
             sys.exit(1)
 
-        strings_files = list(self.resources_path.glob('*.lproj/Localizable.strings'))
+        strings_files = sorted(self.resources_path.glob('*.lproj/Localizable.strings'))
 
         if not strings_files:
             print("❌ No .strings files found!")
@@ -71,64 +66,84 @@ class DeadKeyRemover:
         return strings_files
 
     def create_backup(self, file_path: Path):
-        """Create backup of file"""
-        if not self.backup or self.dry_run:
+        """Add file to this run's backup (content stored once in the backup store)"""
+        if self.backup_run is None:
             return
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_dir = Path(f'localization_backup_{timestamp}')
-        backup_dir.mkdir(exist_ok=True)
-
-        backup_path = backup_dir / file_path.name
-        shutil.copy2(file_path, backup_path)
-        print(f"   💾 Backup: {backup_path}")
-
-    def remove_dead_keys_from_file(self, file_path: Path, dead_keys: List[str]) -> int:
-        """Remove dead keys from a single file"""
-        print(f"\n🧹 Processing: {file_path.parent.name}/{file_path.name}")
-
-        # Create backup
-        self.create_backup(file_path)
-
-        # Read file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        # Process lines
-        new_lines = []
-        removed_count = 0
-        removed_keys = []
+        self.backup_run.add(file_path)
+
+    @staticmethod
+    def _removal_range(content: bytes, entry: StringsEntry) -> Tuple[int, int]:
+        """Byte range covering the entry's own line(s) and its comment"""
+        start = entry.span[0]
+        if entry.comment_span is not None:
+            # The comment belongs to the entry if it sits on the line(s) right above it
+            between = content[entry.comment_span[1]:start]
+            if not between.strip() and between.count(b'\n') <= 1:
+                start = entry.comment_span[0]
+
+        # Whole lines: leading indentation and the trailing newline go too
+        start = content.rfind(b'\n', 0, start) + 1
+        end = content.find(b'\n', entry.span[1])
+        end = len(content) if end == -1 else end + 1
+
+        # Don't leave two blank lines where an isolated entry used to be
+        if content[max(0, start - 2):start] == b'\n\n' and content[end:end + 1] == b'\n':
+            end += 1
+        return start, end
+
+    def remove_dead_keys_from_file(self, file_path: Path, dead_keys: Set[str]) -> Tuple[int, List[str]]:
+        """
+        Remove dead keys from a single file
 
-        for line in lines:
-            is_dead = False
+        Each entry's key is parsed once and looked up in the set, so the
+        cost is linear in the file size. Output is returned as lines so
+        files can be processed in parallel and printed in order.
+        """
+        messages = [f"\n🧹 Processing: {file_path.parent.name}/{file_path.name}"]
 
-            # Check if line contains a dead key
-            for key in dead_keys:
-                # Match pattern: "key" = "value";
-                if f'"{key}"' in line and '=' in line:
-                    is_dead = True
-                    removed_count += 1
-                    removed_keys.append(key)
-                    if not self.dry_run:
-                        print(f"   ❌ {key}")
-                    break
+        content = read_strings_bytes(file_path)
+        try:
+            entries = list(parse_strings(content))
+        except StringsSyntaxError as e:
+            messages.append(f"   ❌ Parse error, skipped: {e}")
+            return 0, messages
 
-            if not is_dead:
-                new_lines.append(line)
+        removed_keys = [entry.key for entry in entries if entry.key in dead_keys]
+        if not removed_keys:
+            messages.append("   ✅ Nothing to remove")
+            return 0, messages
 
         # Write cleaned file (only if not dry-run)
         if not self.dry_run:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.writelines(new_lines)
-            print(f"   ✅ Removed {removed_count} keys")
+            self.create_backup(file_path)
+
+            pieces = []
+            pos = 0
+            for entry in entries:
+                if entry.key not in dead_keys:
+                    continue
+                start, end = self._removal_range(content, entry)
+                start = max(start, pos)
+                pieces.append(content[pos:start])
+                pos = end
+            pieces.append(content[pos:])
+
+            tmp_path = file_path.with_name(file_path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(b''.join(pieces))
+            os.replace(tmp_path, file_path)
+
+            messages.extend(f"   ❌ {key}" for key in removed_keys)
+            messages.append(f"   ✅ Removed {len(removed_keys)} keys")
         else:
-            print(f"   🔍 Would remove {removed_count} keys:")
+            messages.append(f"   🔍 Would remove {len(removed_keys)} keys:")
             for key in removed_keys[:5]:  # Show first 5
-                print(f"      - {key}")
+                messages.append(f"      - {key}")
             if len(removed_keys) > 5:
-                print(f"      ... and {len(removed_keys) - 5} more")
+                messages.append(f"      ... and {len(removed_keys) - 5} more")
 
-        return removed_count
+        return len(removed_keys), messages
 
     def run(self):
         """Main execution"""
@@ -138,8 +153,17 @@ class DeadKeyRemover:
         if self.dry_run:
             print("⚠️  DRY RUN MODE - No changes will be made\n")
 
-        # Load dead keys
-        dead_keys = self.load_dead_keys()
+        # A stale report is never used: analyze in-process instead
+        if self.analyzer is None:
+            dead_keys = self.load_dead_keys()
+            if dead_keys is None:
+                self.analyzer = self.analyze_in_process()
+        if self.analyzer is not None:
+            dead_keys = sorted(self.analyzer.dead_keys)
+
+        if not dead_keys:
+            print("✅ No dead keys found!")
+            return
 
         print(f"📊 Found {len(dead_keys)} dead keys\n")
 
@@ -151,18 +175,39 @@ class DeadKeyRemover:
             print(f"   ... and {len(dead_keys) - 10} more")
 
         # Find all .strings files
-        strings_files = self.find_strings_files()
+        if self.analyzer is not None:
+            strings_files = sorted(self.analyzer.localization_files)
+        else:
+            strings_files = self.find_strings_files()
 
         print(f"\n📁 Found {len(strings_files)} localization files:")
         for f in strings_files:
             print(f"   - {f.parent.name}/{f.name}")
 
-        # Remove dead keys from each file
+        if self.backup and not self.dry_run:
+            self.backup_run = BackupStore(Path('.')).begin('remove_dead_keys')
+
+        # Remove dead keys from every language at once
+        dead_key_set = set(dead_keys)
         total_removed = 0
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=len(strings_files)) as executor:
+            results = executor.map(
+                lambda file_path: self.remove_dead_keys_from_file(file_path, dead_key_set),
+                strings_files
+            )
+            for removed, messages in results:
+                print('\n'.join(messages))
+                total_removed += removed
+
+        if self.backup_run:
+            self.backup_run.save()
+        elapsed_ms = (time.perf_counter() - start) * 1000
 
-        for file_path in strings_files:
-            removed = self.remove_dead_keys_from_file(file_path, dead_keys)
-            total_removed += removed
+        # Keep the in-memory catalog and the report in step with the files
+        if self.analyzer is not None and total_removed and not self.dry_run:
+            self.analyzer.forget_dead_keys()
 
         # Summary
         print("\n" + "=" * 50)
@@ -171,12 +216,14 @@ class DeadKeyRemover:
             print("\n💡 Run without --dry-run to apply changes:")
             print("   python3 remove_dead_keys.py")
         else:
-            print(f"🎉 Successfully removed {total_removed} key occurrences!")
-            print(f"\n💡 Run analyzer again to verify:")
-            print("   python3 analyze_localization_v5.py")
-
-        if self.backup and not self.dry_run:
-            print(f"\n💾 Backups created in localization_backup_* directories")
+            print(f"🎉 Successfully removed {total_removed} key occurrences! ({elapsed_ms:.1f} ms)")
+            if self.analyzer is None:
+                print(f"\n💡 Run analyzer again to verify:")
+                print("   python3 analyze_localization_v5.py")
+
+        if self.backup_run:
+            print(f"\n💾 Backup: {self.backup_run.run_id} ({BackupStore.DIR_NAME}/)")
+            print(f"   To restore: python3 analyze_localization_v5.py --restore {self.backup_run.run_id}")
 
 
 def main():
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Localizable.strings Parser
+==========================
+
+Streaming tokenizer for Apple .strings files shared by the localization
+scripts. Entries are yielded one at a time with escape sequences decoded,
+so values like \\"Her Zaman\\" and empty values survive intact.
+
+Usage:
+    from strings_parser import read_strings
+
+    for entry in read_strings(Path('LifeStyles/Resources/tr.lproj/Localizable.strings')):
+        print(entry.key, entry.value, entry.comment, entry.span)
+
+    # Compare against the legacy regex on the tr/en files
+    python strings_parser.py --benchmark
+"""
+
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional, Tuple, Union
+
+
+class StringsEntry(NamedTuple):
+    """One "key" = "value"; entry"""
+    key: str
+    value: str
+    comment: Optional[str]       # Text of the comment right before the entry
+    span: Tuple[int, int]        # Byte offsets of `"key" = "value";`
+    value_span: Tuple[int, int]  # Byte offsets of the value's contents (inside the quotes)
+    comment_span: Optional[Tuple[int, int]] = None  # Byte offsets of that comment, delimiters included
+
+
+class StringsSyntaxError(ValueError):
+    """Malformed .strings content"""
+
+    def __init__(self, message: str, line: int):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+
+
+# Unrolled loops ([^"\\]*(?:\\.[^"\\]*)*) instead of per-character alternation
+# keep the tokenizer on par with the legacy single-line regex
+_QUOTED = rb'"([^"\\]*(?:\\.[^"\\]*)*)"'
+_BARE = rb'([A-Za-z0-9_.$:/-]+)'
+
+# Whitespace and comments between entries; the last comment is captured
+_TRIVIA = rb'\s*(?:(?:/\*([^*]*\*+(?:[^/*][^*]*\*+)*)/|//([^\n]*))\s*)*'
+_TRIVIA_RE = re.compile(_TRIVIA)
+
+# Leading trivia, then "key" = "value";  or the "key"; shorthand (value = key)
+_ENTRY_RE = re.compile(
+    _TRIVIA +
+    rb'(?:' + _QUOTED + rb'|' + _BARE + rb')\s*'
+    rb'(?:=\s*(?:' + _QUOTED + rb'|' + _BARE + rb')\s*)?;'
+)
+
+_ESCAPE_RE = re.compile(r'\\(?:U([0-9A-Fa-f]{4})|u([0-9A-Fa-f]{4})|([0-7]{1,3})|(.))', re.DOTALL)
+_SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'a': '\a', 'b': '\b', 'f': '\f', 'v': '\v'}
+
+
+def _unescape_match(match: re.Match) -> str:
+    upper, lower, octal, char = match.groups()
+    if upper or lower:
+        return chr(int(upper or lower, 16))
+    if octal:
+        return chr(int(octal, 8))
+    return _SIMPLE_ESCAPES.get(char, char)
+
+
+def unescape(raw: str) -> str:
+    """Decode .strings escape sequences"""
+    if '\\' not in raw:
+        return raw
+    return _ESCAPE_RE.sub(_unescape_match, raw)
+
+
+def escape(text: str) -> str:
+    """Encode text for use between quotes in a .strings file"""
+    return (
+        text.replace('\\', '\\\\')
+        .replace('"', '\\"')
+        .replace('\n', '\\n')
+        .replace('\t', '\\t')
+        .replace('\r', '\\r')
+    )
+
+
+def _to_utf8(data: Union[bytes, str]) -> bytes:
+    if isinstance(data, str):
+        return data.encode('utf-8')
+    if data.startswith((b'\xff\xfe', b'\xfe\xff')):
+        # Xcode may save .strings as UTF-16; spans then refer to the UTF-8 form
+        return data.decode('utf-16').encode('utf-8')
+    if data.startswith(b'\xef\xbb\xbf'):
+        return data[3:]
+    return data
+
+
+def parse_strings(data: Union[bytes, str]) -> Iterator[StringsEntry]:
+    """
+    Tokenize .strings content
+
+    Yields entries in file order. Raises StringsSyntaxError at the first
+    token that is neither whitespace, a comment nor a complete entry.
+    """
+    data = _to_utf8(data)
+    pos = 0
+    end = len(data)
+
+    while True:
+        match = _ENTRY_RE.match(data, pos)
+        if match is None:
+            trailing = _TRIVIA_RE.match(data, pos).end()
+            if trailing >= end:
+                return
+            line = data.count(b'\n', 0, trailing) + 1
+            if data.startswith(b'/*', trailing):
+                raise StringsSyntaxError('unterminated comment', line)
+            snippet = data[trailing:trailing + 20].decode('utf-8', errors='replace')
+            raise StringsSyntaxError(f"unexpected {snippet!r}", line)
+
+        block_comment, line_comment, quoted_key, bare_key, quoted_value, bare_value = match.groups()
+        if block_comment is not None:
+            comment = block_comment
+            comment_span = (match.start(1) - 2, match.end(1) + 1)
+        elif line_comment is not None:
+            comment = line_comment
+            comment_span = (match.start(2) - 2, match.end(2))
+        else:
+            comment = comment_span = None
+        if comment is not None:
+            comment = comment.decode('utf-8', errors='replace').rstrip('*').strip()
+
+        if quoted_key is not None:
+            key = unescape(quoted_key.decode('utf-8'))
+            key_group = 3
+        else:
+            key = bare_key.decode('utf-8')
+            key_group = 4
+        if quoted_value is not None:
+            value = unescape(quoted_value.decode('utf-8'))
+            value_span = match.span(5)
+        elif bare_value is not None:
+            value = bare_value.decode('utf-8')
+            value_span = match.span(6)
+        else:
+            value = key
+            value_span = match.span(key_group)
+
+        start = match.start(key_group) - (key_group == 3)
+        yield StringsEntry(key, value, comment, (start, match.end()), value_span, comment_span)
+        pos = match.end()
+
+
+def read_strings_bytes(path: Path) -> bytes:
+    """File content as the UTF-8 bytes that entry spans refer to"""
+    with open(path, 'rb') as f:
+        return _to_utf8(f.read())
+
+
+def read_strings(path: Path) -> Iterator[StringsEntry]:
+    """Tokenize a .strings file"""
+    return parse_strings(read_strings_bytes(path))
+
+
+def load_strings(path: Path) -> dict:
+    """Return {key: value} for a .strings file (later duplicates win, as in Foundation)"""
+    return {entry.key: entry.value for entry in read_strings(path)}
+
+
+def benchmark(paths):
+    """Compare the tokenizer with the legacy `[^"]+` regex"""
+    legacy_re = re.compile(r'^"([^"]+)"\s*=\s*"([^"]+)";', re.MULTILINE)
+
+    print("\n⏱️  .STRINGS PARSER BENCHMARK")
+    print("=" * 70)
+    for path in paths:
+        text = path.read_text(encoding='utf-8')
+        data = text.encode('utf-8')
+        lines = text.count('\n')
+
+        timings = {}
+        for label, parse in [
+            ('regex', lambda: legacy_re.findall(text)),
+            ('tokenizer', lambda: list(parse_strings(data))),
+        ]:
+            best = float('inf')
+            for _ in range(20):
+                start = time.perf_counter()
+                result = parse()
+                best = min(best, time.perf_counter() - start)
+            timings[label] = (best, result)
+
+        (regex_time, regex_entries), (token_time, token_entries) = timings['regex'], timings['tokenizer']
+        # Match entries on raw (still escaped) values, as the regex sees them
+        found = Counter(regex_entries)
+        missed = []
+        for entry in token_entries:
+            raw = (entry.key, data[entry.value_span[0]:entry.value_span[1]].decode('utf-8'))
+            if found[raw] > 0:
+                found[raw] -= 1
+            else:
+                missed.append(entry)
+
+        print(f"\n📄 {path} ({lines} satır)")
+        print(f"   regex:     {regex_time * 1000:7.2f} ms  {len(regex_entries)} entry")
+        print(f"   tokenizer: {token_time * 1000:7.2f} ms  {len(token_entries)} entry")
+        print(f"   Regex'in kaçırdığı / kestiği: {len(missed)}")
+        for entry in missed[:5]:
+            print(f"      {entry.key} = {entry.value!r}")
+    print("=" * 70)
+
+
+def main():
+    resources = Path('LifeStyles/Resources')
+    if '--benchmark' in sys.argv[1:]:
+        benchmark([resources / f'{lang}.lproj/Localizable.strings' for lang in ('tr', 'en')])
+        return
+
+    for arg in sys.argv[1:]:
+        try:
+            count = sum(1 for _ in read_strings(Path(arg)))
+        except StringsSyntaxError as e:
+            print(f"❌ {arg}: {e}")
+            continue
+        print(f"✓ {arg}: {count} key")
+
+
+if __name__ == '__main__':
+    main()
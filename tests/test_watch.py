@@ -0,0 +1,108 @@
+"""Watch mode backends: events reported for a real directory tree"""
+
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from analyze_localization_v5 import InotifyWatcher, PollingWatcher  # noqa: E402
+
+TIMEOUT = 5.0
+
+
+def make_watcher(backend, root: Path):
+    if backend == 'inotify':
+        if not InotifyWatcher.available():
+            pytest.skip('inotify not available')
+        return InotifyWatcher(root, {'build'})
+    return PollingWatcher(root, {'build'}, interval=0.05)
+
+
+class Recorder:
+    """Collects reported paths so a test can wait for the ones it expects"""
+
+    def __init__(self):
+        self.paths = set()
+        self._changed = threading.Condition()
+
+    def __call__(self, path):
+        with self._changed:
+            self.paths.add(str(path))
+            self._changed.notify_all()
+
+    def wait_for(self, *paths: Path) -> bool:
+        expected = {str(path) for path in paths}
+        deadline = time.monotonic() + TIMEOUT
+        with self._changed:
+            while not expected <= self.paths:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._changed.wait(remaining)
+        return True
+
+
+@pytest.fixture(params=['poll', 'inotify'])
+def watched(request, tmp_path):
+    root = tmp_path / 'project'
+    (root / 'Views').mkdir(parents=True)
+    (root / 'Views' / 'Home.swift').write_text('Text("Home")\n')
+    (root / 'en.lproj').mkdir()
+    (root / 'en.lproj' / 'Localizable.strings').write_text('"home" = "Home";\n')
+
+    watcher = make_watcher(request.param, root)
+    recorder = Recorder()
+    watcher.start(recorder)
+    yield root, recorder
+    watcher.stop()
+    watcher.join()
+
+
+def test_file_edit(watched):
+    root, recorder = watched
+    swift_file = root / 'Views' / 'Home.swift'
+    swift_file.write_text('Text("Home, sweet home")\n')
+    assert recorder.wait_for(swift_file)
+
+
+def test_strings_change(watched):
+    root, recorder = watched
+    strings_file = root / 'en.lproj' / 'Localizable.strings'
+    strings_file.write_text('"home" = "Home";\n"settings" = "Settings";\n')
+    assert recorder.wait_for(strings_file)
+
+
+def test_new_subdirectory(watched):
+    root, recorder = watched
+    new_dir = root / 'Views' / 'Profile'
+    new_dir.mkdir()
+    new_file = new_dir / 'Profile.swift'
+    new_file.write_text('Text("Profile")\n')
+    assert recorder.wait_for(new_file)
+
+    # Edits inside the new directory are seen once it is watched
+    new_file.write_text('Text("Your profile")\n')
+    assert recorder.wait_for(new_file)
+
+
+def test_directory_moved_away(watched, tmp_path):
+    root, recorder = watched
+    swift_file = root / 'Views' / 'Home.swift'
+    shutil.move(str(root / 'Views'), str(tmp_path / 'Archived'))
+    assert recorder.wait_for(swift_file)
+
+
+def test_excluded_directory_ignored(watched):
+    root, recorder = watched
+    build_dir = root / 'build'
+    build_dir.mkdir()
+    (build_dir / 'Generated.swift').write_text('Text("Generated")\n')
+    marker = root / 'Views' / 'Home.swift'
+    marker.write_text('Text("Home again")\n')
+    assert recorder.wait_for(marker)
+    assert not any(path.startswith(str(build_dir)) for path in recorder.paths)
@@ -2,11 +2,15 @@
 """
 Spanish Translation Updater - Phase 7
 Updates Spanish localization file with more translations
+
+Other languages / table files: python apply_translations.py LANG TABLE.tsv
 """
 
-import re
 from pathlib import Path
 
+from apply_translations import apply_translations, print_result
+from strings_parser import StringsSyntaxError
+
 # İspanyolca çeviriler - Phase 1 + Phase 2
 TRANSLATIONS = {
     # === PHASE 1: BASICS (64 keys) ===
@@ -1524,49 +1528,20 @@ def translate_file():
     print(f"📁 Dosya: {file_path}")
     print(f"📝 Çeviri sayısı: {len(TRANSLATIONS)}\n")
 
-    # Read file
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Track changes
-    updated_count = 0
-    not_found = []
-
-    # Replace translations
-    for key, translation in sorted(TRANSLATIONS.items()):
-        # Pattern: "key" = "old_value";
-        pattern = rf'^("{key}"\s*=\s*)"[^"]*";'
-        replacement = rf'\1"{translation}";'
-
-        # Check if key exists
-        if re.search(pattern, content, re.MULTILINE):
-            # Replace
-            new_content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
-
-            if new_content != content:
-                content = new_content
-                updated_count += 1
-                print(f"✅ {key}")
-        else:
-            not_found.append(key)
+    # One parse, one streaming rewrite, atomic replace
+    try:
+        result = apply_translations(file_path, TRANSLATIONS)
+    except StringsSyntaxError as e:
+        print(f"❌ {file_path}: {e}")
+        return
 
-    # Write updated file
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    updated_count = len(result.updated)
+    print_result(result, len(TRANSLATIONS))
 
     # Summary
-    print(f"\n{'='*60}")
-    print(f"🎉 Phase 2 Tamamlandı!")
-    print(f"✅ Güncellenen: {updated_count}/{len(TRANSLATIONS)}")
+    print(f"\n🎉 Phase 2 Tamamlandı!")
     print(f"📊 Başarı oranı: {updated_count/len(TRANSLATIONS)*100:.1f}%")
 
-    if not_found:
-        print(f"\n⚠️  Bulunamayan key'ler ({len(not_found)}):")
-        for key in not_found[:15]:
-            print(f"   - {key}")
-        if len(not_found) > 15:
-            print(f"   ... ve {len(not_found) - 15} key daha")
-
     print(f"\n💡 Sonraki adım:")
     print(f"   git add {file_path}")
     print(f"   git commit -m \"chore: İspanyolca çeviri Phase 2 - {updated_count} key\"")
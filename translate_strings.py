@@ -3,9 +3,16 @@
 """
 LifeStyles String Translator
 Türkçe → İngilizce otomatik çeviri
+
+Usage:
+    python translate_strings.py [path/to/Localizable.xcstrings] [--dry-run]
 """
 
-import json
+import sys
+import argparse
+from pathlib import Path
+
+from xcstrings import XCStringsCatalog
 
 # Çeviri haritası - Manuel olarak kontrol edilmiş çeviriler
 translations = {
@@ -218,7 +225,7 @@ translations = {
     "Dışarıdasınız": "You're Outside",
     "Önerilen Aktiviteler": "Suggested Activities",
     "Dışarı Çıkma Zamanı!": "Time to Go Out!",
-    "Seçtiğiniz tarihte konum kaydı bulunmuyor.\\nFarklı bir tarih seçmeyi deneyin.": "No location records found for the selected date.\\nTry selecting a different date.",
+    "Seçtiğiniz tarihte konum kaydı bulunmuyor.\nFarklı bir tarih seçmeyi deneyin.": "No location records found for the selected date.\nTry selecting a different date.",
     "Bu Tarihte Kayıt Yok": "No Records on This Date",
     "Doğruluk": "Accuracy",
     "Ay": "Month",
@@ -226,9 +233,9 @@ translations = {
     "%lld gün kaldı": "%lld days left",
     "%lld gün içinde": "in %lld days",
     "Rastgele": "Random",
-    "Konum geçmişinin arka planda da kaydedilebilmesi için \\"Her Zaman\\" izni vermeniz gerekiyor.\\n\\nAyarlar → LifeStyles → Konum → Her Zaman": "To record location history in the background, you need to grant \\"Always\\" permission.\\n\\nSettings → LifeStyles → Location → Always",
+    "Konum geçmişinin arka planda da kaydedilebilmesi için \"Her Zaman\" izni vermeniz gerekiyor.\n\nAyarlar → LifeStyles → Konum → Her Zaman": "To record location history in the background, you need to grant \"Always\" permission.\n\nSettings → LifeStyles → Location → Always",
     "Arka Plan Konum İzni Gerekli": "Background Location Permission Required",
-    "Konumunuz 15 dakikada bir kaydedilecek. \\"Her Zaman\\" izni gerekiyor.": "Your location will be recorded every 15 minutes. \\"Always\\" permission required.",
+    "Konumunuz 15 dakikada bir kaydedilecek. \"Her Zaman\" izni gerekiyor.": "Your location will be recorded every 15 minutes. \"Always\" permission required.",
     "Her 15 dakikada bir": "Every 15 minutes",
 
     # Settings
@@ -250,10 +257,10 @@ translations = {
     "İletişim": "Contact",
     "Konum": "Location",
     "Bildirimler": "Notifications",
-    "Lütfen \\"Her Zaman\\" seçeneğini işaretleyin": "Please select \\"Always\\" option",
+    "Lütfen \"Her Zaman\" seçeneğini işaretleyin": "Please select \"Always\" option",
     "Ayarlara Git": "Go to Settings",
     "Arka Plan Konum İzni": "Background Location Permission",
-    "LifeStyles, hayat kalitenizi artırmak için konumunuzu 15 dakikada bir kaydeder. Bunun arka planda da çalışabilmesi için:\\n\\nAyarlar → LifeStyles → Konum → \\"Her Zaman\\" seçeneğini işaretleyin": "LifeStyles records your location every 15 minutes to improve your quality of life. For this to work in the background:\\n\\nSettings → LifeStyles → Location → Select \\"Always\\" option",
+    "LifeStyles, hayat kalitenizi artırmak için konumunuzu 15 dakikada bir kaydeder. Bunun arka planda da çalışabilmesi için:\n\nAyarlar → LifeStyles → Konum → \"Her Zaman\" seçeneğini işaretleyin": "LifeStyles records your location every 15 minutes to improve your quality of life. For this to work in the background:\n\nSettings → LifeStyles → Location → Select \"Always\" option",
 
     # UI Components
     "Kaydet": "Save",
@@ -267,64 +274,50 @@ translations = {
     "Geçmiş": "History"
 }
 
-def load_json():
-    """JSON dosyasını yükle"""
-    with open('/Users/sezginpaksoy/Desktop/Claude-Code/LifeStyles/LifeStyles/Resources/Localizable.xcstrings', 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-def save_json(data):
-    """JSON dosyasını kaydet"""
-    with open('/Users/sezginpaksoy/Desktop/Claude-Code/LifeStyles/LifeStyles/Resources/Localizable.xcstrings', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-def add_translations(data, translations):
-    """Çevirileri JSON'a ekle"""
+def add_translations(catalog: XCStringsCatalog, translations) -> int:
+    """Çevirileri katalog'a ekle (değişiklikler save() ile tek seferde yazılır)"""
     updated_count = 0
 
     for tr_text, en_text in translations.items():
-        if tr_text in data['strings']:
-            # Eğer localizations yoksa veya boşsa ekle
-            if 'localizations' not in data['strings'][tr_text] or not data['strings'][tr_text].get('localizations'):
-                data['strings'][tr_text]['localizations'] = {
-                    'en': {
-                        'stringUnit': {
-                            'state': 'translated',
-                            'value': en_text
-                        }
-                    },
-                    'tr': {
-                        'stringUnit': {
-                            'state': 'translated',
-                            'value': tr_text
-                        }
-                    }
-                }
-                updated_count += 1
-            # Eğer sadece tr varsa en ekle
-            elif 'tr' in data['strings'][tr_text]['localizations'] and 'en' not in data['strings'][tr_text]['localizations']:
-                data['strings'][tr_text]['localizations']['en'] = {
-                    'stringUnit': {
-                        'state': 'translated',
-                        'value': en_text
-                    }
-                }
-                updated_count += 1
+        entry = catalog.get(tr_text)
+        if entry is None:
+            continue
+        localizations = entry.get('localizations')
+        # Eğer localizations yoksa veya boşsa ekle
+        if not localizations:
+            catalog.set_value(tr_text, 'en', en_text)
+            catalog.set_value(tr_text, 'tr', tr_text)
+            updated_count += 1
+        # Eğer sadece tr varsa en ekle
+        elif 'tr' in localizations and 'en' not in localizations:
+            catalog.set_value(tr_text, 'en', en_text)
+            updated_count += 1
 
-    return data, updated_count
+    return updated_count
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Türkçe → İngilizce xcstrings çevirisi')
+    parser.add_argument('catalog', nargs='?', type=Path,
+                        default=Path('LifeStyles/Resources/Localizable.xcstrings'),
+                        help='String catalog (.xcstrings) to update')
+    parser.add_argument('--dry-run', action='store_true', help='Only count the updates')
+    args = parser.parse_args()
+
     print("LifeStyles String Translator başlatılıyor...")
     print(f"Toplam {len(translations)} çeviri hazır")
 
-    # JSON'u yükle
-    data = load_json()
-    print(f"JSON dosyası yüklendi: {len(data['strings'])} string")
+    # Katalog'u indeksle
+    if not args.catalog.exists():
+        print(f"❌ Dosya bulunamadı: {args.catalog}")
+        sys.exit(1)
+    catalog = XCStringsCatalog.load(args.catalog)
+    print(f"Katalog yüklendi: {len(catalog)} string")
 
     # Çevirileri ekle
-    data, updated = add_translations(data, translations)
+    updated = add_translations(catalog, translations)
     print(f"{updated} string güncellendi")
 
-    # JSON'u kaydet
-    save_json(data)
-    print("JSON dosyası kaydedildi!")
+    # Sadece değişen entry'ler, Xcode formatında yazılır
+    if not args.dry_run and catalog.save():
+        print("Katalog kaydedildi!")
     print("✅ Çeviri tamamlandı!")
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Offline Translation Memory
+==========================
+
+Indexes the translations the project already has (every language of
+Localizable.strings plus any .xcstrings catalog, backups included) so new
+keys can be prefilled with a prior translation instead of a copy of the
+Turkish text.
+
+A unit is one key's values across languages. Lookups hit an exact map of
+normalized texts first, then a character 3-gram inverted index: units
+sharing the most grams are ranked by Dice coefficient and the best few
+are verified with SequenceMatcher.
+
+Usage:
+    from translation_memory import TranslationMemory
+
+    memory = TranslationMemory.from_resources(Path('LifeStyles/Resources'))
+    match = memory.lookup('Kaydet', 'tr', 'en')   # TMMatch(text='Save', score=1.0, ...)
+
+    python translation_memory.py "Ayarları Kaydet" --to en
+    python translation_memory.py --benchmark
+"""
+
+import re
+import time
+import argparse
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+from strings_parser import StringsSyntaxError, load_strings
+from xcstrings import XCStringsCatalog
+
+# Identifier-style keys ("button.save") are not source text
+_KEY_RE = re.compile(r'^[A-Za-z0-9_]+(?:[._-][A-Za-z0-9_]+)+$')
+_LETTER_RE = re.compile(r'[^\W\d_]')
+
+
+class TMMatch(NamedTuple):
+    """Best prior translation for a text"""
+    text: str             # Translation in the target language
+    score: float          # 1.0 for an exact match, SequenceMatcher ratio otherwise
+    source: str           # Source-language text it was translated from
+    key: Optional[str]    # Key of the unit it came from
+
+
+def normalize(text: str) -> str:
+    return ' '.join(text.casefold().split())
+
+
+def _grams(normalized: str) -> set:
+    padded = f' {normalized} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TranslationMemory:
+    """Exact map plus n-gram inverted index over aligned translation units"""
+
+    CANDIDATES = 5     # Fuzzy candidates verified with SequenceMatcher
+    MAX_POSTINGS = 2000  # Grams this common carry no signal and are skipped
+
+    def __init__(self, min_score: float = 0.85):
+        self.min_score = min_score
+        self.units = []   # [{lang: text}]
+        self.keys = []    # key of each unit
+        self.exact = defaultdict(list)                        # (lang, normalized) -> unit ids
+        self.postings = defaultdict(lambda: defaultdict(list))  # lang -> gram -> unit ids
+        self.gram_counts = []  # [{lang: number of grams}]
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def add(self, values: Dict[str, str], key: Optional[str] = None):
+        """Index one aligned unit ({lang: text}); placeholders equal to the key are dropped"""
+        values = {lang: text for lang, text in values.items() if text and text != key}
+        if len(values) < 2:
+            return
+        unit = len(self.units)
+        self.units.append(values)
+        self.keys.append(key)
+        counts = {}
+        for lang, text in values.items():
+            normalized = normalize(text)
+            self.exact[(lang, normalized)].append(unit)
+            grams = _grams(normalized)
+            counts[lang] = len(grams)
+            postings = self.postings[lang]
+            for gram in grams:
+                postings[gram].append(unit)
+        self.gram_counts.append(counts)
+
+    def add_keys(self, keys: Dict[str, Dict[str, Optional[str]]]):
+        """Index {key: {lang: value}} as loaded by the analyzer"""
+        for key, values in keys.items():
+            self.add({lang: value for lang, value in values.items() if value}, key)
+
+    def add_strings_files(self, files: Dict[str, Path]):
+        """Index Localizable.strings files given as {lang: path}"""
+        keys = defaultdict(dict)
+        for lang, path in files.items():
+            try:
+                for key, value in load_strings(path).items():
+                    keys[key][lang] = value
+            except (OSError, StringsSyntaxError):
+                continue
+        self.add_keys(keys)
+
+    def add_xcstrings(self, path: Path):
+        """Index every stringUnit of a string catalog"""
+        catalog = XCStringsCatalog.load(path)
+        source_language = catalog.source_language
+        for key, entry in catalog.entries.items():
+            values = {
+                lang: localization['stringUnit'].get('value')
+                for lang, localization in entry.get('localizations', {}).items()
+                if 'stringUnit' in localization
+            }
+            # Text-keyed catalogs: the key is the source-language string
+            if source_language and source_language not in values and not _KEY_RE.match(key):
+                values[source_language] = key
+            self.add(values, key)
+
+    @classmethod
+    def from_resources(
+        cls,
+        resources_dir: Path,
+        keys: Optional[Dict[str, Dict[str, Optional[str]]]] = None
+    ) -> 'TranslationMemory':
+        """
+        Memory for a Resources folder
+
+        Uses already loaded keys when given (the analyzer's catalog),
+        otherwise reads every *.lproj/Localizable.strings; string
+        catalogs (Localizable.xcstrings*, backups too) are always added.
+        """
+        memory = cls()
+        if keys is not None:
+            memory.add_keys(keys)
+        else:
+            memory.add_strings_files({
+                path.parent.name.replace('.lproj', ''): path
+                for path in sorted(resources_dir.glob('*.lproj/Localizable.strings'))
+            })
+        for path in sorted(resources_dir.glob('*.xcstrings*')):
+            try:
+                memory.add_xcstrings(path)
+            except (OSError, ValueError):
+                continue
+        return memory
+
+    def _translated(self, unit: int, source_lang: str, target_lang: str) -> Optional[str]:
+        """Target text of a unit, unless it is just an untranslated copy"""
+        values = self.units[unit]
+        target = values.get(target_lang)
+        if target is None:
+            return None
+        source = values.get(source_lang)
+        if source is not None and target == source and _LETTER_RE.search(source):
+            return None
+        return target
+
+    def lookup(self, text: str, source_lang: str, target_lang: str) -> Optional[TMMatch]:
+        """Best prior translation of text, or None below min_score"""
+        normalized = normalize(text)
+        if not normalized:
+            return None
+
+        # Exact: most common translation among identical source texts
+        votes = Counter()
+        first = {}
+        for unit in self.exact.get((source_lang, normalized), ()):
+            target = self._translated(unit, source_lang, target_lang)
+            if target is not None:
+                votes[target] += 1
+                first.setdefault(target, unit)
+        if votes:
+            target, _ = votes.most_common(1)[0]
+            unit = first[target]
+            return TMMatch(target, 1.0, self.units[unit][source_lang], self.keys[unit])
+
+        # Fuzzy: rank by shared grams (Dice), verify the best few
+        grams = _grams(normalized)
+        postings = self.postings.get(source_lang)
+        if not postings:
+            return None
+        shared = Counter()
+        for gram in grams:
+            units = postings.get(gram)
+            if units and len(units) <= self.MAX_POSTINGS:
+                shared.update(units)
+
+        # Most shared grams first, re-ranked by Dice; only the top few are verified
+        sizes = self.gram_counts
+        query_size = len(grams)
+        floor = self.min_score * 0.6
+        ranked = sorted(
+            ((2 * count / (query_size + sizes[unit][source_lang]), unit)
+             for unit, count in shared.most_common(self.CANDIDATES * 8)),
+            reverse=True
+        )
+
+        best = None
+        checked = 0
+        for dice, unit in ranked:
+            if checked >= self.CANDIDATES or dice < floor:
+                break
+            target = self._translated(unit, source_lang, target_lang)
+            if target is None:
+                continue
+            checked += 1
+            source = self.units[unit][source_lang]
+            matcher = SequenceMatcher(None, normalized, normalize(source), autojunk=False)
+            bar = best.score if best else self.min_score
+            if matcher.real_quick_ratio() < bar or matcher.quick_ratio() < bar:
+                continue
+            score = matcher.ratio()
+            if score >= self.min_score and (best is None or score > best.score):
+                best = TMMatch(target, round(score, 3), source, self.keys[unit])
+        return best
+
+
+def benchmark(resources_dir: Path):
+    """Build time and per-lookup latency for exact and fuzzy tr → en queries"""
+    start = time.perf_counter()
+    memory = TranslationMemory.from_resources(resources_dir)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    sources = sorted({unit['tr'] for unit in memory.units if 'tr' in unit and 'en' in unit})
+    queries = {
+        'exact': sources,
+        'fuzzy': [f'{text}!' if len(text) > 12 else f'{text}ler' for text in sources],
+    }
+
+    print(f"\n⏱️  TRANSLATION MEMORY BENCHMARK: {resources_dir}")
+    print("=" * 70)
+    print(f"   {len(memory)} birim, {build_ms:.0f} ms'de indekslendi")
+    for label, texts in queries.items():
+        start = time.perf_counter()
+        hits = sum(memory.lookup(text, 'tr', 'en') is not None for text in texts)
+        elapsed = time.perf_counter() - start
+        print(f"   {label:<6} {len(texts):>5} sorgu  {elapsed / len(texts) * 1e6:7.1f} µs/sorgu  {hits} eşleşme")
+    print("=" * 70)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Look up prior translations in the project')
+    parser.add_argument('text', nargs='?', help='Text to translate')
+    parser.add_argument('--from', dest='source_lang', default='tr', metavar='LANG')
+    parser.add_argument('--to', dest='target_lang', default='en', metavar='LANG')
+    parser.add_argument('--resources', type=Path, default=Path('LifeStyles/Resources'))
+    parser.add_argument('--benchmark', action='store_true', help='Time exact and fuzzy lookups')
+    args = parser.parse_args()
+
+    if args.benchmark or not args.text:
+        benchmark(args.resources)
+        return
+
+    memory = TranslationMemory.from_resources(args.resources)
+    match = memory.lookup(args.text, args.source_lang, args.target_lang)
+    if match is None:
+        print(f"❌ Çeviri belleğinde eşleşme yok: {args.text}")
+        return
+    print(f"✓ {match.text}  ({match.score:.2f}, \"{match.source}\" ← {match.key})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Xcode String Catalog Editor
+===========================
+
+Incremental editing of .xcstrings files. The catalog is indexed once
+(entry values plus their character spans); updates are batched and only
+the entries that changed are re-rendered and spliced back, in Xcode's own
+layout (`"key" : value`, two-space indent, `{\\n\\n}` for empty objects).
+Untouched entries keep their exact bytes, so diffs stay minimal.
+
+Usage:
+    from xcstrings import XCStringsCatalog
+
+    catalog = XCStringsCatalog.load(Path('LifeStyles/Resources/Localizable.xcstrings'))
+    catalog.set_value('button.save', 'en', 'Save')
+    catalog.save()
+
+    # json.load/json.dump vs incremental editing on the backup catalog
+    python xcstrings.py --benchmark
+"""
+
+import os
+import re
+import json
+import time
+import shutil
+import argparse
+from collections import Counter
+from json.decoder import JSONDecodeError, scanstring
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+BACKUP_CATALOG = Path('LifeStyles/Resources/Localizable.xcstrings.backup_before_migration_20251106_140211')
+
+_WS_RE = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+
+
+def _quote(text: str) -> str:
+    return json.dumps(text, ensure_ascii=False)
+
+
+def render(value: Any, indent: str = '') -> str:
+    """Serialize a JSON value the way Xcode writes string catalogs"""
+    if isinstance(value, dict):
+        if not value:
+            return '{\n\n' + indent + '}'
+        inner = indent + '  '
+        members = [f'{inner}{_quote(k)} : {render(v, inner)}' for k, v in value.items()]
+        return '{\n' + ',\n'.join(members) + '\n' + indent + '}'
+    if isinstance(value, list):
+        if not value:
+            return '[\n\n' + indent + ']'
+        inner = indent + '  '
+        items = [inner + render(v, inner) for v in value]
+        return '[\n' + ',\n'.join(items) + '\n' + indent + ']'
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _insert_sorted(mapping: Dict, key: str, value: Any) -> Dict:
+    """Copy of mapping with key placed before the first larger key (Xcode keeps members sorted)"""
+    if key in mapping:
+        mapping = dict(mapping)
+        mapping[key] = value
+        return mapping
+    result = {}
+    for existing, existing_value in mapping.items():
+        if key is not None and key < existing:
+            result[key] = value
+            key = None
+        result[existing] = existing_value
+    if key is not None:
+        result[key] = value
+    return result
+
+
+class XCStringsCatalog:
+    """String catalog with a span index and batched, spliced updates"""
+
+    def __init__(self, path: Path, text: str):
+        self.path = path
+        self._reset(text)
+
+    def _reset(self, text: str):
+        self.text = text
+        self.meta = {}           # sourceLanguage, version, ...
+        self.entries = {}        # key -> entry dict, in file order
+        self.spans = {}          # key -> (member start, value start, value end)
+        self.strings_span = None # (offset of '{', offset of '}') of the "strings" object
+        self.member_indent = '    '
+        self._dirty = set()
+        self._added = set()
+        self._index()
+
+    @classmethod
+    def load(cls, path: Path) -> 'XCStringsCatalog':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(path, f.read())
+
+    def _skip(self, pos: int) -> int:
+        return _WS_RE.match(self.text, pos).end()
+
+    def _expect(self, pos: int, char: str) -> int:
+        if self.text[pos:pos + 1] != char:
+            raise JSONDecodeError(f"Expecting {char!r}", self.text, pos)
+        return pos + 1
+
+    def _index(self):
+        """Walk the top-level object, decoding each catalog entry once"""
+        text = self.text
+        pos = self._expect(self._skip(0), '{')
+        while True:
+            pos = self._skip(pos)
+            if text.startswith('}', pos):
+                break
+            name, pos = scanstring(text, self._expect(pos, '"'))
+            pos = self._skip(self._expect(self._skip(pos), ':'))
+            if name == 'strings':
+                pos = self._index_strings(pos)
+            else:
+                self.meta[name], pos = _DECODER.raw_decode(text, pos)
+            pos = self._skip(pos)
+            if text.startswith(',', pos):
+                pos += 1
+
+    def _index_strings(self, pos: int) -> int:
+        text = self.text
+        open_pos = pos
+        pos = self._expect(pos, '{')
+        first = True
+        while True:
+            pos = self._skip(pos)
+            if text.startswith('}', pos):
+                self.strings_span = (open_pos, pos)
+                return pos + 1
+            member_start = pos
+            if first:
+                self.member_indent = text[text.rfind('\n', 0, pos) + 1:pos]
+                first = False
+            key, pos = scanstring(text, self._expect(pos, '"'))
+            pos = self._skip(self._expect(self._skip(pos), ':'))
+            value_start = pos
+            self.entries[key], pos = _DECODER.raw_decode(text, pos)
+            self.spans[key] = (member_start, value_start, pos)
+            pos = self._skip(pos)
+            if text.startswith(',', pos):
+                pos += 1
+
+    @property
+    def source_language(self) -> Optional[str]:
+        return self.meta.get('sourceLanguage')
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self.entries.get(key)
+
+    def value(self, key: str, lang: str) -> Optional[str]:
+        """stringUnit value of one localization, if present"""
+        unit = self.entries.get(key, {}).get('localizations', {}).get(lang, {}).get('stringUnit')
+        return unit.get('value') if unit else None
+
+    def set_entry(self, key: str, entry: Dict):
+        """Replace (or add) a whole catalog entry"""
+        if key not in self.entries:
+            self._added.add(key)
+        self.entries[key] = entry
+        self._dirty.add(key)
+
+    def set_value(self, key: str, lang: str, value: str, state: str = 'translated') -> bool:
+        """Set one localization's stringUnit; returns False if nothing changed"""
+        entry = self.entries.get(key, {})
+        localizations = entry.get('localizations', {})
+        unit = {'stringUnit': {'state': state, 'value': value}}
+        if localizations.get(lang) == unit:
+            return False
+        entry = _insert_sorted(entry, 'localizations', _insert_sorted(localizations, lang, unit))
+        self.set_entry(key, entry)
+        return True
+
+    @property
+    def pending(self) -> int:
+        """Entries changed since the last save"""
+        return len(self._dirty)
+
+    def _member(self, key: str) -> str:
+        return f'{self.member_indent}{_quote(key)} : {render(self.entries[key], self.member_indent)}'
+
+    def render(self) -> str:
+        """Catalog text with every pending change spliced in"""
+        if not self._dirty:
+            return self.text
+
+        edits = []  # (start, end, replacement)
+        for key in self._dirty - self._added:
+            _, value_start, value_end = self.spans[key]
+            edits.append((value_start, value_end, render(self.entries[key], self.member_indent)))
+
+        # New keys go before the first larger existing key, like Xcode's sorted output
+        added = sorted(self._added)
+        existing = [key for key in self.entries if key not in self._added]
+        if not existing:
+            open_pos, close_pos = self.strings_span
+            closing_indent = self.member_indent[:-2]
+            body = ',\n'.join(self._member(key) for key in added)
+            edits.append((open_pos, close_pos + 1, '{\n' + body + '\n' + closing_indent + '}'))
+        else:
+            inserts = {}
+            i = 0
+            for key in existing:
+                while i < len(added) and added[i] < key:
+                    inserts.setdefault(key, []).append(added[i])
+                    i += 1
+            for key, new_keys in inserts.items():
+                start = self.spans[key][0]
+                text = ''.join(self._member(k)[len(self.member_indent):] + ',\n' + self.member_indent for k in new_keys)
+                edits.append((start, start, text))
+            if i < len(added):
+                end = self.spans[existing[-1]][2]
+                edits.append((end, end, ''.join(',\n' + self._member(k) for k in added[i:])))
+
+        pieces = []
+        pos = 0
+        for start, end, replacement in sorted(edits, key=lambda edit: edit[:2]):
+            pieces.append(self.text[pos:start])
+            pieces.append(replacement)
+            pos = end
+        pieces.append(self.text[pos:])
+        return ''.join(pieces)
+
+    def save(self, path: Optional[Path] = None) -> bool:
+        """Write pending changes atomically; returns False if there were none"""
+        if not self._dirty and path is None:
+            return False
+        path = path or self.path
+        text = self.render()
+
+        tmp_path = path.with_name(f'.{path.name}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+
+        # Re-index so spans match the new text
+        self.path = path
+        self._reset(text)
+        return True
+
+
+def _changed_lines(old: str, new: str) -> int:
+    """Lines of new that don't appear in old (multiset difference)"""
+    return sum((Counter(new.split('\n')) - Counter(old.split('\n'))).values())
+
+
+def benchmark(path: Path, every: int = 10):
+    """Time json.load/json.dump against incremental editing for a batch of updates"""
+    text = path.read_text(encoding='utf-8')
+    print(f"\n⏱️  XCSTRINGS BENCHMARK: {path} ({text.count(chr(10)) + 1} satır)")
+    print("=" * 70)
+
+    # Update the English value of every Nth key, plus a couple of new keys
+    data = json.loads(text)
+    keys = list(data['strings'])
+    updates = {key: f"{data['strings'][key].get('localizations', {}).get('en', {}).get('stringUnit', {}).get('value', key)} ✓"
+               for key in keys[::every]}
+    updates['zz.benchmark.new'] = 'Benchmark'
+    print(f"   {len(updates)} güncelleme ({len(keys)} key)\n")
+
+    def full_rewrite():
+        data = json.loads(text)
+        for key, value in updates.items():
+            entry = data['strings'].setdefault(key, {})
+            entry.setdefault('localizations', {})['en'] = {'stringUnit': {'state': 'translated', 'value': value}}
+        return json.dumps(data, ensure_ascii=False, indent=2)
+
+    def incremental():
+        catalog = XCStringsCatalog(path, text)
+        for key, value in updates.items():
+            catalog.set_value(key, 'en', value)
+        return catalog.render()
+
+    results = {}
+    for label, edit in [('json.load + json.dump', full_rewrite), ('XCStringsCatalog', incremental)]:
+        best = float('inf')
+        for _ in range(5):
+            start = time.perf_counter()
+            output = edit()
+            best = min(best, time.perf_counter() - start)
+        results[label] = output
+        print(f"   {label:<22} {best * 1000:8.1f} ms  {_changed_lines(text, output):>6} değişen satır")
+
+    # Fidelity: re-rendering every entry must reproduce Xcode's bytes
+    catalog = XCStringsCatalog(path, text)
+    for key in catalog.entries:
+        catalog._dirty.add(key)
+    same = catalog.render() == text
+    print(f"\n   Tüm entry'ler yeniden yazıldığında dosya {'birebir aynı ✓' if same else 'FARKLI ✗'}")
+    print("=" * 70)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Xcode string catalog (.xcstrings) editor')
+    parser.add_argument('paths', nargs='*', type=Path, help='Catalogs to index and summarize')
+    parser.add_argument('--benchmark', nargs='?', const=BACKUP_CATALOG, type=Path, metavar='PATH',
+                        help=f'Compare json.dump rewriting with incremental edits (default: {BACKUP_CATALOG})')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+
+    for path in args.paths:
+        try:
+            catalog = XCStringsCatalog.load(path)
+        except (OSError, ValueError) as e:
+            print(f"❌ {path}: {e}")
+            continue
+        languages = Counter(lang for entry in catalog.entries.values() for lang in entry.get('localizations', {}))
+        summary = ', '.join(f'{lang}: {count}' for lang, count in sorted(languages.items()))
+        print(f"✓ {path}: {len(catalog)} key, kaynak dil {catalog.source_language} ({summary})")
+
+
+if __name__ == '__main__':
+    main()